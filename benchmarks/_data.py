@@ -0,0 +1,120 @@
+"""
+Synthetic API payloads shared by the benchmarks.
+"""
+
+from typing import Any, Dict
+
+
+def make_price(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"pri_{index:026d}",
+        "product_id": f"pro_{index:026d}",
+        "description": "Monthly plan",
+        "type": "standard",
+        "name": "Monthly",
+        "billing_cycle": {"frequency": 1, "interval": "month"},
+        "trial_period": None,
+        "tax_mode": "account_setting",
+        "unit_price": {"amount": str(1000 + index % 5000), "currency_code": "USD"},
+        "unit_price_overrides": [],
+        "quantity": {"minimum": 1, "maximum": 100},
+        "status": "active",
+        "custom_data": None,
+        "import_meta": None,
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "updated_at": "2024-01-01T00:00:00.000000Z",
+    }
+
+
+def make_product(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"pro_{index:026d}",
+        "name": "Pro plan",
+        "description": "Everything in Basic, and more",
+        "type": "standard",
+        "tax_category": "standard",
+        "image_url": None,
+        "custom_data": None,
+        "status": "active",
+        "import_meta": None,
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "updated_at": "2024-01-01T00:00:00.000000Z",
+    }
+
+
+def make_customer(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"ctm_{index:026d}",
+        "name": f"Customer {index}",
+        "email": f"customer{index}@example.com",
+        "marketing_consent": False,
+        "status": "active",
+        "custom_data": None,
+        "locale": "en",
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "updated_at": "2024-01-01T00:00:00.000000Z",
+        "import_meta": None,
+    }
+
+
+def make_subscription(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"sub_{index:026d}",
+        "status": "active",
+        "customer_id": f"ctm_{index:026d}",
+        "address_id": f"add_{index:026d}",
+        "business_id": None,
+        "currency_code": "USD",
+        "created_at": "2024-01-01T00:00:00.000000Z",
+        "updated_at": "2024-01-01T00:00:00.000000Z",
+        "started_at": "2024-01-01T00:00:00.000000Z",
+        "first_billed_at": "2024-01-01T00:00:00.000000Z",
+        "next_billed_at": "2024-02-01T00:00:00.000000Z",
+        "paused_at": None,
+        "canceled_at": None,
+        "discount": None,
+        "collection_mode": "automatic",
+        "billing_details": None,
+        "current_billing_period": {
+            "starts_at": "2024-01-01T00:00:00.000000Z",
+            "ends_at": "2024-02-01T00:00:00.000000Z",
+        },
+        "billing_cycle": {"frequency": 1, "interval": "month"},
+        "scheduled_change": None,
+        "management_urls": {
+            "update_payment_method": "https://example.com/update",
+            "cancel": "https://example.com/cancel",
+        },
+        "items": [
+            {
+                "status": "active",
+                "quantity": 1 + item,
+                "recurring": True,
+                "created_at": "2024-01-01T00:00:00.000000Z",
+                "updated_at": "2024-01-01T00:00:00.000000Z",
+                "previously_billed_at": None,
+                "next_billed_at": "2024-02-01T00:00:00.000000Z",
+                "trial_dates": None,
+                "price": make_price(index + item),
+                "product": make_product(index + item),
+            }
+            for item in range(2)
+        ],
+        "custom_data": None,
+        "import_meta": None,
+    }
+
+
+def make_page(make_item, count: int = 200, start: int = 0) -> Dict[str, Any]:
+    return {
+        "data": [make_item(start + index) for index in range(count)],
+        "meta": {
+            "request_id": "bench",
+            "pagination": {
+                "per_page": count,
+                "next": f"https://api.paddle.com/?after=x_{start + count}",
+                "has_more": False,
+                "estimated_total": count,
+            },
+        },
+    }
@@ -0,0 +1,67 @@
+"""
+Compare ways of listing 20,000 customers from the in-process fake Paddle API.
+
+Each request takes 20 ms and 2% of them fail with a 5xx, so the numbers show how each
+iteration scales with latency and how much retries cost, without any network.
+
+Run with ``python benchmarks/bench_fake_api.py`` from a development install.
+"""
+
+import asyncio
+import time
+
+from paddle.aio.client import AsyncClient
+from paddle.client import Client
+from paddle.testing import FakePaddleAPI
+from paddle.utils.retry import RetryPolicy
+
+CUSTOMERS = 20_000
+LATENCY = 0.02
+ERROR_RATE = 0.02
+
+RETRY_POLICY = RetryPolicy(max_retries=5, base_delay=0.01, max_delay=0.1)
+
+
+def sync_iter_all(api):
+    client = Client(api_key="fake-key", retry_policy=RETRY_POLICY, transport=api.transport())
+    return sum(1 for _ in client.with_response_mode("raw").customers.iter_all(per_page=200))
+
+
+async def async_iter(api, **kwargs):
+    client = AsyncClient(
+        api_key="fake-key", retry_policy=RETRY_POLICY, transport=api.async_transport()
+    )
+    customers = client.with_response_mode("raw").customers
+    if "shards" in kwargs:
+        iterator = customers.aiter_sharded(per_page=200, **kwargs)
+    else:
+        iterator = customers.aiter_all(per_page=200, **kwargs)
+
+    return sum([1 async for _ in iterator])
+
+
+def main():
+    api = FakePaddleAPI(latency=LATENCY, error_rate=ERROR_RATE, seed=1)
+    api.populate(customers=CUSTOMERS)
+
+    cases = {
+        "Client.iter_all": lambda: sync_iter_all(api),
+        "AsyncClient.aiter_all": lambda: asyncio.run(async_iter(api)),
+        "aiter_all, prefetch=2": lambda: asyncio.run(async_iter(api, prefetch=2)),
+        "aiter_sharded, 8 shards": lambda: asyncio.run(async_iter(api, shards=8)),
+        "aiter_sharded, 32 shards": lambda: asyncio.run(async_iter(api, shards=32)),
+    }
+    for name, case in cases.items():
+        api.reset_stats()
+        start = time.perf_counter()
+        count = case()
+        seconds = time.perf_counter() - start
+        failed = api.requests - api.responses[200]
+        print(
+            f"{name:<26} {seconds:6.2f} s  {count / seconds:9,.0f} customers/s  "
+            f"{api.requests:4} requests, {failed} retried"
+        )
+
+
+if __name__ == "__main__":
+    main()
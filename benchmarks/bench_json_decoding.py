@@ -0,0 +1,59 @@
+"""
+Compare ways of turning a 200-item subscription page into response models.
+
+Every case but the last validates every item of the page, like ``iter_all()`` does. The
+last one reads 10 items, where lazy validation pays off.
+
+Run with ``python benchmarks/bench_json_decoding.py`` from a development install.
+"""
+
+import json
+import timeit
+
+from _data import make_page, make_subscription
+
+from paddle.models.responses.base import eager_validation, parse_response
+from paddle.models.responses.subscriptions import SubscriptionListResponse
+from paddle.utils.decoders import get_json_decoder
+
+ROUNDS = 50
+
+
+def read_all(response):
+    return list(response.data)
+
+
+def validate_eagerly(content):
+    with eager_validation():
+        return parse_response(SubscriptionListResponse, content)
+
+
+def main():
+    content = json.dumps(make_page(make_subscription)).encode()
+
+    cases = {
+        "json.loads + lazy items": lambda: read_all(SubscriptionListResponse(json.loads(content))),
+    }
+    for name in ("orjson", "msgspec"):
+        try:
+            decode = get_json_decoder(name)
+        except ImportError:
+            continue
+        cases[f"{name} + lazy items"] = lambda decode=decode: read_all(
+            SubscriptionListResponse(decode(content))
+        )
+    cases["eager validate_json from bytes"] = lambda: read_all(validate_eagerly(content))
+    cases["lazy items, 10 read"] = lambda: parse_response(SubscriptionListResponse, content).data[
+        :10
+    ]
+
+    baseline = None
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=ROUNDS, repeat=5)) / ROUNDS
+        baseline = baseline or seconds
+        print(f"{name:<32} {seconds * 1000:8.2f} ms/page  {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Compare computing MRR over 1M subscriptions in pure Python and with ``paddle.analytics``.
+
+Pages of decoded JSON are reused from a small pool, so the benchmark measures the
+computation rather than building a million dicts. Validating response models is too slow
+to run on every subscription, so that case runs on the pool and is scaled up.
+
+Run with ``python benchmarks/bench_mrr.py`` from a development install with NumPy.
+"""
+
+import time
+
+from decimal import Decimal
+from itertools import cycle, islice
+
+from _data import make_subscription
+
+from paddle.analytics import SubscriptionArrays, compute_mrr
+from paddle.models.responses.subscriptions import SubscriptionData
+
+SUBSCRIPTIONS = 1_000_000
+PER_PAGE = 200
+POOL = 50
+
+CURRENCIES = ("USD", "EUR", "GBP")
+CYCLES = (
+    {"frequency": 1, "interval": "month"},
+    {"frequency": 1, "interval": "year"},
+    {"frequency": 3, "interval": "month"},
+    {"frequency": 2, "interval": "week"},
+)
+CANCEL = {"action": "cancel", "effective_at": "2024-02-01T00:00:00Z", "resume_at": None}
+MONTHS = {"day": Decimal(12) / 365, "week": Decimal(12) / 52, "month": 1, "year": 12}
+
+
+def make_pages():
+    pages = []
+    for page in range(POOL):
+        subscriptions = []
+        for index in range(page * PER_PAGE, (page + 1) * PER_PAGE):
+            subscription = make_subscription(index)
+            currency_code = CURRENCIES[index % len(CURRENCIES)]
+            subscription["currency_code"] = currency_code
+            subscription["billing_cycle"] = CYCLES[index % len(CYCLES)]
+            subscription["scheduled_change"] = CANCEL if index % 20 == 0 else None
+            for item in subscription["items"]:
+                item["price"]["unit_price"]["currency_code"] = currency_code
+                item["price"]["billing_cycle"] = subscription["billing_cycle"]
+            subscriptions.append(subscription)
+        pages.append(subscriptions)
+
+    return pages
+
+
+def iter_pages(pool):
+    return islice(cycle(pool), SUBSCRIPTIONS // PER_PAGE)
+
+
+def pure_python(pages):
+    """MRR in minor units by currency, item by item over decoded JSON."""
+    mrr = {}
+    at_risk = {}
+    for subscriptions in pages:
+        for subscription in subscriptions:
+            if subscription["status"] not in ("active", "past_due"):
+                continue
+            change = subscription["scheduled_change"]
+            for item in subscription["items"]:
+                if not item["recurring"] or item["status"] != "active":
+                    continue
+                price = item["price"]
+                billing_cycle = price["billing_cycle"] or subscription["billing_cycle"]
+                monthly = (
+                    Decimal(price["unit_price"]["amount"])
+                    * item["quantity"]
+                    / (MONTHS[billing_cycle["interval"]] * billing_cycle["frequency"])
+                )
+                currency_code = subscription["currency_code"]
+                mrr[currency_code] = mrr.get(currency_code, 0) + monthly
+                if change is not None and change["action"] == "cancel":
+                    at_risk[currency_code] = at_risk.get(currency_code, 0) + monthly
+
+    return mrr, at_risk
+
+
+def pure_python_models(pages):
+    """MRR in minor units by currency, item by item over response models."""
+    mrr = {}
+    for subscriptions in pages:
+        for subscription in map(SubscriptionData.model_validate, subscriptions):
+            if subscription.status not in ("active", "past_due"):
+                continue
+            for item in subscription.items:
+                if not item.recurring or item.status != "active":
+                    continue
+                billing_cycle = item.price.billing_cycle or subscription.billing_cycle
+                monthly = (
+                    Decimal(item.price.unit_price.amount)
+                    * item.quantity
+                    / (MONTHS[billing_cycle.interval] * billing_cycle.frequency)
+                )
+                currency_code = subscription.currency_code
+                mrr[currency_code] = mrr.get(currency_code, 0) + monthly
+
+    return mrr
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    pool = make_pages()
+
+    _, models_seconds = timed(pure_python_models, pool)
+    models_seconds *= SUBSCRIPTIONS / (POOL * PER_PAGE)
+    _, python_seconds = timed(pure_python, iter_pages(pool))
+    arrays, load_seconds = timed(SubscriptionArrays.from_pages, iter_pages(pool))
+    report, compute_seconds = timed(compute_mrr, arrays)
+
+    print(f"{SUBSCRIPTIONS:,} subscriptions, {arrays.item_amount.size:,} items")
+    print(f"{'Python over models (scaled up)':<36} {models_seconds:8.2f} s")
+    print(f"{'Python over raw JSON, Decimal':<36} {python_seconds:8.2f} s")
+    print(f"{'analytics, loading arrays':<36} {load_seconds:8.2f} s")
+    print(f"{'analytics, computing MRR':<36} {compute_seconds:8.3f} s")
+    for totals in report.currencies.values():
+        print(
+            f"{totals.currency_code}: MRR {totals.mrr / 100:,.2f}, "
+            f"at risk {totals.at_risk_mrr / 100:,.2f} ({totals.at_risk_subscriptions:,})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compare the overhead of validating the parameters of a call like ``customers.get``.
+
+Run with ``python benchmarks/bench_validate_params.py`` from a development install.
+"""
+
+import inspect
+import timeit
+
+from typing import Literal, Optional
+
+from pydantic import create_model
+
+from paddle.utils.decorators import validate_params
+
+ROUNDS = 20_000
+
+
+def get(customer_id: str, include: Optional[Literal["address"]] = None):
+    return customer_id
+
+
+Validator = create_model(
+    "Validator", customer_id=(str, ...), include=(Optional[Literal["address"]], None)
+)
+
+
+def per_call_validation(*args, **kwargs):
+    # Validation as done before validators were cached
+    param_names = list(inspect.signature(get).parameters.keys())
+    all_args = dict(zip(param_names, args))
+    all_args.update(kwargs)
+    Validator(**all_args)
+    return get(*args, **kwargs)
+
+
+def main():
+    cases = {
+        "per call model validation": per_call_validation,
+        "validate_params": validate_params(get),
+        "no validation": get,
+    }
+
+    baseline = None
+    for name, function in cases.items():
+        call = lambda function=function: function("ctm_123", include="address")  # noqa: E731
+        seconds = min(timeit.repeat(call, number=ROUNDS)) / ROUNDS
+        baseline = baseline or seconds
+        print(f"{name:<28} {seconds * 1e6:6.2f} us/call  {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
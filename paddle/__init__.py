@@ -1,4 +1,4 @@
 __version__ = "0.1.3"
 
-from .client import Client
+from .client import Client, ClientFactory
 from .environment import Environment
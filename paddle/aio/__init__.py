@@ -1,3 +1,3 @@
-__all__ = ["AsyncClient"]
+__all__ = ["AsyncClient", "AsyncClientFactory"]
 
-from .client import AsyncClient
+from .client import AsyncClient, AsyncClientFactory
@@ -1,12 +1,31 @@
+import time
 import httpx
 import asyncio
 
-from typing import Dict, Any, Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
 from paddle.client import BaseClient
 from paddle.environment import Environment
 from paddle.exceptions import create_paddle_error
-from paddle.utils import is_retryable_status_code, get_retry_delay
+from paddle.utils.decoders import JSONDecoder, JSON_DECODER, RESPONSE_MODE
+from paddle.utils.cache import MISSING, ResponseCache
+from paddle.utils.single_flight import AsyncSingleFlight, request_key
+from paddle.utils import (
+    is_retryable_status_code,
+    get_retry_delay,
+    parse_retry_after,
+    RetryPolicy,
+)
+
+if TYPE_CHECKING:
+    from paddle.extensions import Webhooks
+    from paddle.models.resources import (
+        AsyncCustomer,
+        AsyncPrice,
+        AsyncProduct,
+        AsyncSubscription,
+    )
 
 
 class AsyncClient(BaseClient):
@@ -16,8 +35,28 @@ class AsyncClient(BaseClient):
     Args:
         api_key: The API key for the Paddle API
         environment: The environment to use for the Paddle API
-        timeout: The timeout for the Paddle API
+        timeout: The timeout for the Paddle API, either in seconds or as an ``httpx.Timeout``
+            with separate connect/read/write/pool timeouts
         max_retries: The maximum number of retries for the Paddle API
+        rate_limit: Maximum number of requests per second, shared by all resources
+        rate_limit_burst: Maximum number of requests sent at once when rate limiting
+        retry_policy: Backoff, jitter and budget settings for retries, overrides max_retries
+        json_decoder: JSON decoder for responses, ``"json"``, ``"orjson"``, ``"msgspec"``,
+            ``"auto"`` for the fastest one installed, or a callable taking bytes
+        response_mode: How resources build responses, ``"model"`` validates them into typed
+            models, ``"construct"`` builds the models without validation and ``"raw"``
+            returns the decoded JSON
+        validate_params: Whether resources validate the parameters of each call, disable it
+            to save the validation overhead once the calling code is known to be correct
+        coalesce_requests: Whether identical GET requests made while one is in flight share
+            its response instead of being sent again
+        cache: Cache of GET responses, invalidated by the writes made through this client
+        limits: Connection pool limits (max connections, keep-alive connections and expiry)
+        http2: Whether to enable HTTP/2, requires the ``http2`` extra
+        transport: Custom transport for the underlying HTTP client
+        http_client: Pre-built HTTP client to use instead of creating one. It can be shared
+            with other clients, the API key is sent with each request and the HTTP client is
+            not closed when this client is closed
 
     Raises:
         PaddleAPIError: If the API key is invalid
@@ -27,19 +66,45 @@ class AsyncClient(BaseClient):
         self,
         api_key: str,
         environment: Union[Environment.PRODUCTION, Environment.SANDBOX] = Environment.SANDBOX,
-        timeout: int = 30,
+        timeout: Union[float, httpx.Timeout] = 30,
         max_retries: int = 3,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_decoder: Union[JSON_DECODER, JSONDecoder] = "auto",
+        response_mode: RESPONSE_MODE = "model",
+        validate_params: bool = True,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         super().__init__(
-            api_key=api_key, environment=environment, timeout=timeout, max_retries=max_retries
-        )
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers=self._get_headers(),
+            api_key=api_key,
+            environment=environment,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            retry_policy=retry_policy,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
+            validate_params=validate_params,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            limits=limits,
+            http2=http2,
         )
-        # Initialize extensions
-        self._init_extensions()
-
+        self._owns_client = http_client is None
+        if http_client is not None:
+            # Authenticate each request so the HTTP client can be shared between API keys
+            self._request_headers = self._get_headers()
+            self._client = http_client
+        else:
+            self._client = httpx.AsyncClient(transport=transport, **self._get_client_options())
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
         # Initialize resources
         self._init_resources()
 
@@ -48,24 +113,38 @@ class AsyncClient(BaseClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Close the HTTP client."""
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
-    def _init_extensions(self):
+    @cached_property
+    def webhooks(self) -> "Webhooks":
         from paddle.extensions import Webhooks
 
-        self.webhooks = self._add_extension(Webhooks)
+        return self._add_extension(Webhooks)
+
+    @cached_property
+    def products(self) -> "AsyncProduct":
+        from paddle.models.resources.products import AsyncProduct
+
+        return self._create_resource(AsyncProduct)
+
+    @cached_property
+    def prices(self) -> "AsyncPrice":
+        from paddle.models.resources.prices import AsyncPrice
+
+        return self._create_resource(AsyncPrice)
+
+    @cached_property
+    def customers(self) -> "AsyncCustomer":
+        from paddle.models.resources.customers import AsyncCustomer
 
-    def _init_resources(self):
-        """Initialize resources."""
-        from paddle.models.resources import AsyncProduct
-        from paddle.models.resources import AsyncPrice
-        from paddle.models.resources import AsyncCustomer
-        from paddle.models.resources import AsyncSubscription
+        return self._create_resource(AsyncCustomer)
 
-        self.products = self._create_resource(AsyncProduct)
-        self.prices = self._create_resource(AsyncPrice)
-        self.customers = self._create_resource(AsyncCustomer)
-        self.subscriptions = self._create_resource(AsyncSubscription)
+    @cached_property
+    def subscriptions(self) -> "AsyncSubscription":
+        from paddle.models.resources.subscriptions import AsyncSubscription
+
+        return self._create_resource(AsyncSubscription)
 
     async def _request(
         self,
@@ -74,53 +153,120 @@ class AsyncClient(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         retry_on_error: bool = True,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Make an asynchronous HTTP request.
 
+        With ``coalesce_requests`` enabled, a GET identical to one in flight waits for it
+        and returns its response. With a ``cache``, GET responses are returned from it while
+        fresh, and other requests invalidate the responses they may change.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             params: Query parameters
             json: JSON body for POST/PUT requests
             retry_on_error: Whether to retry on retryable errors
+            raw: Whether to return the raw response body instead of the decoded JSON
 
         Returns:
-            JSON response from the API
+            JSON response from the API, or the raw response body if ``raw`` is set
 
         Raises:
             PaddleAPIError: If the API request fails
         """
+        if method != "GET" or json is not None:
+            try:
+                return await self._send_request(method, path, params, json, retry_on_error, raw)
+            finally:
+                if self.cache is not None:
+                    # Failed writes may still have been applied
+                    self.cache.invalidate_path(path)
+
+        cache = self.cache if self.cache is not None and self.cache.is_cached(path) else None
+        if cache is not None:
+            cache_key = request_key(method, path, params, raw, self.api_key)
+            response = cache.get(cache_key)
+            if response is not MISSING:
+                return response
+            generation = cache.generation
+
+        if self._single_flight is not None:
+            response = await self._single_flight.do(
+                request_key(method, path, params, retry_on_error, raw),
+                lambda: self._send_request(method, path, params, json, retry_on_error, raw),
+            )
+        else:
+            response = await self._send_request(method, path, params, json, retry_on_error, raw)
+
+        if cache is not None:
+            cache.set(cache_key, response, path, generation)
+
+        return response
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        retry_on_error: bool,
+        raw: bool,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Send a request, retrying it according to the retry policy."""
         url = self._build_url(path)
         retries = 0
+        retry_delay = None
+        started_at = time.monotonic()
+        self.retry_policy.record_request()
 
         while True:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+
             try:
                 response = await self._client.request(
                     method=method,
                     url=url,
                     params=params,
                     json=json,
+                    headers=self._request_headers,
                 )
 
                 if response.is_success:
+                    if self.rate_limiter:
+                        self.rate_limiter.on_success()
+
+                    if raw:
+                        return response.content
+
                     try:
-                        return response.json()
-                    except ValueError as e:  # httpx uses ValueError for JSON decode errors
+                        return self.json_decoder(response.content)
+                    except ValueError as e:  # every JSON decoder raises a ValueError
                         raise create_paddle_error(
                             status_code=response.status_code,
                             message="Invalid JSON response",
                         ) from e
 
-                # Handle error response
-                if retry_on_error and retries < self.max_retries:
-                    status_code = response.status_code
+                status_code = response.status_code
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                rate_limited = status_code == 429 and self.rate_limiter is not None
+                if rate_limited:
+                    self.rate_limiter.on_rate_limited(
+                        get_retry_delay(status_code, response.headers.get("Retry-After"))
+                    )
 
-                    if is_retryable_status_code(status_code):
-                        retry_delay = get_retry_delay(
-                            status_code, response.headers.get("Retry-After")
-                        )
-                        await asyncio.sleep(retry_delay)
+                # Handle error response
+                if retry_on_error and is_retryable_status_code(status_code):
+                    retry_delay = self._next_retry_delay(
+                        retries, started_at, retry_delay, retry_after
+                    )
+                    if retry_delay is not None:
+                        # The rate limiter already holds back every request until the
+                        # Retry-After delay has passed, so don't sleep on top of it.
+                        if not rate_limited:
+                            await asyncio.sleep(retry_delay)
                         retries += 1
                         continue
 
@@ -132,8 +278,100 @@ class AsyncClient(BaseClient):
 
             except httpx.RequestError as e:
                 # Handle network errors
-                if retry_on_error and retries < self.max_retries:
-                    await asyncio.sleep(1.0)  # Simple exponential backoff
-                    retries += 1
-                    continue
+                if retry_on_error:
+                    retry_delay = self._next_retry_delay(retries, started_at, retry_delay)
+                    if retry_delay is not None:
+                        await asyncio.sleep(retry_delay)
+                        retries += 1
+                        continue
                 raise create_paddle_error(500, str(e)) from e
+
+
+class AsyncClientFactory:
+    """
+    Creates asynchronous clients for many API keys on top of one shared connection pool.
+
+    Clients returned by the factory send their API key with each request instead of
+    owning an HTTP client, so thousands of tenants reuse the same connections and TLS
+    sessions.
+
+    Args:
+        environment: The environment to use for the Paddle API
+        timeout: The timeout for the Paddle API, either in seconds or as an ``httpx.Timeout``
+        limits: Connection pool limits of the shared HTTP client
+        http2: Whether to enable HTTP/2, requires the ``http2`` extra
+        transport: Custom transport for the shared HTTP client
+        **client_options: Options passed to every created client, such as ``max_retries``
+            or ``rate_limit``
+
+    Examples:
+        >>> async with AsyncClientFactory(environment=Environment.PRODUCTION) as factory:
+        ...     client = factory.get("merchant_api_key")
+        ...     await client.products.list()
+    """
+
+    def __init__(
+        self,
+        *,
+        environment: Union[Environment.PRODUCTION, Environment.SANDBOX] = Environment.SANDBOX,
+        timeout: Union[float, httpx.Timeout] = 30,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **client_options: Any,
+    ):
+        self.environment = environment
+        self.timeout = timeout
+        self._client_options = client_options
+        self._http_client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            http2=http2,
+            transport=transport,
+            **({"limits": limits} if limits is not None else {}),
+        )
+        self._clients: Dict[str, AsyncClient] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP client."""
+        await self.aclose()
+
+    def get(self, api_key: str) -> AsyncClient:
+        """
+        Get the client for an API key, creating it on first use.
+
+        Parameters:
+            api_key: The API key for the Paddle API
+
+        Returns:
+            A client sharing the factory's connection pool
+        """
+        client = self._clients.get(api_key)
+        if client is None:
+            client = AsyncClient(
+                api_key=api_key,
+                environment=self.environment,
+                timeout=self.timeout,
+                http_client=self._http_client,
+                **self._client_options,
+            )
+            self._clients[api_key] = client
+
+        return client
+
+    def remove(self, api_key: str) -> None:
+        """
+        Forget the client for an API key.
+
+        Parameters:
+            api_key: The API key for the Paddle API
+        """
+        self._clients.pop(api_key, None)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and forget every created client."""
+        self._clients.clear()
+        await self._http_client.aclose()
@@ -0,0 +1,275 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from pydantic import BaseModel
+
+# Subscription statuses counted in MRR: billed, or billed but waiting for a payment to succeed
+MRR_STATUSES = ("active", "past_due")
+
+# Billing intervals, and the number of months in one interval as a fraction
+INTERVALS = ("day", "week", "month", "year")
+_MONTHS_PER_INTERVAL = {"day": (365, 12), "week": (52, 12), "month": (1, 1), "year": (1, 12)}
+_INTERVAL_CODES = {interval: code for code, interval in enumerate(INTERVALS)}
+
+
+@dataclass
+class SubscriptionArrays:
+    """
+    Subscriptions and their recurring items as NumPy arrays.
+
+    Subscription arrays have one element per subscription and item arrays one element per
+    recurring item, linked by ``item_subscription``. Amounts are integers in the lowest
+    denomination of their currency, as returned by Paddle, e.g. cents for USD.
+
+    Build it from list pages with :meth:`from_pages`.
+    """
+
+    currency_codes: List[str]
+    """Currencies of the subscriptions and items, indexed by the currency arrays"""
+
+    subscription_ids: List[str]
+    subscription_currency: np.ndarray
+    """Index of the currency of each subscription in ``currency_codes``"""
+    subscription_at_risk: np.ndarray
+    """Whether each subscription has a scheduled cancellation"""
+
+    item_subscription: np.ndarray
+    """Index of the subscription of each item"""
+    item_currency: np.ndarray
+    """Index of the currency of the unit price of each item in ``currency_codes``"""
+    item_amount: np.ndarray
+    """Unit price of each item, in the lowest denomination of its currency"""
+    item_quantity: np.ndarray
+    item_frequency: np.ndarray
+    item_interval: np.ndarray
+    """Index of the billing interval of each item in ``INTERVALS``"""
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[Any], statuses: Iterable[str] = MRR_STATUSES
+    ) -> "SubscriptionArrays":
+        """
+        Load subscriptions from pages of ``subscriptions.list``.
+
+        Only the active recurring items are kept. Their unit price is the price's unit
+        price override in the currency of the subscription if there is one, and the
+        price's unit price otherwise. The billing cycle is the price's, or the
+        subscription's for prices without one.
+
+        Args:
+            pages: List responses, or lists of subscriptions. Both the decoded JSON of the
+                ``"raw"`` response mode, which is the fastest, and response models work.
+            statuses: Statuses of the subscriptions to load
+
+        Returns:
+            The arrays of the subscriptions with one of the statuses
+        """
+        statuses = frozenset(statuses)
+        subscription_ids: List[str] = []
+        subscription_currencies: List[str] = []
+        subscription_at_risk: List[bool] = []
+        items: List[Tuple[int, str, str, int, int, str]] = []
+        add_item = items.append
+
+        # Values are only collected here, and converted to arrays column by column below
+        for subscriptions in _iter_pages(pages):
+            for subscription in subscriptions:
+                if subscription["status"] not in statuses:
+                    continue
+
+                index = len(subscription_ids)
+                currency_code = subscription["currency_code"]
+                billing_cycle = subscription["billing_cycle"]
+                change = subscription.get("scheduled_change")
+                subscription_ids.append(subscription["id"])
+                subscription_currencies.append(currency_code)
+                subscription_at_risk.append(change is not None and change["action"] == "cancel")
+
+                for item in subscription["items"]:
+                    if not item["recurring"] or item["status"] != "active":
+                        continue
+
+                    price = item["price"]
+                    unit_price = price["unit_price"]
+                    if unit_price["currency_code"] != currency_code:
+                        unit_price = _get_unit_price(price, currency_code)
+                    cycle = price.get("billing_cycle") or billing_cycle
+                    add_item(
+                        (
+                            index,
+                            unit_price["currency_code"],
+                            unit_price["amount"],
+                            item["quantity"],
+                            cycle["frequency"],
+                            cycle["interval"],
+                        )
+                    )
+
+        count = len(items)
+        columns = list(zip(*items)) if items else [()] * 6
+        currencies: Dict[str, int] = {}
+        subscription_currency = _to_codes(subscription_currencies, currencies)
+        item_currency = _to_codes(columns[1], currencies)
+
+        return cls(
+            currency_codes=list(currencies),
+            subscription_ids=subscription_ids,
+            subscription_currency=subscription_currency,
+            subscription_at_risk=np.array(subscription_at_risk, dtype=np.bool_),
+            item_subscription=np.array(columns[0], dtype=np.int64),
+            item_currency=item_currency,
+            item_amount=np.fromiter(map(int, columns[2]), np.int64, count),
+            item_quantity=np.array(columns[3], dtype=np.int64),
+            item_frequency=np.array(columns[4], dtype=np.int64),
+            item_interval=np.fromiter(map(_INTERVAL_CODES.__getitem__, columns[5]), np.int8, count),
+        )
+
+    def monthly_amounts(self) -> np.ndarray:
+        """
+        Get the monthly recurring amount of each item.
+
+        A year counts 12 months, 52 weeks or 365 days. Amounts are divided by the billing
+        frequency, and rounded half up to the lowest denomination of their currency.
+
+        Returns:
+            The int64 monthly amount of each item
+        """
+        numerators = np.array([_MONTHS_PER_INTERVAL[name][0] for name in INTERVALS])
+        denominators = np.array([_MONTHS_PER_INTERVAL[name][1] for name in INTERVALS])
+        numerator = self.item_amount * self.item_quantity * numerators[self.item_interval]
+        denominator = denominators[self.item_interval] * self.item_frequency
+
+        return (2 * numerator + denominator) // (2 * denominator)
+
+
+@dataclass
+class CurrencyTotals:
+    """Recurring revenue of the subscriptions in one currency, in its lowest denomination."""
+
+    currency_code: str
+    subscriptions: int = 0
+    mrr: int = 0
+    at_risk_subscriptions: int = 0
+    """Subscriptions with a scheduled cancellation"""
+    at_risk_mrr: int = 0
+    """MRR of the subscriptions with a scheduled cancellation"""
+
+    @property
+    def arr(self) -> int:
+        """Annual recurring revenue, 12 times the MRR."""
+        return 12 * self.mrr
+
+    @property
+    def at_risk_arr(self) -> int:
+        """Annual recurring revenue of the subscriptions with a scheduled cancellation."""
+        return 12 * self.at_risk_mrr
+
+
+@dataclass
+class MRRReport:
+    """Recurring revenue of subscriptions, by currency."""
+
+    currencies: Dict[str, CurrencyTotals] = field(default_factory=dict)
+
+    def __getitem__(self, currency_code: str) -> CurrencyTotals:
+        return self.currencies[currency_code]
+
+    @property
+    def subscriptions(self) -> int:
+        """Number of subscriptions, in every currency."""
+        return sum(totals.subscriptions for totals in self.currencies.values())
+
+    @property
+    def at_risk_subscriptions(self) -> int:
+        """Number of subscriptions with a scheduled cancellation, in every currency."""
+        return sum(totals.at_risk_subscriptions for totals in self.currencies.values())
+
+
+def compute_mrr(subscriptions: Union[SubscriptionArrays, Iterable[Any]]) -> MRRReport:
+    """
+    Compute the MRR, ARR and churn at risk of subscriptions, by currency.
+
+    The MRR of a subscription is the sum of the monthly amounts of its active recurring
+    items, see :meth:`SubscriptionArrays.monthly_amounts`. Discounts, taxes and one-time
+    charges aren't taken into account. Subscriptions at risk of churning are those with a
+    scheduled cancellation.
+
+    Amounts are summed as integers in the lowest denomination of each currency, never
+    converted between currencies.
+
+    Args:
+        subscriptions: Pages of ``subscriptions.list``, see
+            :meth:`SubscriptionArrays.from_pages`, or the arrays loaded from them
+
+    Returns:
+        The totals of each currency
+
+    Examples:
+        >>> subscriptions = client.with_response_mode("raw").subscriptions
+        >>> pages = iter_pages(lambda after: subscriptions.list(per_page=200, after=after), None)
+        >>> report = compute_mrr(items for items, _ in pages)
+        >>> report["USD"].mrr, report["USD"].at_risk_mrr
+        (1250000, 30000)
+    """
+    if not isinstance(subscriptions, SubscriptionArrays):
+        subscriptions = SubscriptionArrays.from_pages(subscriptions)
+    arrays = subscriptions
+
+    count = len(arrays.currency_codes)
+    monthly = arrays.monthly_amounts()
+    item_at_risk = arrays.subscription_at_risk[arrays.item_subscription]
+
+    # np.add.at keeps the sums exact in int64, unlike np.bincount which sums floats
+    mrr = np.zeros(count, dtype=np.int64)
+    np.add.at(mrr, arrays.item_currency, monthly)
+    at_risk_mrr = np.zeros(count, dtype=np.int64)
+    np.add.at(at_risk_mrr, arrays.item_currency[item_at_risk], monthly[item_at_risk])
+    subscriptions_count = np.bincount(arrays.subscription_currency, minlength=count)
+    at_risk_count = np.bincount(
+        arrays.subscription_currency[arrays.subscription_at_risk], minlength=count
+    )
+
+    return MRRReport(
+        currencies={
+            currency_code: CurrencyTotals(
+                currency_code=currency_code,
+                subscriptions=int(subscriptions_count[index]),
+                mrr=int(mrr[index]),
+                at_risk_subscriptions=int(at_risk_count[index]),
+                at_risk_mrr=int(at_risk_mrr[index]),
+            )
+            for index, currency_code in enumerate(arrays.currency_codes)
+        }
+    )
+
+
+def _iter_pages(pages: Iterable[Any]) -> Iterator[Sequence[Dict[str, Any]]]:
+    """Iterate over the subscriptions of list responses, as decoded JSON."""
+    for page in pages:
+        if isinstance(page, dict):
+            page = page["data"]
+        elif hasattr(page, "data"):
+            page = page.data
+        if page and isinstance(page[0], BaseModel):
+            page = [subscription.model_dump() for subscription in page]
+        yield page
+
+
+def _to_codes(values: Sequence[str], codes: Dict[str, int]) -> np.ndarray:
+    """Replace values by their index in ``codes``, adding the new ones to it."""
+    return np.fromiter(
+        (codes.setdefault(value, len(codes)) for value in values), np.int32, len(values)
+    )
+
+
+def _get_unit_price(price: Dict[str, Any], currency_code: str) -> Dict[str, Any]:
+    """Get the unit price of a price in a currency, if it has one."""
+    unit_price = price["unit_price"]
+    if unit_price["currency_code"] != currency_code:
+        for override in price.get("unit_price_overrides") or ():
+            if override["unit_price"]["currency_code"] == currency_code:
+                return override["unit_price"]
+
+    return unit_price
@@ -1,32 +1,107 @@
+import copy
 import time
+import threading
 
 import httpx
 
-from typing import Dict, Any, Optional, Type, TypeVar, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, Optional, Type, TypeVar, Union
 
 from .environment import Environment
 
 from .exceptions import create_paddle_error
-from .utils import is_retryable_status_code, get_retry_delay
+from .utils.decoders import (
+    get_json_decoder,
+    JSONDecoder,
+    JSON_DECODER,
+    RESPONSE_MODE,
+    RESPONSE_MODES,
+)
+from .utils.cache import MISSING, ResponseCache
+from .utils.single_flight import SingleFlight, request_key
+from .utils import (
+    is_retryable_status_code,
+    get_retry_delay,
+    parse_retry_after,
+    RateLimiter,
+    RetryPolicy,
+)
+
+if TYPE_CHECKING:
+    from .extensions import Webhooks
+    from .models.resources import Customer, Price, Product, Subscription
 
 T = TypeVar("T")
+C = TypeVar("C", bound="BaseClient")
 
 
 class BaseClient:
     """Base client for Paddle API interactions."""
 
+    # Resources and extensions are created on first access, see _init_resources
+    _resource_names = ("products", "prices", "customers", "subscriptions")
+    _extension_names = ("webhooks",)
+
     def __init__(
         self,
         *,
         api_key: str,
         environment: Union[Environment.PRODUCTION, Environment.SANDBOX] = Environment.SANDBOX,
-        timeout: int = 30,
+        timeout: Union[float, httpx.Timeout] = 30,
         max_retries: int = 3,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_decoder: Union[JSON_DECODER, JSONDecoder] = "auto",
+        response_mode: RESPONSE_MODE = "model",
+        validate_params: bool = True,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ):
         self.api_key = api_key
         self.base_url = environment.base_url.rstrip("/")
         self.timeout = timeout
-        self.max_retries = max_retries
+        self.limits = limits
+        self.http2 = http2
+        self._request_headers: Optional[Dict[str, str]] = None
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.rate_limiter = RateLimiter(rate_limit, rate_limit_burst) if rate_limit else None
+        self.json_decoder = get_json_decoder(json_decoder)
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"Unknown response mode: {response_mode}")
+        self.response_mode = response_mode
+        self.validate_params = validate_params
+        self.coalesce_requests = coalesce_requests
+        self.cache = cache
+
+    def with_response_mode(self: C, response_mode: RESPONSE_MODE) -> C:
+        """
+        Get a copy of the client building responses in another mode.
+
+        The copy shares the HTTP client, rate limiter and retry policy of this client, so
+        it is cheap to create for a single call or job.
+
+        Parameters:
+            response_mode: ``"model"``, ``"construct"`` or ``"raw"``
+
+        Returns:
+            A client whose resources use the given response mode
+
+        Examples:
+            >>> raw_client = client.with_response_mode("raw")
+            >>> raw_client.subscriptions.list(per_page=200)["data"]
+        """
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"Unknown response mode: {response_mode}")
+
+        client = copy.copy(self)
+        client.response_mode = response_mode
+        client._owns_client = False
+        client._init_resources()
+        return client
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -36,10 +111,56 @@ class BaseClient:
         }
         return headers
 
+    def _get_client_options(self) -> Dict[str, Any]:
+        """Get options for creating the underlying HTTP client."""
+        options = {
+            "timeout": self.timeout,
+            "headers": self._get_headers(),
+            "http2": self.http2,
+        }
+        if self.limits is not None:
+            options["limits"] = self.limits
+
+        return options
+
     def _build_url(self, path: str) -> str:
         """Build full URL for API endpoint."""
         return f"{self.base_url}/{path.lstrip('/')}"
 
+    def _next_retry_delay(
+        self,
+        retries: int,
+        started_at: float,
+        previous_delay: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Get the delay before retrying a request from the retry policy.
+
+        Parameters:
+            retries: Number of retries already made for the request
+            started_at: Monotonic time of the first attempt
+            previous_delay: The delay used before the previous retry
+            retry_after: Delay requested by the API through the Retry-After header
+
+        Returns:
+            The delay in seconds, or None if the request should not be retried
+        """
+        return self.retry_policy.get_retry_delay(
+            retries, time.monotonic() - started_at, previous_delay, retry_after
+        )
+
+    def _init_resources(self):
+        """
+        Initialize resources.
+
+        Resources and extensions are cached properties created on first access, so a client
+        only imports and builds the ones it uses. Resetting them makes copies of a client
+        create their own, bound to the copy.
+        """
+        for name in self._resource_names + self._extension_names:
+            self.__dict__.pop(name, None)
+
     def _create_resource(self, resource_class: Type[T]) -> T:
         """
         Create a resource instance.
@@ -63,9 +184,9 @@ class BaseClient:
             extension_class: The extension class to add
 
         Returns:
-            An instance of the extension class
+            An instance of the extension class, given this client
         """
-        return extension_class()
+        return extension_class(self)
 
 
 class Client(BaseClient):
@@ -75,8 +196,28 @@ class Client(BaseClient):
     Args:
         api_key: The API key for the Paddle API
         environment: The environment to use for the Paddle API
-        timeout: The timeout for the Paddle API
+        timeout: The timeout for the Paddle API, either in seconds or as an ``httpx.Timeout``
+            with separate connect/read/write/pool timeouts
         max_retries: The maximum number of retries for the Paddle API
+        rate_limit: Maximum number of requests per second, shared by all resources
+        rate_limit_burst: Maximum number of requests sent at once when rate limiting
+        retry_policy: Backoff, jitter and budget settings for retries, overrides max_retries
+        json_decoder: JSON decoder for responses, ``"json"``, ``"orjson"``, ``"msgspec"``,
+            ``"auto"`` for the fastest one installed, or a callable taking bytes
+        response_mode: How resources build responses, ``"model"`` validates them into typed
+            models, ``"construct"`` builds the models without validation and ``"raw"``
+            returns the decoded JSON
+        validate_params: Whether resources validate the parameters of each call, disable it
+            to save the validation overhead once the calling code is known to be correct
+        coalesce_requests: Whether identical GET requests made while one is in flight share
+            its response instead of being sent again
+        cache: Cache of GET responses, invalidated by the writes made through this client
+        limits: Connection pool limits (max connections, keep-alive connections and expiry)
+        http2: Whether to enable HTTP/2, requires the ``http2`` extra
+        transport: Custom transport for the underlying HTTP client
+        http_client: Pre-built HTTP client to use instead of creating one. It can be shared
+            with other clients, the API key is sent with each request and the HTTP client is
+            not closed when this client is closed
 
     Raises:
         PaddleAPIError: If the API key is invalid
@@ -87,19 +228,45 @@ class Client(BaseClient):
         *,
         api_key: str,
         environment: Union[Environment.PRODUCTION, Environment.SANDBOX] = Environment.SANDBOX,
-        timeout: int = 30,
+        timeout: Union[float, httpx.Timeout] = 30,
         max_retries: int = 3,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_decoder: Union[JSON_DECODER, JSONDecoder] = "auto",
+        response_mode: RESPONSE_MODE = "model",
+        validate_params: bool = True,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        http_client: Optional[httpx.Client] = None,
     ):
         super().__init__(
-            api_key=api_key, environment=environment, timeout=timeout, max_retries=max_retries
-        )
-        self._client = httpx.Client(
-            timeout=self.timeout,
-            headers=self._get_headers(),
+            api_key=api_key,
+            environment=environment,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            retry_policy=retry_policy,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
+            validate_params=validate_params,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            limits=limits,
+            http2=http2,
         )
-
-        # Initialize extensions
-        self._init_extensions()
+        self._owns_client = http_client is None
+        if http_client is not None:
+            # Authenticate each request so the HTTP client can be shared between API keys
+            self._request_headers = self._get_headers()
+            self._client = http_client
+        else:
+            self._client = httpx.Client(transport=transport, **self._get_client_options())
+        self._single_flight = SingleFlight() if coalesce_requests else None
 
         # Initialize resources
         self._init_resources()
@@ -109,24 +276,38 @@ class Client(BaseClient):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Close the HTTP client."""
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
 
-    def _init_extensions(self):
+    @cached_property
+    def webhooks(self) -> "Webhooks":
         from .extensions import Webhooks
 
-        self.webhooks = self._add_extension(Webhooks)
+        return self._add_extension(Webhooks)
 
-    def _init_resources(self):
-        """Initialize resources."""
-        from .models.resources import Product
-        from .models.resources import Price
-        from .models.resources import Customer
-        from .models.resources import Subscription
+    @cached_property
+    def products(self) -> "Product":
+        from .models.resources.products import Product
+
+        return self._create_resource(Product)
+
+    @cached_property
+    def prices(self) -> "Price":
+        from .models.resources.prices import Price
+
+        return self._create_resource(Price)
 
-        self.products = self._create_resource(Product)
-        self.prices = self._create_resource(Price)
-        self.customers = self._create_resource(Customer)
-        self.subscriptions = self._create_resource(Subscription)
+    @cached_property
+    def customers(self) -> "Customer":
+        from .models.resources.customers import Customer
+
+        return self._create_resource(Customer)
+
+    @cached_property
+    def subscriptions(self) -> "Subscription":
+        from .models.resources.subscriptions import Subscription
+
+        return self._create_resource(Subscription)
 
     def _request(
         self,
@@ -135,47 +316,115 @@ class Client(BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         retry_on_error: bool = True,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Make a synchronous HTTP request.
 
+        With ``coalesce_requests`` enabled, a GET identical to one in flight in another
+        thread waits for it and returns its response. With a ``cache``, GET responses are
+        returned from it while fresh, and other requests invalidate the responses they may
+        change.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             params: Query parameters
             json: JSON body for POST/PUT requests
             retry_on_error: Whether to retry on retryable errors
+            raw: Whether to return the raw response body instead of the decoded JSON
 
         Returns:
-            JSON response from the API
+            JSON response from the API, or the raw response body if ``raw`` is set
 
         Raises:
             PaddleAPIError: If the API request fails
         """
+        if method != "GET" or json is not None:
+            try:
+                return self._send_request(method, path, params, json, retry_on_error, raw)
+            finally:
+                if self.cache is not None:
+                    # Failed writes may still have been applied
+                    self.cache.invalidate_path(path)
+
+        cache = self.cache if self.cache is not None and self.cache.is_cached(path) else None
+        if cache is not None:
+            cache_key = request_key(method, path, params, raw, self.api_key)
+            response = cache.get(cache_key)
+            if response is not MISSING:
+                return response
+            generation = cache.generation
+
+        if self._single_flight is not None:
+            response = self._single_flight.do(
+                request_key(method, path, params, retry_on_error, raw),
+                lambda: self._send_request(method, path, params, json, retry_on_error, raw),
+            )
+        else:
+            response = self._send_request(method, path, params, json, retry_on_error, raw)
+
+        if cache is not None:
+            cache.set(cache_key, response, path, generation)
+
+        return response
+
+    def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        retry_on_error: bool,
+        raw: bool,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Send a request, retrying it according to the retry policy."""
         url = self._build_url(path)
         retries = 0
+        retry_delay = None
+        started_at = time.monotonic()
+        self.retry_policy.record_request()
 
         while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
             try:
                 response = self._client.request(
                     method=method,
                     url=url,
                     params=params,
                     json=json,
+                    headers=self._request_headers,
                 )
 
                 if response.is_success:
-                    return response.json()
+                    if self.rate_limiter:
+                        self.rate_limiter.on_success()
 
-                # Handle error response
-                if retry_on_error and retries < self.max_retries:
-                    status_code = response.status_code
+                    if raw:
+                        return response.content
 
-                    if is_retryable_status_code(status_code):
-                        retry_delay = get_retry_delay(
-                            status_code, response.headers.get("Retry-After")
-                        )
-                        time.sleep(retry_delay)
+                    return self.json_decoder(response.content)
+
+                status_code = response.status_code
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                rate_limited = status_code == 429 and self.rate_limiter is not None
+                if rate_limited:
+                    self.rate_limiter.on_rate_limited(
+                        get_retry_delay(status_code, response.headers.get("Retry-After"))
+                    )
+
+                # Handle error response
+                if retry_on_error and is_retryable_status_code(status_code):
+                    retry_delay = self._next_retry_delay(
+                        retries, started_at, retry_delay, retry_after
+                    )
+                    if retry_delay is not None:
+                        # The rate limiter already holds back every request until the
+                        # Retry-After delay has passed, so don't sleep on top of it.
+                        if not rate_limited:
+                            time.sleep(retry_delay)
                         retries += 1
                         continue
 
@@ -187,8 +436,104 @@ class Client(BaseClient):
 
             except httpx.RequestError as e:
                 # Handle network errors
-                if retry_on_error and retries < self.max_retries:
-                    time.sleep(1.0)  # Simple exponential backoff
-                    retries += 1
-                    continue
+                if retry_on_error:
+                    retry_delay = self._next_retry_delay(retries, started_at, retry_delay)
+                    if retry_delay is not None:
+                        time.sleep(retry_delay)
+                        retries += 1
+                        continue
                 raise create_paddle_error(500, str(e)) from e
+
+
+class ClientFactory:
+    """
+    Creates synchronous clients for many API keys on top of one shared connection pool.
+
+    Clients returned by the factory send their API key with each request instead of
+    owning an HTTP client, so thousands of tenants reuse the same connections and TLS
+    sessions.
+
+    Args:
+        environment: The environment to use for the Paddle API
+        timeout: The timeout for the Paddle API, either in seconds or as an ``httpx.Timeout``
+        limits: Connection pool limits of the shared HTTP client
+        http2: Whether to enable HTTP/2, requires the ``http2`` extra
+        transport: Custom transport for the shared HTTP client
+        **client_options: Options passed to every created client, such as ``max_retries``
+            or ``rate_limit``
+
+    Examples:
+        >>> factory = ClientFactory(environment=Environment.PRODUCTION)
+        >>> client = factory.get("merchant_api_key")
+        >>> client.products.list()
+    """
+
+    def __init__(
+        self,
+        *,
+        environment: Union[Environment.PRODUCTION, Environment.SANDBOX] = Environment.SANDBOX,
+        timeout: Union[float, httpx.Timeout] = 30,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        **client_options: Any,
+    ):
+        self.environment = environment
+        self.timeout = timeout
+        self._client_options = client_options
+        self._http_client = httpx.Client(
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            http2=http2,
+            transport=transport,
+            **({"limits": limits} if limits is not None else {}),
+        )
+        self._clients: Dict[str, Client] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP client."""
+        self.close()
+
+    def get(self, api_key: str) -> Client:
+        """
+        Get the client for an API key, creating it on first use.
+
+        Parameters:
+            api_key: The API key for the Paddle API
+
+        Returns:
+            A client sharing the factory's connection pool
+        """
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                client = Client(
+                    api_key=api_key,
+                    environment=self.environment,
+                    timeout=self.timeout,
+                    http_client=self._http_client,
+                    **self._client_options,
+                )
+                self._clients[api_key] = client
+
+            return client
+
+    def remove(self, api_key: str) -> None:
+        """
+        Forget the client for an API key.
+
+        Parameters:
+            api_key: The API key for the Paddle API
+        """
+        with self._lock:
+            self._clients.pop(api_key, None)
+
+    def close(self) -> None:
+        """Close the shared HTTP client and forget every created client."""
+        with self._lock:
+            self._clients.clear()
+        self._http_client.close()
@@ -3,19 +3,38 @@ import time
 import hmac
 import hashlib
 
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
 from pydantic import BaseModel
 
 from paddle.utils.decorators import validate_params
 from paddle.utils.enums import WebhookEvent
 
+if TYPE_CHECKING:
+    from paddle.client import BaseClient
+    from paddle.utils.cache import ResponseCache
+
+# Cached resource changed by the events of each entity, and the payload field holding its ID
+CACHE_INVALIDATIONS: Dict[str, Tuple[str, str]] = {
+    "product": ("products", "id"),
+    "price": ("prices", "id"),
+    "customer": ("customers", "id"),
+    "address": ("customers", "customer_id"),
+    "business": ("customers", "customer_id"),
+    "payment_method": ("customers", "customer_id"),
+    "subscription": ("subscriptions", "id"),
+}
+
 
 class WebhookSignatureData(BaseModel):
     event_type: WebhookEvent
+    event_id: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
 
 
 class Webhooks:
-    def __init__(self):
-        pass
+    def __init__(self, client: Optional["BaseClient"] = None):
+        self._client = client
 
     @validate_params
     def verify_signature(
@@ -66,4 +85,43 @@ class Webhooks:
 
         request_body_json = json.loads(request_body)
 
-        return WebhookSignatureData(event_type=WebhookEvent(request_body_json["event_type"]))
+        return WebhookSignatureData(
+            event_type=WebhookEvent(request_body_json["event_type"]),
+            event_id=request_body_json.get("event_id"),
+            data=request_body_json.get("data"),
+        )
+
+    def invalidate_cache(
+        self, event: WebhookSignatureData, cache: Optional["ResponseCache"] = None
+    ) -> int:
+        """Drop the cached responses outdated by a verified webhook event.
+
+        The entity changed by the event is read from its payload, so the next get of the
+        entity, the lists of its resource and the resources including it are fetched
+        from Paddle again. Events of entities that aren't cached are ignored.
+
+        Args:
+            event: The event returned by ``verify_signature``
+            cache: The cache to invalidate, the cache of the client by default
+
+        Returns:
+            The number of dropped responses
+
+        Example:
+            >>> event = client.webhooks.verify_signature(
+            ...     signature=signature, secret=secret, request_body=body
+            ... )
+            >>> client.webhooks.invalidate_cache(event)
+        """
+        if cache is None and self._client is not None:
+            cache = self._client.cache
+        if cache is None:
+            return 0
+
+        entity = event.event_type.value.split(".", 1)[0]
+        if entity not in CACHE_INVALIDATIONS:
+            return 0
+
+        resource, id_field = CACHE_INVALIDATIONS[entity]
+        entity_id = (event.data or {}).get(id_field)
+        return cache.invalidate(resource, entity_id)
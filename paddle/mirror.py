@@ -0,0 +1,293 @@
+import json
+import sqlite3
+import threading
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from paddle.models.responses.customers import CustomerData
+from paddle.models.responses.prices import PriceData
+from paddle.models.responses.products import ProductData
+from paddle.utils.batching import ALL_STATUSES
+
+if TYPE_CHECKING:
+    from paddle.client import Client
+
+# Mirrored resources: their model and the indexed fields stored next to the JSON document
+MIRRORED_RESOURCES: Dict[str, Dict[str, Any]] = {
+    "products": {"model": ProductData, "columns": ("status",)},
+    "prices": {"model": PriceData, "columns": ("status", "product_id")},
+    "customers": {"model": CustomerData, "columns": ("status", "email")},
+}
+
+# Number of entities written to the database at once while syncing
+SYNC_BATCH_SIZE = 1000
+
+
+class CatalogMirror:
+    """
+    Local read replica of products, prices and customers, stored in SQLite.
+
+    ``sync`` copies every entity of the mirrored resources with the list endpoints, then
+    ``get_*`` and ``list_*`` answer from the local database without any request. Entities
+    are stored as their JSON document next to indexed columns (status, product ID and
+    email) and are read back into the SDK's response models.
+
+    The mirror can be shared between threads. Each method runs in its own transaction, so
+    readers never see a sync half done.
+
+    Args:
+        path: Path of the SQLite database file, ``":memory:"`` for a mirror that isn't
+            persisted
+
+    Examples:
+        >>> with CatalogMirror("catalog.db") as mirror:
+        ...     mirror.sync(client)
+        ...     prices = mirror.list_prices(product_id="pro_01", status="active")
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            for resource, options in MIRRORED_RESOURCES.items():
+                columns = "".join(f", {column} TEXT" for column in options["columns"])
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {resource} "
+                    f"(id TEXT PRIMARY KEY, updated_at TEXT{columns}, data TEXT NOT NULL)"
+                )
+                for column in options["columns"]:
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {resource}_{column} ON {resource} ({column})"
+                    )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def sync(self, client: "Client", resources: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Replace the mirrored entities with every entity fetched from Paddle.
+
+        Entities are listed 200 per request, archived ones included, and staged in a
+        temporary table so memory use doesn't grow with the catalog. Each resource is then
+        replaced in one transaction, removing the entities Paddle no longer returns.
+
+        Args:
+            client: The client to fetch the entities with
+            resources: Names of the resources to sync, all mirrored resources by default
+
+        Returns:
+            The number of entities synced per resource
+
+        Raises:
+            PaddleAPIError: If a list request fails, the resource keeps its previous entities
+        """
+        raw_client = client.with_response_mode("raw")
+        counts = {}
+        for resource in resources or MIRRORED_RESOURCES:
+            self._check_resource(resource)
+            entities = getattr(raw_client, resource).iter_all(status=ALL_STATUSES, per_page=200)
+            counts[resource] = self._replace(resource, entities)
+
+        return counts
+
+    def upsert(self, resource: str, entities: Iterable[Union[BaseModel, Dict[str, Any]]]) -> int:
+        """
+        Insert or replace entities, e.g. from webhooks or a partial sync.
+
+        Args:
+            resource: The resource name, ``"products"``, ``"prices"`` or ``"customers"``
+            entities: The entities, as response models or their decoded JSON
+
+        Returns:
+            The number of written entities
+        """
+        self._check_resource(resource)
+        documents = [
+            entity.model_dump(mode="json") if isinstance(entity, BaseModel) else entity
+            for entity in entities
+        ]
+        with self._lock, self._connection:
+            self._insert(resource, documents)
+
+        return len(documents)
+
+    def delete(self, resource: str, ids: Iterable[str]) -> int:
+        """
+        Delete entities by ID.
+
+        Args:
+            resource: The resource name
+            ids: The IDs of the entities to delete
+
+        Returns:
+            The number of deleted entities
+        """
+        self._check_resource(resource)
+        with self._lock, self._connection:
+            cursor = self._connection.executemany(
+                f"DELETE FROM {resource} WHERE id = ?", [(id,) for id in ids]
+            )
+            return cursor.rowcount
+
+    def count(self, resource: str) -> int:
+        """
+        Count the mirrored entities of a resource.
+
+        Args:
+            resource: The resource name
+
+        Returns:
+            The number of entities
+        """
+        self._check_resource(resource)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {resource}").fetchone()[0]
+
+    def get_product(self, product_id: str) -> Optional[ProductData]:
+        """Get a product by ID, or None if it isn't mirrored."""
+        return self._get("products", product_id)
+
+    def get_price(self, price_id: str) -> Optional[PriceData]:
+        """Get a price by ID, or None if it isn't mirrored."""
+        return self._get("prices", price_id)
+
+    def get_customer(self, customer_id: str) -> Optional[CustomerData]:
+        """Get a customer by ID, or None if it isn't mirrored."""
+        return self._get("customers", customer_id)
+
+    def list_products(
+        self, *, id: Optional[Sequence[str]] = None, status: Optional[str] = None
+    ) -> List[ProductData]:
+        """
+        List mirrored products, ordered by ID.
+
+        Args:
+            id: Return only the products with these IDs
+            status: Return only the products with this status
+        """
+        return self._list("products", id=id, status=status)
+
+    def list_prices(
+        self,
+        *,
+        id: Optional[Sequence[str]] = None,
+        product_id: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[PriceData]:
+        """
+        List mirrored prices, ordered by ID.
+
+        Args:
+            id: Return only the prices with these IDs
+            product_id: Return only the prices of this product
+            status: Return only the prices with this status
+        """
+        return self._list("prices", id=id, product_id=product_id, status=status)
+
+    def list_customers(
+        self,
+        *,
+        id: Optional[Sequence[str]] = None,
+        email: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[CustomerData]:
+        """
+        List mirrored customers, ordered by ID.
+
+        Args:
+            id: Return only the customers with these IDs
+            email: Return only the customers with this email
+            status: Return only the customers with this status
+        """
+        return self._list("customers", id=id, email=email, status=status)
+
+    def _check_resource(self, resource: str) -> None:
+        if resource not in MIRRORED_RESOURCES:
+            raise ValueError(f"Unknown mirrored resource: {resource}")
+
+    def _replace(self, resource: str, entities: Iterable[Dict[str, Any]]) -> int:
+        """Replace every entity of a resource, keeping the previous ones on errors."""
+        staging = f"temp.sync_{resource}"
+        with self._lock, self._connection:
+            self._connection.execute(f"DROP TABLE IF EXISTS {staging}")
+            self._connection.execute(f"CREATE TABLE {staging} AS SELECT * FROM {resource} WHERE 0")
+
+        count = 0
+        entities = iter(entities)
+        while batch := list(islice(entities, SYNC_BATCH_SIZE)):
+            with self._lock, self._connection:
+                self._insert(resource, batch, table=staging)
+            count += len(batch)
+
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {resource}")
+            self._connection.execute(f"INSERT OR REPLACE INTO {resource} SELECT * FROM {staging}")
+            self._connection.execute(f"DROP TABLE {staging}")
+
+        return count
+
+    def _insert(
+        self, resource: str, documents: List[Dict[str, Any]], table: Optional[str] = None
+    ) -> None:
+        """Write entities, the caller holds the lock and the transaction."""
+        columns = MIRRORED_RESOURCES[resource]["columns"]
+        names = ", ".join(("id", "updated_at", *columns, "data"))
+        placeholders = ", ".join("?" * (len(columns) + 3))
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {table or resource} ({names}) VALUES ({placeholders})",
+            [
+                (
+                    document["id"],
+                    document.get("updated_at"),
+                    *(document.get(column) for column in columns),
+                    json.dumps(document, separators=(",", ":")),
+                )
+                for document in documents
+            ],
+        )
+
+    def _get(self, resource: str, id: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM {resource} WHERE id = ?", (id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return self._model(resource).model_validate_json(row[0])
+
+    def _list(self, resource: str, id: Optional[Sequence[str]] = None, **filters: Any) -> list:
+        conditions, params = [], []
+        if id is not None:
+            conditions.append(f"id IN ({', '.join('?' * len(id))})")
+            params.extend(id)
+        for column, value in filters.items():
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        query = f"SELECT data FROM {resource}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY id", params).fetchall()
+
+        model = self._model(resource)
+        return [model.model_validate_json(row[0]) for row in rows]
+
+    def _model(self, resource: str) -> Type[BaseModel]:
+        return MIRRORED_RESOURCES[resource]["model"]
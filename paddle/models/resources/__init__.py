@@ -9,14 +9,37 @@ __all__ = [
     "AsyncSubscription",
 ]
 
-from .products import Product
-from .products import AsyncProduct
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .prices import Price
-from .prices import AsyncPrice
+if TYPE_CHECKING:
+    from .products import Product
+    from .products import AsyncProduct
 
-from .customers import Customer
-from .customers import AsyncCustomer
+    from .prices import Price
+    from .prices import AsyncPrice
 
-from .subscriptions import Subscription
-from .subscriptions import AsyncSubscription
+    from .customers import Customer
+    from .customers import AsyncCustomer
+
+    from .subscriptions import Subscription
+    from .subscriptions import AsyncSubscription
+
+# Resource modules are imported on first use to keep ``import paddle`` fast
+_MODULES = {
+    "Product": ".products",
+    "AsyncProduct": ".products",
+    "Price": ".prices",
+    "AsyncPrice": ".prices",
+    "Customer": ".customers",
+    "AsyncCustomer": ".customers",
+    "Subscription": ".subscriptions",
+    "AsyncSubscription": ".subscriptions",
+}
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(_MODULES[name], __name__), name)
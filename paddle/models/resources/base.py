@@ -1,6 +1,9 @@
-from typing import Protocol
+from typing import Any, Dict, Protocol, Type, TypeVar, Union
 
 from paddle.client import BaseClient
+from paddle.models.responses.base import ResponsePayload, parse_response
+
+R = TypeVar("R")
 
 
 class ResourceBase(Protocol):
@@ -8,3 +11,19 @@ class ResourceBase(Protocol):
 
     def __init__(self, client: BaseClient):
         self._client = client
+
+    @property
+    def _validate_params(self) -> bool:
+        """Whether ``validate_params`` checks the parameters of this resource's methods."""
+        return self._client.validate_params
+
+    def _parse_response(
+        self, response_class: Type[R], payload: ResponsePayload
+    ) -> Union[R, Dict[str, Any]]:
+        """Build a response object according to the client's response mode."""
+        return parse_response(
+            response_class,
+            payload,
+            self._client.response_mode,
+            self._client.json_decoder,
+        )
@@ -2,16 +2,31 @@
 Paddle Customers API endpoints.
 """
 
-from typing import Union, Optional, Literal, Annotated, Any, Dict, List
+from typing import (
+    Union,
+    Optional,
+    Literal,
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Iterable,
+    Iterator,
+    AsyncIterable,
+    AsyncIterator,
+    Sequence,
+)
 
 from pydantic import Field
 
 from paddle.client import Client
 from paddle.aio.client import AsyncClient
-from paddle.exceptions import PaddleAPIError, create_paddle_error
+from paddle.exceptions import PaddleAPIError, PaddleNotFoundError, create_paddle_error
 
 from paddle.models.resources.base import ResourceBase
+from paddle.models.responses.base import ResponsePayload
 from paddle.models.responses.customers import (
+    CustomerData,
     CustomerListResponse,
     CustomerCreateResponse,
     CustomerGetResponse,
@@ -21,8 +36,15 @@ from paddle.models.responses.customers import (
     CustomerPortalSessionResponse,
 )
 
+from paddle.utils.batching import ALL_STATUSES, GetManyResult, chunk_ids, collect_by_id
+from paddle.utils.checkpoints import CheckpointStore
+from paddle.utils.concurrency import BulkResult, amap_concurrently, map_concurrently
 from paddle.utils.decorators import validate_params
 from paddle.utils.helpers import filter_none_kwargs
+from paddle.utils.loader import AsyncBatchLoader
+from paddle.utils.export import EXPORT_FORMAT, write_export
+from paddle.utils.pagination import paginate, apaginate, get_checkpoint_key, iter_pages
+from paddle.utils.sharding import asharded_scan
 
 
 class CustomerBase(ResourceBase):
@@ -33,33 +55,33 @@ class CustomerBase(ResourceBase):
     def __init__(self, client: Union[Client, AsyncClient]):
         self._client = client
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list customers."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a customer."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _get(self, customer_id: str) -> Dict[str, Any]:
+    def _get(self, customer_id: str) -> ResponsePayload:
         """Internal method to get a customer."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _update(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a customer."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to list credit balances."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _generate_auth_token(self, customer_id: str) -> Dict[str, Any]:
+    def _generate_auth_token(self, customer_id: str) -> ResponsePayload:
         """Internal method to generate an authorization token for a customer."""
         raise NotImplementedError("Subclasses must implement this method")
 
     def _create_portal_session(
         self, customer_id: str, subscription_ids: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
+    ) -> ResponsePayload:
         """Internal method to create a portal session for a customer."""
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -146,7 +168,7 @@ class CustomerBase(ResourceBase):
         )
         response = self._list(**kwargs)
 
-        return CustomerListResponse(response)
+        return self._parse_response(CustomerListResponse, response)
 
     @validate_params
     def create(
@@ -206,7 +228,7 @@ class CustomerBase(ResourceBase):
             )
             response = self._create(**kwargs)
 
-            return CustomerCreateResponse(response)
+            return self._parse_response(CustomerCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -249,7 +271,7 @@ class CustomerBase(ResourceBase):
         try:
             response = self._get(customer_id)
 
-            return CustomerGetResponse(response)
+            return self._parse_response(CustomerGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -320,7 +342,7 @@ class CustomerBase(ResourceBase):
             )
             response = self._update(customer_id, **kwargs)
 
-            return CustomerUpdateResponse(response)
+            return self._parse_response(CustomerUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -371,7 +393,7 @@ class CustomerBase(ResourceBase):
             )
             response = self._list_credit_balances(customer_id, **kwargs)
 
-            return CustomerCreditBalanceResponse(response)
+            return self._parse_response(CustomerCreditBalanceResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -414,7 +436,7 @@ class CustomerBase(ResourceBase):
         try:
             response = self._generate_auth_token(customer_id)
 
-            return CustomerAuthTokenResponse(response)
+            return self._parse_response(CustomerAuthTokenResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -468,7 +490,7 @@ class CustomerBase(ResourceBase):
             )
             response = self._create_portal_session(customer_id, **kwargs)
 
-            return CustomerPortalSessionResponse(response)
+            return self._parse_response(CustomerPortalSessionResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -481,58 +503,289 @@ class Customer(CustomerBase):
     def __init__(self, client: Client):
         super().__init__(client)
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list customers."""
         return self._client._request(
             method="GET",
             path="/customers",
             params=kwargs,
+            raw=True,
         )
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a customer."""
         return self._client._request(
             method="POST",
             path="/customers",
             json=kwargs,
+            raw=True,
         )
 
-    def _get(self, customer_id: str) -> Dict[str, Any]:
+    def _get(self, customer_id: str) -> ResponsePayload:
         """Internal method to get a customer."""
         return self._client._request(
             method="GET",
             path=f"/customers/{customer_id}",
+            raw=True,
         )
 
-    def _update(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a customer."""
         return self._client._request(
             method="PATCH",
             path=f"/customers/{customer_id}",
             json=kwargs,
+            raw=True,
         )
 
-    def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to list credit balances."""
         return self._client._request(
             method="GET",
             path=f"/customers/{customer_id}/credit-balances",
             params=kwargs,
+            raw=True,
         )
 
-    def _generate_auth_token(self, customer_id: str) -> Dict[str, Any]:
+    def _generate_auth_token(self, customer_id: str) -> ResponsePayload:
         """Internal method to generate an authorization token for a customer."""
         return self._client._request(
             method="POST",
             path=f"/customers/{customer_id}/auth-token",
+            raw=True,
         )
 
-    def _create_portal_session(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _create_portal_session(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a portal session for a customer."""
         return self._client._request(
             method="POST",
             path=f"/customers/{customer_id}/portal-sessions",
             json=kwargs,
+            raw=True,
+        )
+
+    def iter_all(
+        self,
+        *,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[CustomerData]:
+        """
+        Iterate over all customers, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+
+        Parameters
+        ----------
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An iterator over every matching customer.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            for customer in client.customers.iter_all(status=["active"]):
+                print(customer.id)
+
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("customers", kwargs)
+
+        return paginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def export(
+        self,
+        path: str,
+        *,
+        format: EXPORT_FORMAT = "ndjson",
+        compression: Optional[str] = "infer",
+        columns: Optional[Sequence[str]] = None,
+        explode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Export all customers to a file, following pagination.
+
+        Pages are written as they are received, 200 customers per page by default, so memory
+        use doesn't grow with the number of customers. Entities are written from the decoded
+        JSON, without building response models.
+
+        Parameters
+        ----------
+
+            path: str
+                Path of the file. The export is written next to it and renamed once
+                complete.
+
+            format: Literal["ndjson", "csv", "parquet"] = "ndjson"
+                One JSON object per line, or CSV or Parquet with nested fields flattened
+                into dotted columns. Parquet requires ``pyarrow``.
+
+            compression: Optional[str] = "infer"
+                ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+                extension, or None. Parquet files are compressed with ``"snappy"`` unless
+                another Parquet codec is given.
+
+            columns: Optional[Sequence[str]] = None
+                CSV and Parquet columns, all the fields of the response model by default.
+
+            explode: Optional[str] = None
+                Name of a list field to write as one row per element.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            The number of exported customers.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            client.customers.export("customers.ndjson.gz")
+
+        """
+        raw_customers = self._client.with_response_mode("raw").customers
+        after = kwargs.pop("after", None)
+        kwargs.setdefault("per_page", 200)
+        pages = iter_pages(lambda cursor: raw_customers.list(**kwargs, after=cursor), after)
+
+        return write_export(
+            (items for items, _ in pages),
+            path,
+            format,
+            compression,
+            columns,
+            explode=explode,
+            model=CustomerData,
+        )
+
+    def get_many(self, ids: Iterable[str], **kwargs: Any) -> GetManyResult[CustomerData]:
+        """
+        Get many customers by ID, with one list request per 200 IDs.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the customers to get. Duplicates are ignored.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived customers
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The customers keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            customers = client.customers.get_many(["ctm_01", "ctm_02"])
+            print(customers["ctm_01"], customers.missing)
+
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = [self.list(id=chunk, per_page=len(chunk), **kwargs) for chunk in chunks]
+
+        return collect_by_id(chunks, pages)
+
+    def bulk_create(
+        self,
+        customers: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+    ) -> Iterator[BulkResult[Dict[str, Any], CustomerCreateResponse]]:
+        """
+        Create many customers, with a bounded number of requests in flight.
+
+        Requests are sent from a thread pool and go through the client's rate limiter and
+        retry policy. The input is read as results are consumed, so it can be a generator
+        over millions of customers.
+
+        Parameters
+        ----------
+
+            customers: Iterable[Dict[str, Any]]
+                The keyword arguments of :meth:`create` for each customer.
+
+            concurrency: int = 10
+                Maximum number of requests in flight.
+
+            ordered: bool = True
+                Whether results are yielded in input order, rather than as they complete.
+
+        Returns
+        -------
+
+            An iterator over a ``BulkResult`` per customer, holding either the created customer
+            in ``result`` or the raised exception in ``error``.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key", rate_limit=50)
+            customers = ({"email": email} for email in emails)
+            for result in client.customers.bulk_create(customers, concurrency=20):
+                if not result.ok:
+                    print(result.item["email"], result.error)
+
+        """
+        return map_concurrently(
+            lambda customer: self.create(**customer),
+            customers,
+            concurrency=concurrency,
+            ordered=ordered,
         )
 
 
@@ -543,59 +796,72 @@ class AsyncCustomer(CustomerBase):
 
     def __init__(self, client: AsyncClient):
         super().__init__(client)
+        self._loader = AsyncBatchLoader(
+            self.get_many,
+            missing_error=lambda customer_id: PaddleNotFoundError(
+                f"Customer {customer_id} not found"
+            ),
+        )
 
-    async def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list customers."""
         return await self._client._request(
             method="GET",
             path="/customers",
             params=kwargs,
+            raw=True,
         )
 
-    async def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a customer."""
         return await self._client._request(
             method="POST",
             path="/customers",
             json=kwargs,
+            raw=True,
         )
 
-    async def _get(self, customer_id: str) -> Dict[str, Any]:
+    async def _get(self, customer_id: str) -> ResponsePayload:
         """Internal method to get a customer."""
         return await self._client._request(
             method="GET",
             path=f"/customers/{customer_id}",
+            raw=True,
         )
 
-    async def _update(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _update(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a customer."""
         return await self._client._request(
             method="PATCH",
             path=f"/customers/{customer_id}",
             json=kwargs,
+            raw=True,
         )
 
-    async def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _list_credit_balances(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to list credit balances."""
         return await self._client._request(
             method="GET",
             path=f"/customers/{customer_id}/credit-balances",
             params=kwargs,
+            raw=True,
         )
 
-    async def _generate_auth_token(self, customer_id: str) -> Dict[str, Any]:
+    async def _generate_auth_token(self, customer_id: str) -> ResponsePayload:
         """Internal method to generate an authorization token for a customer."""
         return await self._client._request(
             method="POST",
             path=f"/customers/{customer_id}/auth-token",
+            raw=True,
         )
 
-    async def _create_portal_session(self, customer_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _create_portal_session(self, customer_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a portal session for a customer."""
         return await self._client._request(
             method="POST",
             path=f"/customers/{customer_id}/portal-sessions",
             json=kwargs,
+            raw=True,
         )
 
     @validate_params
@@ -684,7 +950,281 @@ class AsyncCustomer(CustomerBase):
         )
         response = await self._list(**kwargs)
 
-        return CustomerListResponse(response)
+        return self._parse_response(CustomerListResponse, response)
+
+    def aiter_all(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[CustomerData]:
+        """
+        Asynchronously iterate over all customers, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+        Set ``prefetch`` to request upcoming pages while the current one is being processed.
+
+        Parameters
+        ----------
+
+            prefetch: int = 0
+                Maximum number of pages requested ahead of the consumer. 0 disables prefetching.
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching customer.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    async for customer in client.customers.aiter_all(status=["active"]):
+                        print(customer.id)
+
+            asyncio.run(main())
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("customers", kwargs)
+
+        return apaginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            prefetch=prefetch,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def aiter_sharded(
+        self, *, shards: int = 8, ordered: bool = False, **kwargs: Any
+    ) -> AsyncIterator[CustomerData]:
+        """
+        Asynchronously iterate over all customers, walking ranges of IDs concurrently.
+
+        Paddle IDs sort by creation time, so after requesting the first and last customer the
+        IDs in between are split into ``shards`` ranges, each walked with ``order_by=id[ASC]``
+        at the same time. A full scan then takes about ``pages / shards`` round trips instead
+        of ``pages``. Requests share the client's rate limit and connection pool.
+
+        Parameters
+        ----------
+
+            shards: int = 8
+                Number of ID ranges walked concurrently.
+
+            ordered: bool = False
+                Yield customers in ID order, holding the pages of later ranges in memory until the
+                ranges before them are done. By default customers are yielded as pages arrive.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`, except ``order_by``. ``per_page``
+                defaults to 200.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching customer.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key", rate_limit=20) as client:
+                    raw_client = client.with_response_mode("raw")
+                    async for customer in raw_client.customers.aiter_sharded(
+                        shards=16, status=["active", "archived"]
+                    ):
+                        print(customer["id"])
+
+            asyncio.run(main())
+        """
+        return asharded_scan(self.list, shards=shards, ordered=ordered, **kwargs)
+
+    async def get_many(
+        self, ids: Iterable[str], *, concurrency: int = 5, **kwargs: Any
+    ) -> GetManyResult[CustomerData]:
+        """
+        Get many customers by ID, with one list request per 200 IDs sent concurrently.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the customers to get. Duplicates are ignored.
+
+            concurrency: int = 5
+                Maximum number of list requests in flight.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived customers
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The customers keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    customers = await client.customers.get_many(["ctm_01", "ctm_02"])
+                    print(customers["ctm_01"], customers.missing)
+
+            asyncio.run(main())
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = []
+        results = amap_concurrently(
+            lambda chunk: self.list(id=chunk, per_page=len(chunk), **kwargs),
+            chunks,
+            concurrency=concurrency,
+        )
+        try:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                pages.append(result.result)
+        finally:
+            # Cancel the other requests when one of them fails
+            await results.aclose()
+
+        return collect_by_id(chunks, pages)
+
+    async def load(self, customer_id: str) -> CustomerData:
+        """
+        Get a customer, batched with the customers loaded by other tasks at the same time.
+
+        The IDs loaded within 2 milliseconds of each other, up to 100, are fetched with a
+        single list request, so resolving the customers of many objects concurrently doesn't
+        send one request per customer.
+
+        Parameters
+        ----------
+
+            customer_id: str
+                The ID of the customer.
+
+        Returns
+        -------
+
+            The customer, as returned by :meth:`list`.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+            PaddleNotFoundError: If the customer is not found.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    customers = await asyncio.gather(
+                        *[client.customers.load(customer_id) for customer_id in customer_ids]
+                    )
+
+            asyncio.run(main())
+        """
+        return await self._loader.load(customer_id)
+
+    def bulk_create(
+        self,
+        customers: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+    ) -> AsyncIterator[BulkResult[Dict[str, Any], CustomerCreateResponse]]:
+        """
+        Create many customers, with a bounded number of requests in flight.
+
+        Requests go through the client's rate limiter and retry policy. The input is read as
+        results are consumed, so it can be a generator over millions of customers.
+
+        Parameters
+        ----------
+
+            customers: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+                The keyword arguments of :meth:`create` for each customer.
+
+            concurrency: int = 10
+                Maximum number of requests in flight.
+
+            ordered: bool = True
+                Whether results are yielded in input order, rather than as they complete.
+
+        Returns
+        -------
+
+            An asynchronous iterator over a ``BulkResult`` per customer, holding either the
+            created customer in ``result`` or the raised exception in ``error``.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key", rate_limit=50) as client:
+                    customers = ({"email": email} for email in emails)
+                    async for result in client.customers.bulk_create(customers, concurrency=50):
+                        if not result.ok:
+                            print(result.item["email"], result.error)
+
+            asyncio.run(main())
+        """
+        return amap_concurrently(
+            lambda customer: self.create(**customer),
+            customers,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
 
     @validate_params
     async def create(
@@ -749,7 +1289,7 @@ class AsyncCustomer(CustomerBase):
             )
             response = await self._create(**kwargs)
 
-            return CustomerCreateResponse(response)
+            return self._parse_response(CustomerCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -797,7 +1337,7 @@ class AsyncCustomer(CustomerBase):
         try:
             response = await self._get(customer_id)
 
-            return CustomerGetResponse(response)
+            return self._parse_response(CustomerGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -873,7 +1413,7 @@ class AsyncCustomer(CustomerBase):
             )
             response = await self._update(customer_id, **kwargs)
 
-            return CustomerUpdateResponse(response)
+            return self._parse_response(CustomerUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -928,7 +1468,7 @@ class AsyncCustomer(CustomerBase):
             )
             response = await self._list_credit_balances(customer_id, **kwargs)
 
-            return CustomerCreditBalanceResponse(response)
+            return self._parse_response(CustomerCreditBalanceResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -976,7 +1516,7 @@ class AsyncCustomer(CustomerBase):
         try:
             response = await self._generate_auth_token(customer_id)
 
-            return CustomerAuthTokenResponse(response)
+            return self._parse_response(CustomerAuthTokenResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -1035,6 +1575,6 @@ class AsyncCustomer(CustomerBase):
             )
             response = await self._create_portal_session(customer_id, **kwargs)
 
-            return CustomerPortalSessionResponse(response)
+            return self._parse_response(CustomerPortalSessionResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
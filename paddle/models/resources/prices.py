@@ -2,7 +2,19 @@
 Paddle Prices API endpoints.
 """
 
-from typing import Union, Optional, Literal, Annotated, Any, Dict, List
+from typing import (
+    Union,
+    Optional,
+    Literal,
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Sequence,
+)
 
 from pydantic import Field
 
@@ -10,7 +22,9 @@ from paddle.client import Client
 from paddle.aio.client import AsyncClient
 
 from paddle.models.resources.base import ResourceBase
+from paddle.models.responses.base import ResponsePayload
 from paddle.models.responses.prices import (
+    PriceDataWithProduct,
     PriceListResponse,
     PriceCreateResponse,
     PriceGetResponse,
@@ -21,10 +35,16 @@ from paddle.models.responses.prices import (
     QuantityType,
 )
 
+from paddle.utils.batching import ALL_STATUSES, GetManyResult, chunk_ids, collect_by_id
+from paddle.utils.checkpoints import CheckpointStore
+from paddle.utils.concurrency import amap_concurrently
 from paddle.utils.decorators import validate_params
 from paddle.utils.helpers import filter_none_kwargs
+from paddle.utils.loader import AsyncBatchLoader
+from paddle.utils.export import EXPORT_FORMAT, write_export
+from paddle.utils.pagination import paginate, apaginate, get_checkpoint_key, iter_pages
 
-from paddle.exceptions import PaddleAPIError, create_paddle_error
+from paddle.exceptions import PaddleAPIError, PaddleNotFoundError, create_paddle_error
 
 
 class PriceBase(ResourceBase):
@@ -35,19 +55,19 @@ class PriceBase(ResourceBase):
     def __init__(self, client: Union[Client, AsyncClient]):
         self._client = client
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list products."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _get(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _get(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _update(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -164,7 +184,7 @@ class PriceBase(ResourceBase):
             )
             response = self._list(**kwargs)
 
-            return PriceListResponse(response)
+            return self._parse_response(PriceListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -265,7 +285,7 @@ class PriceBase(ResourceBase):
             )
             response = self._create(**kwargs)
 
-            return PriceCreateResponse(response)
+            return self._parse_response(PriceCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -313,7 +333,7 @@ class PriceBase(ResourceBase):
             kwargs = filter_none_kwargs(include=",".join(include) if include else None)
             response = self._get(price_id, **kwargs)
 
-            return PriceGetResponse(response)
+            return self._parse_response(PriceGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -411,7 +431,7 @@ class PriceBase(ResourceBase):
             )
             response = self._update(price_id, **kwargs)
 
-            return PriceUpdateResponse(response)
+            return self._parse_response(PriceUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -422,75 +442,260 @@ class Price(PriceBase):
     def __init__(self, client: Client):
         super().__init__(client)
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list prices."""
         return self._client._request(
             method="GET",
             path="/prices",
             params=kwargs,
+            raw=True,
         )
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a price."""
         return self._client._request(
             method="POST",
             path="/prices",
             json=kwargs,
+            raw=True,
         )
 
-    def _get(self, price_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _get(self, price_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a price."""
         return self._client._request(
             method="GET",
             path=f"/prices/{price_id}",
             params=kwargs,
+            raw=True,
         )
 
-    def _update(self, price_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, price_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a price."""
         return self._client._request(
             method="PATCH",
             path=f"/prices/{price_id}",
             json=kwargs,
+            raw=True,
+        )
+
+    def iter_all(
+        self,
+        *,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[PriceDataWithProduct]:
+        """
+        Iterate over all prices, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+
+        Parameters
+        ----------
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An iterator over every matching price.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            for price in client.prices.iter_all(product_id=["pro_1234567890"]):
+                print(price.id)
+
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("prices", kwargs)
+
+        return paginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def export(
+        self,
+        path: str,
+        *,
+        format: EXPORT_FORMAT = "ndjson",
+        compression: Optional[str] = "infer",
+        columns: Optional[Sequence[str]] = None,
+        explode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Export all prices to a file, following pagination.
+
+        Pages are written as they are received, 200 prices per page by default, so memory
+        use doesn't grow with the number of prices. Entities are written from the decoded
+        JSON, without building response models.
+
+        Parameters
+        ----------
+
+            path: str
+                Path of the file. The export is written next to it and renamed once
+                complete.
+
+            format: Literal["ndjson", "csv", "parquet"] = "ndjson"
+                One JSON object per line, or CSV or Parquet with nested fields flattened
+                into dotted columns. Parquet requires ``pyarrow``.
+
+            compression: Optional[str] = "infer"
+                ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+                extension, or None. Parquet files are compressed with ``"snappy"`` unless
+                another Parquet codec is given.
+
+            columns: Optional[Sequence[str]] = None
+                CSV and Parquet columns, all the fields of the response model by default.
+
+            explode: Optional[str] = None
+                Name of a list field to write as one row per element.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            The number of exported prices.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            client.prices.export("prices.ndjson.gz")
+
+        """
+        raw_prices = self._client.with_response_mode("raw").prices
+        after = kwargs.pop("after", None)
+        kwargs.setdefault("per_page", 200)
+        pages = iter_pages(lambda cursor: raw_prices.list(**kwargs, after=cursor), after)
+
+        return write_export(
+            (items for items, _ in pages),
+            path,
+            format,
+            compression,
+            columns,
+            explode=explode,
+            model=PriceDataWithProduct,
         )
 
+    def get_many(self, ids: Iterable[str], **kwargs: Any) -> GetManyResult[PriceDataWithProduct]:
+        """
+        Get many prices by ID, with one list request per 200 IDs.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the prices to get. Duplicates are ignored.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived prices
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The prices keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            prices = client.prices.get_many(["pri_01", "pri_02"])
+            print(prices["pri_01"], prices.missing)
+
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = [self.list(id=chunk, per_page=len(chunk), **kwargs) for chunk in chunks]
+
+        return collect_by_id(chunks, pages)
+
 
 class AsyncPrice(PriceBase):
     """Resource for Paddle Prices API endpoints."""
 
     def __init__(self, client: AsyncClient):
         super().__init__(client)
+        self._loader = AsyncBatchLoader(
+            self.get_many,
+            missing_error=lambda price_id: PaddleNotFoundError(f"Price {price_id} not found"),
+        )
 
-    async def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list prices."""
         return await self._client._request(
             method="GET",
             path="/prices",
             params=kwargs,
+            raw=True,
         )
 
-    async def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a price."""
         return await self._client._request(
             method="POST",
             path="/prices",
             json=kwargs,
+            raw=True,
         )
 
-    async def _get(self, price_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _get(self, price_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a price."""
         return await self._client._request(
             method="GET",
             path=f"/prices/{price_id}",
             params=kwargs,
+            raw=True,
         )
 
-    async def _update(self, price_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _update(self, price_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a price."""
         return await self._client._request(
             method="PATCH",
             path=f"/prices/{price_id}",
             json=kwargs,
+            raw=True,
         )
 
     @validate_params
@@ -611,10 +816,178 @@ class AsyncPrice(PriceBase):
             )
             response = await self._list(**params)
 
-            return PriceListResponse(response)
+            return self._parse_response(PriceListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
+    def aiter_all(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[PriceDataWithProduct]:
+        """
+        Asynchronously iterate over all prices, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+        Set ``prefetch`` to request upcoming pages while the current one is being processed.
+
+        Parameters
+        ----------
+
+            prefetch: int = 0
+                Maximum number of pages requested ahead of the consumer. 0 disables prefetching.
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching price.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    async for price in client.prices.aiter_all(product_id=["pro_1234567890"]):
+                        print(price.id)
+
+            asyncio.run(main())
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("prices", kwargs)
+
+        return apaginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            prefetch=prefetch,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    async def get_many(
+        self, ids: Iterable[str], *, concurrency: int = 5, **kwargs: Any
+    ) -> GetManyResult[PriceDataWithProduct]:
+        """
+        Get many prices by ID, with one list request per 200 IDs sent concurrently.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the prices to get. Duplicates are ignored.
+
+            concurrency: int = 5
+                Maximum number of list requests in flight.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived prices
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The prices keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    prices = await client.prices.get_many(["pri_01", "pri_02"])
+                    print(prices["pri_01"], prices.missing)
+
+            asyncio.run(main())
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = []
+        results = amap_concurrently(
+            lambda chunk: self.list(id=chunk, per_page=len(chunk), **kwargs),
+            chunks,
+            concurrency=concurrency,
+        )
+        try:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                pages.append(result.result)
+        finally:
+            # Cancel the other requests when one of them fails
+            await results.aclose()
+
+        return collect_by_id(chunks, pages)
+
+    async def load(self, price_id: str) -> PriceDataWithProduct:
+        """
+        Get a price, batched with the prices loaded by other tasks at the same time.
+
+        The IDs loaded within 2 milliseconds of each other, up to 100, are fetched with a
+        single list request, so resolving the prices of many objects concurrently doesn't
+        send one request per price.
+
+        Parameters
+        ----------
+
+            price_id: str
+                The ID of the price.
+
+        Returns
+        -------
+
+            The price, as returned by :meth:`list`.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+            PaddleNotFoundError: If the price is not found.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    prices = await asyncio.gather(
+                        *[client.prices.load(price_id) for price_id in price_ids]
+                    )
+
+            asyncio.run(main())
+        """
+        return await self._loader.load(price_id)
+
     @validate_params
     async def create(
         self,
@@ -717,7 +1090,7 @@ class AsyncPrice(PriceBase):
             )
             response = await self._create(**kwargs)
 
-            return PriceCreateResponse(response)
+            return self._parse_response(PriceCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -769,7 +1142,7 @@ class AsyncPrice(PriceBase):
             kwargs = filter_none_kwargs(include=",".join(include) if include else None)
             response = await self._get(price_id, **kwargs)
 
-            return PriceGetResponse(response)
+            return self._parse_response(PriceGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -871,6 +1244,6 @@ class AsyncPrice(PriceBase):
             )
             response = await self._update(price_id, **kwargs)
 
-            return PriceUpdateResponse(response)
+            return self._parse_response(PriceUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
@@ -2,7 +2,19 @@
 Paddle Products API endpoints.
 """
 
-from typing import Union, Optional, Literal, Annotated, Dict, Any, List
+from typing import (
+    Union,
+    Optional,
+    Literal,
+    Annotated,
+    Dict,
+    Any,
+    List,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Sequence,
+)
 
 from pydantic import Field
 
@@ -10,17 +22,25 @@ from paddle.client import Client
 from paddle.aio.client import AsyncClient
 
 from paddle.models.resources.base import ResourceBase
+from paddle.models.responses.base import ResponsePayload
 from paddle.models.responses.products import (
+    ProductDataWithPrices,
     ProductListResponse,
     ProductCreateResponse,
     ProductGetResponse,
 )
 
 from paddle.utils.constants import TAX_CATEGORY
+from paddle.utils.batching import ALL_STATUSES, GetManyResult, chunk_ids, collect_by_id
+from paddle.utils.checkpoints import CheckpointStore
+from paddle.utils.concurrency import amap_concurrently
 from paddle.utils.decorators import validate_params
 from paddle.utils.helpers import filter_none_kwargs
+from paddle.utils.loader import AsyncBatchLoader
+from paddle.utils.export import EXPORT_FORMAT, write_export
+from paddle.utils.pagination import paginate, apaginate, get_checkpoint_key, iter_pages
 
-from paddle.exceptions import PaddleAPIError, create_paddle_error
+from paddle.exceptions import PaddleAPIError, PaddleNotFoundError, create_paddle_error
 
 
 class ProductBase(ResourceBase):
@@ -29,19 +49,19 @@ class ProductBase(ResourceBase):
     def __init__(self, client: Union[Client, AsyncClient]):
         self._client = client
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list products."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _get(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _get(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _update(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a product."""
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -146,7 +166,7 @@ class ProductBase(ResourceBase):
             )
             response = self._list(**kwargs)
 
-            return ProductListResponse(response)
+            return self._parse_response(ProductListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -223,7 +243,7 @@ class ProductBase(ResourceBase):
             )
             response = self._create(**kwargs)
 
-            return ProductCreateResponse(response)
+            return self._parse_response(ProductCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -274,7 +294,7 @@ class ProductBase(ResourceBase):
             )
             response = self._get(product_id, **kwargs)
 
-            return ProductGetResponse(response)
+            return self._parse_response(ProductGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -358,7 +378,7 @@ class ProductBase(ResourceBase):
             )
             response = self._update(**kwargs)
 
-            return ProductCreateResponse(response)
+            return self._parse_response(ProductCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -369,74 +389,261 @@ class Product(ProductBase):
     def __init__(self, client: Client):
         super().__init__(client)
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list products."""
         return self._client._request(
             method="GET",
             path="/products",
             params=kwargs,
+            raw=True,
         )
 
-    def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a product."""
         return self._client._request(
             method="POST",
             path="/products",
             json=kwargs,
+            raw=True,
         )
 
-    def _get(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _get(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a product."""
         return self._client._request(
             method="GET",
             path=f"/products/{product_id}",
             params=kwargs,
+            raw=True,
         )
 
-    def _update(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a product."""
         return self._client._request(
             method="PATCH",
             path=f"/products/{product_id}",
             json=kwargs,
+            raw=True,
+        )
+
+    def iter_all(
+        self,
+        *,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[ProductDataWithPrices]:
+        """
+        Iterate over all products, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+
+        Parameters
+        ----------
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An iterator over every matching product.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            for product in client.products.iter_all(status=["active"]):
+                print(product.id)
+
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("products", kwargs)
+
+        return paginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def export(
+        self,
+        path: str,
+        *,
+        format: EXPORT_FORMAT = "ndjson",
+        compression: Optional[str] = "infer",
+        columns: Optional[Sequence[str]] = None,
+        explode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Export all products to a file, following pagination.
+
+        Pages are written as they are received, 200 products per page by default, so memory
+        use doesn't grow with the number of products. Entities are written from the decoded
+        JSON, without building response models.
+
+        Parameters
+        ----------
+
+            path: str
+                Path of the file. The export is written next to it and renamed once
+                complete.
+
+            format: Literal["ndjson", "csv", "parquet"] = "ndjson"
+                One JSON object per line, or CSV or Parquet with nested fields flattened
+                into dotted columns. Parquet requires ``pyarrow``.
+
+            compression: Optional[str] = "infer"
+                ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+                extension, or None. Parquet files are compressed with ``"snappy"`` unless
+                another Parquet codec is given.
+
+            columns: Optional[Sequence[str]] = None
+                CSV and Parquet columns, all the fields of the response model by default.
+
+            explode: Optional[str] = None
+                Name of a list field to write as one row per element, ``"prices"`` to write
+                one row per price.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            The number of exported products.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            client.products.export("products.ndjson.gz")
+
+        """
+        raw_products = self._client.with_response_mode("raw").products
+        after = kwargs.pop("after", None)
+        kwargs.setdefault("per_page", 200)
+        pages = iter_pages(lambda cursor: raw_products.list(**kwargs, after=cursor), after)
+
+        return write_export(
+            (items for items, _ in pages),
+            path,
+            format,
+            compression,
+            columns,
+            explode=explode,
+            model=ProductDataWithPrices,
         )
 
+    def get_many(self, ids: Iterable[str], **kwargs: Any) -> GetManyResult[ProductDataWithPrices]:
+        """
+        Get many products by ID, with one list request per 200 IDs.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the products to get. Duplicates are ignored.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived products
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The products keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            products = client.products.get_many(["pro_01", "pro_02"])
+            print(products["pro_01"], products.missing)
+
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = [self.list(id=chunk, per_page=len(chunk), **kwargs) for chunk in chunks]
+
+        return collect_by_id(chunks, pages)
+
 
 class AsyncProduct(ProductBase):
     """Resource for Paddle Products API endpoints."""
 
     def __init__(self, client: AsyncClient):
         super().__init__(client)
+        self._loader = AsyncBatchLoader(
+            self.get_many,
+            missing_error=lambda product_id: PaddleNotFoundError(f"Product {product_id} not found"),
+        )
 
-    async def _list(self) -> Dict[str, Any]:
+    async def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list products."""
         return await self._client._request(
             method="GET",
             path="/products",
+            params=kwargs,
+            raw=True,
         )
 
-    async def _create(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _create(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to create a product."""
         return await self._client._request(
             method="POST",
             path="/products",
             json=kwargs,
+            raw=True,
         )
 
-    async def _get(self, product_id: str, **query_params: Any) -> Dict[str, Any]:
+    async def _get(self, product_id: str, **query_params: Any) -> ResponsePayload:
         """Internal method to get a product."""
         return await self._client._request(
             method="GET",
             path=f"/products/{product_id}",
             params=query_params,
+            raw=True,
         )
 
-    async def _update(self, product_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _update(self, product_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a product."""
         return await self._client._request(
             method="PATCH",
             path=f"/products/{product_id}",
             json=kwargs,
+            raw=True,
         )
 
     async def list(
@@ -541,10 +748,178 @@ class AsyncProduct(ProductBase):
             )
             response = await self._list(**kwargs)
 
-            return ProductListResponse(response)
+            return self._parse_response(ProductListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
+    def aiter_all(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ProductDataWithPrices]:
+        """
+        Asynchronously iterate over all products, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+        Set ``prefetch`` to request upcoming pages while the current one is being processed.
+
+        Parameters
+        ----------
+
+            prefetch: int = 0
+                Maximum number of pages requested ahead of the consumer. 0 disables prefetching.
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching product.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    async for product in client.products.aiter_all(status=["active"]):
+                        print(product.id)
+
+            asyncio.run(main())
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("products", kwargs)
+
+        return apaginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            prefetch=prefetch,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    async def get_many(
+        self, ids: Iterable[str], *, concurrency: int = 5, **kwargs: Any
+    ) -> GetManyResult[ProductDataWithPrices]:
+        """
+        Get many products by ID, with one list request per 200 IDs sent concurrently.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the products to get. Duplicates are ignored.
+
+            concurrency: int = 5
+                Maximum number of list requests in flight.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters. Archived products
+                are included unless ``status`` is given.
+
+        Returns
+        -------
+
+            The products keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    products = await client.products.get_many(["pro_01", "pro_02"])
+                    print(products["pro_01"], products.missing)
+
+            asyncio.run(main())
+        """
+        kwargs.setdefault("status", ALL_STATUSES)
+        chunks = chunk_ids(ids)
+        pages = []
+        results = amap_concurrently(
+            lambda chunk: self.list(id=chunk, per_page=len(chunk), **kwargs),
+            chunks,
+            concurrency=concurrency,
+        )
+        try:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                pages.append(result.result)
+        finally:
+            # Cancel the other requests when one of them fails
+            await results.aclose()
+
+        return collect_by_id(chunks, pages)
+
+    async def load(self, product_id: str) -> ProductDataWithPrices:
+        """
+        Get a product, batched with the products loaded by other tasks at the same time.
+
+        The IDs loaded within 2 milliseconds of each other, up to 100, are fetched with a
+        single list request, so resolving the products of many objects concurrently doesn't
+        send one request per product.
+
+        Parameters
+        ----------
+
+            product_id: str
+                The ID of the product.
+
+        Returns
+        -------
+
+            The product, as returned by :meth:`list`.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+            PaddleNotFoundError: If the product is not found.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    products = await asyncio.gather(
+                        *[client.products.load(product_id) for product_id in product_ids]
+                    )
+
+            asyncio.run(main())
+        """
+        return await self._loader.load(product_id)
+
     @validate_params
     async def create(
         self,
@@ -620,7 +995,7 @@ class AsyncProduct(ProductBase):
             )
             response = await self._create(**kwargs)
 
-            return ProductCreateResponse(response)
+            return self._parse_response(ProductCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -669,7 +1044,7 @@ class AsyncProduct(ProductBase):
         """
         try:
             response = await self._get(product_id, include=",".join(include) if include else None)
-            return ProductGetResponse(response)
+            return self._parse_response(ProductGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -755,6 +1130,6 @@ class AsyncProduct(ProductBase):
             )
             response = await self._update(**kwargs)
 
-            return ProductCreateResponse(response)
+            return self._parse_response(ProductCreateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
@@ -2,7 +2,19 @@
 Paddle Subscriptions API endpoints.
 """
 
-from typing import Union, Optional, Literal, Annotated, Dict, Any, List
+from typing import (
+    Union,
+    Optional,
+    Literal,
+    Annotated,
+    Dict,
+    Any,
+    List,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Sequence,
+)
 
 from pydantic import Field
 
@@ -10,7 +22,9 @@ from paddle.client import Client
 from paddle.aio.client import AsyncClient
 
 from paddle.models.resources.base import ResourceBase
+from paddle.models.responses.base import ResponsePayload
 from paddle.models.responses.subscriptions import (
+    SubscriptionData,
     SubscriptionListResponse,
     SubscriptionGetResponse,
     SubscriptionPreviewUpdateResponse,
@@ -19,8 +33,14 @@ from paddle.models.responses.subscriptions import (
     SubscriptionUpdateResponse,
 )
 
+from paddle.utils.batching import GetManyResult, chunk_ids, collect_by_id
+from paddle.utils.checkpoints import CheckpointStore
+from paddle.utils.concurrency import amap_concurrently
 from paddle.utils.decorators import validate_params
 from paddle.utils.helpers import filter_none_kwargs
+from paddle.utils.export import EXPORT_FORMAT, write_export
+from paddle.utils.pagination import paginate, apaginate, get_checkpoint_key, iter_pages
+from paddle.utils.sharding import asharded_scan
 
 from paddle.exceptions import PaddleAPIError, create_paddle_error
 
@@ -31,47 +51,47 @@ class SubscriptionBase(ResourceBase):
     def __init__(self, client: Union[Client, AsyncClient]):
         self._client = client
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list products."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _get(self, subscription_id: str) -> Dict[str, Any]:
+    def _get(self, subscription_id: str) -> ResponsePayload:
         """Internal method to get a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _preview_update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _preview_update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to preview an update to a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _get_transaction_to_update_payment_method(self, subscription_id: str) -> Dict[str, Any]:
+    def _get_transaction_to_update_payment_method(self, subscription_id: str) -> ResponsePayload:
         """Internal method to get a transaction to update a payment method."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _preview_charge(self, subscription_id: str) -> Dict[str, Any]:
+    def _preview_charge(self, subscription_id: str) -> ResponsePayload:
         """Internal method to list transactions for a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _charge(self, subscription_id: str) -> Dict[str, Any]:
+    def _charge(self, subscription_id: str) -> ResponsePayload:
         """Internal method to charge a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _activate(self, subscription_id: str) -> Dict[str, Any]:
+    def _activate(self, subscription_id: str) -> ResponsePayload:
         """Internal method to activate a trialing subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _pause(self, subscription_id: str) -> Dict[str, Any]:
+    def _pause(self, subscription_id: str) -> ResponsePayload:
         """Internal method to pause a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _resume(self, subscription_id: str) -> Dict[str, Any]:
+    def _resume(self, subscription_id: str) -> ResponsePayload:
         """Internal method to resume a paused subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
-    def _cancel(self, subscription_id: str) -> Dict[str, Any]:
+    def _cancel(self, subscription_id: str) -> ResponsePayload:
         """Internal method to cancel a subscription."""
         raise NotImplementedError("Subclasses must implement this method")
 
@@ -109,7 +129,7 @@ class SubscriptionBase(ResourceBase):
             )
             response = self._list(**kwargs)
 
-            return SubscriptionListResponse(response)
+            return self._parse_response(SubscriptionListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -128,7 +148,7 @@ class SubscriptionBase(ResourceBase):
             )
             response = self._get(subscription_id, **kwargs)
 
-            return SubscriptionGetResponse(response)
+            return self._parse_response(SubscriptionGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -177,7 +197,7 @@ class SubscriptionBase(ResourceBase):
             )
             response = self._preview_update(subscription_id, **kwargs)
 
-            return SubscriptionPreviewUpdateResponse(response)
+            return self._parse_response(SubscriptionPreviewUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -226,7 +246,7 @@ class SubscriptionBase(ResourceBase):
             )
             response = self._update(subscription_id, **kwargs)
 
-            return SubscriptionUpdateResponse(response)
+            return self._parse_response(SubscriptionUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -238,7 +258,7 @@ class SubscriptionBase(ResourceBase):
         try:
             response = self._get_transaction_to_update_payment_method(subscription_id)
 
-            return SubscriptionUpdateResponse(response)
+            return self._parse_response(SubscriptionUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -255,7 +275,7 @@ class SubscriptionBase(ResourceBase):
             )
             response = self._cancel(subscription_id, **kwargs)
 
-            return SubscriptionUpdateResponse(response)
+            return self._parse_response(SubscriptionUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -268,53 +288,232 @@ class Subscription(SubscriptionBase):
     def __init__(self, client: Union[Client, AsyncClient]):
         super().__init__(client)
 
-    def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list subscriptions."""
         return self._client._request(
             method="GET",
             path="/subscriptions",
             params=kwargs,
+            raw=True,
         )
 
-    def _get(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _get(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a subscription."""
         return self._client._request(
             method="GET",
             path=f"/subscriptions/{subscription_id}",
             params=kwargs,
+            raw=True,
         )
 
-    def _preview_update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _preview_update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to preview an update to a subscription."""
         return self._client._request(
             method="PATCH",
             path=f"/subscriptions/{subscription_id}/preview",
             json=kwargs,
+            raw=True,
         )
 
-    def _update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a subscription."""
         return self._client._request(
             method="PATCH",
             path=f"/subscriptions/{subscription_id}",
             json=kwargs,
+            raw=True,
         )
 
-    def _get_transaction_to_update_payment_method(self, subscription_id: str) -> Dict[str, Any]:
+    def _get_transaction_to_update_payment_method(self, subscription_id: str) -> ResponsePayload:
         """Internal method to get a transaction to update a payment method."""
         return self._client._request(
             method="GET",
             path=f"/subscriptions/{subscription_id}/update-payment-method-transaction",
+            raw=True,
         )
 
-    def _cancel(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def _cancel(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to cancel a subscription."""
         return self._client._request(
             method="POST",
             path=f"/subscriptions/{subscription_id}/cancel",
             json=kwargs,
+            raw=True,
+        )
+
+    def iter_all(
+        self,
+        *,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[SubscriptionData]:
+        """
+        Iterate over all subscriptions, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+
+        Parameters
+        ----------
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An iterator over every matching subscription.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            for subscription in client.subscriptions.iter_all(status=["active"]):
+                print(subscription.id)
+
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("subscriptions", kwargs)
+
+        return paginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
         )
 
+    def export(
+        self,
+        path: str,
+        *,
+        format: EXPORT_FORMAT = "ndjson",
+        compression: Optional[str] = "infer",
+        columns: Optional[Sequence[str]] = None,
+        explode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Export all subscriptions to a file, following pagination.
+
+        Pages are written as they are received, 200 subscriptions per page by default, so memory
+        use doesn't grow with the number of subscriptions. Entities are written from the decoded
+        JSON, without building response models.
+
+        Parameters
+        ----------
+
+            path: str
+                Path of the file. The export is written next to it and renamed once
+                complete.
+
+            format: Literal["ndjson", "csv", "parquet"] = "ndjson"
+                One JSON object per line, or CSV or Parquet with nested fields flattened
+                into dotted columns. Parquet requires ``pyarrow``.
+
+            compression: Optional[str] = "infer"
+                ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+                extension, or None. Parquet files are compressed with ``"snappy"`` unless
+                another Parquet codec is given.
+
+            columns: Optional[Sequence[str]] = None
+                CSV and Parquet columns, all the fields of the response model by default.
+
+            explode: Optional[str] = None
+                Name of a list field to write as one row per element, ``"items"`` to write
+                one row per subscription item.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            The number of exported rows, subscriptions or subscription items.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            client.subscriptions.export("subscriptions.ndjson.gz")
+            client.subscriptions.export("items.parquet", format="parquet", explode="items")
+
+        """
+        raw_subscriptions = self._client.with_response_mode("raw").subscriptions
+        after = kwargs.pop("after", None)
+        kwargs.setdefault("per_page", 200)
+        pages = iter_pages(lambda cursor: raw_subscriptions.list(**kwargs, after=cursor), after)
+
+        return write_export(
+            (items for items, _ in pages),
+            path,
+            format,
+            compression,
+            columns,
+            explode=explode,
+            model=SubscriptionData,
+        )
+
+    def get_many(self, ids: Iterable[str], **kwargs: Any) -> GetManyResult[SubscriptionData]:
+        """
+        Get many subscriptions by ID, with one list request per 200 IDs.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the subscriptions to get. Duplicates are ignored.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters.
+
+        Returns
+        -------
+
+            The subscriptions keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            from paddle import Client
+
+            client = Client(api_key="your_api_key")
+            subscriptions = client.subscriptions.get_many(["sub_01", "sub_02"])
+            print(subscriptions["sub_01"], subscriptions.missing)
+
+        """
+        chunks = chunk_ids(ids)
+        pages = [self.list(id=chunk, per_page=len(chunk), **kwargs) for chunk in chunks]
+
+        return collect_by_id(chunks, pages)
+
 
 class AsyncSubscription(SubscriptionBase):
     """Async Paddle Subscriptions API endpoints."""
@@ -322,53 +521,59 @@ class AsyncSubscription(SubscriptionBase):
     def __init__(self, client: AsyncClient):
         super().__init__(client)
 
-    async def _list(self, **kwargs: Any) -> Dict[str, Any]:
+    async def _list(self, **kwargs: Any) -> ResponsePayload:
         """Internal method to list subscriptions."""
         return await self._client._request(
             method="GET",
             path="/subscriptions",
             params=kwargs,
+            raw=True,
         )
 
-    async def _get(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _get(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to get a subscription."""
         return await self._client._request(
             method="GET",
             path=f"/subscriptions/{subscription_id}",
             params=kwargs,
+            raw=True,
         )
 
-    async def _preview_update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _preview_update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to preview an update to a subscription."""
         return await self._client._request(
             method="PATCH",
             path=f"/subscriptions/{subscription_id}/preview",
             json=kwargs,
+            raw=True,
         )
 
-    async def _update(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _update(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to update a subscription."""
         return await self._client._request(
             method="PATCH",
             path=f"/subscriptions/{subscription_id}",
             json=kwargs,
+            raw=True,
         )
 
     async def _get_transaction_to_update_payment_method(
         self, subscription_id: str
-    ) -> Dict[str, Any]:
+    ) -> ResponsePayload:
         """Internal method to get a transaction to update a payment method."""
         return await self._client._request(
             method="GET",
             path=f"/subscriptions/{subscription_id}/update-payment-method-transaction",
+            raw=True,
         )
 
-    async def _cancel(self, subscription_id: str, **kwargs: Any) -> Dict[str, Any]:
+    async def _cancel(self, subscription_id: str, **kwargs: Any) -> ResponsePayload:
         """Internal method to cancel a subscription."""
         return await self._client._request(
             method="POST",
             path=f"/subscriptions/{subscription_id}/cancel",
             json=kwargs,
+            raw=True,
         )
 
     @validate_params
@@ -405,10 +610,188 @@ class AsyncSubscription(SubscriptionBase):
             )
             response = await self._list(**kwargs)
 
-            return SubscriptionListResponse(response)
+            return self._parse_response(SubscriptionListResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
+    def aiter_all(
+        self,
+        *,
+        prefetch: int = 0,
+        checkpoints: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[SubscriptionData]:
+        """
+        Asynchronously iterate over all subscriptions, following pagination.
+
+        Pages are requested as the iterator advances and only one page is held in memory at a time.
+        Set ``prefetch`` to request upcoming pages while the current one is being processed.
+
+        Parameters
+        ----------
+
+            prefetch: int = 0
+                Maximum number of pages requested ahead of the consumer. 0 disables prefetching.
+
+            checkpoints: Optional[CheckpointStore] = None
+                Store to save the progress in after each page, so that iterating again
+                with the same filters resumes after the last page fully consumed. Pages
+                are delivered at least once: a page consumed in part is iterated again.
+
+            checkpoint_key: Optional[str] = None
+                Key of the checkpoint, derived from the filters by default.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching subscription.
+
+        Raises
+        ------
+
+            PaddleAPIError: If the API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    async for subscription in client.subscriptions.aiter_all(status=["active"]):
+                        print(subscription.id)
+
+            asyncio.run(main())
+        """
+        after = kwargs.pop("after", None)
+        if checkpoints is not None and checkpoint_key is None:
+            checkpoint_key = get_checkpoint_key("subscriptions", kwargs)
+
+        return apaginate(
+            lambda cursor: self.list(**kwargs, after=cursor),
+            after=after,
+            prefetch=prefetch,
+            checkpoints=checkpoints,
+            checkpoint_key=checkpoint_key,
+        )
+
+    def aiter_sharded(
+        self, *, shards: int = 8, ordered: bool = False, **kwargs: Any
+    ) -> AsyncIterator[SubscriptionData]:
+        """
+        Asynchronously iterate over all subscriptions, walking ranges of IDs concurrently.
+
+        Paddle IDs sort by creation time, so after requesting the first and last subscription the
+        IDs in between are split into ``shards`` ranges, each walked with ``order_by=id[ASC]``
+        at the same time. A full scan then takes about ``pages / shards`` round trips instead
+        of ``pages``. Requests share the client's rate limit and connection pool.
+
+        Parameters
+        ----------
+
+            shards: int = 8
+                Number of ID ranges walked concurrently.
+
+            ordered: bool = False
+                Yield subscriptions in ID order, holding the pages of later ranges in memory until the
+                ranges before them are done. By default subscriptions are yielded as pages arrive.
+
+            **kwargs: Any
+                The same keyword arguments as :meth:`list`, except ``order_by``. ``per_page``
+                defaults to 200.
+
+        Returns
+        -------
+
+            An asynchronous iterator over every matching subscription.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key", rate_limit=20) as client:
+                    raw_client = client.with_response_mode("raw")
+                    async for subscription in raw_client.subscriptions.aiter_sharded(
+                        shards=16, status=["active", "past_due"]
+                    ):
+                        print(subscription["id"])
+
+            asyncio.run(main())
+        """
+        return asharded_scan(self.list, shards=shards, ordered=ordered, **kwargs)
+
+    async def get_many(
+        self, ids: Iterable[str], *, concurrency: int = 5, **kwargs: Any
+    ) -> GetManyResult[SubscriptionData]:
+        """
+        Get many subscriptions by ID, with one list request per 200 IDs sent concurrently.
+
+        Parameters
+        ----------
+
+            ids: Iterable[str]
+                The IDs of the subscriptions to get. Duplicates are ignored.
+
+            concurrency: int = 5
+                Maximum number of list requests in flight.
+
+            **kwargs: Any
+                Other keyword arguments of :meth:`list`, such as filters.
+
+        Returns
+        -------
+
+            The subscriptions keyed by ID. IDs that weren't found are listed in ``missing``.
+
+        Raises
+        ------
+
+            PaddleAPIError: If an API request fails.
+
+        Example
+        -------- ::
+
+            import asyncio
+            from paddle.aio import AsyncClient
+
+            async def main():
+                async with AsyncClient(api_key="your_api_key") as client:
+                    subscriptions = await client.subscriptions.get_many(["sub_01", "sub_02"])
+                    print(subscriptions["sub_01"], subscriptions.missing)
+
+            asyncio.run(main())
+        """
+        chunks = chunk_ids(ids)
+        pages = []
+        results = amap_concurrently(
+            lambda chunk: self.list(id=chunk, per_page=len(chunk), **kwargs),
+            chunks,
+            concurrency=concurrency,
+        )
+        try:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                pages.append(result.result)
+        finally:
+            # Cancel the other requests when one of them fails
+            await results.aclose()
+
+        return collect_by_id(chunks, pages)
+
     @validate_params
     async def get(
         self,
@@ -424,7 +807,7 @@ class AsyncSubscription(SubscriptionBase):
             )
             response = await self._get(subscription_id, **kwargs)
 
-            return SubscriptionGetResponse(response)
+            return self._parse_response(SubscriptionGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -473,7 +856,7 @@ class AsyncSubscription(SubscriptionBase):
             )
             response = await self._preview_update(subscription_id, **kwargs)
 
-            return SubscriptionPreviewUpdateResponse(response)
+            return self._parse_response(SubscriptionPreviewUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -522,7 +905,7 @@ class AsyncSubscription(SubscriptionBase):
             )
             response = await self._update(subscription_id, **kwargs)
 
-            return SubscriptionUpdateResponse(response)
+            return self._parse_response(SubscriptionUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -534,7 +917,7 @@ class AsyncSubscription(SubscriptionBase):
         try:
             response = await self._get_transaction_to_update_payment_method(subscription_id)
 
-            return SubscriptionGetResponse(response)
+            return self._parse_response(SubscriptionGetResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -551,7 +934,7 @@ class AsyncSubscription(SubscriptionBase):
             )
             response = await self._cancel(subscription_id, **kwargs)
 
-            return SubscriptionUpdateResponse(response)
+            return self._parse_response(SubscriptionUpdateResponse, response)
         except PaddleAPIError as e:
             raise create_paddle_error(e.status_code, e.message) from e
 
@@ -0,0 +1,254 @@
+from collections.abc import Sequence as SequenceABC
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from paddle.utils.decoders import JSONDecoder, RESPONSE_MODE, RESPONSE_MODES, get_json_decoder
+
+R = TypeVar("R")
+M = TypeVar("M", bound=BaseModel)
+
+# Resources return the raw response body, mocks and older callers a decoded dict
+ResponsePayload = Union[bytes, Dict[str, Any]]
+
+# Whether list responses parsed in the current context are validated as a whole
+_eager_validation: ContextVar[bool] = ContextVar("eager_validation", default=False)
+
+
+@contextmanager
+def eager_validation() -> Iterator[None]:
+    """
+    Validate the items of list responses parsed in this context when they are received.
+
+    Lazy validation only pays off when some items of a page are never read. Consumers
+    reading every item, such as ``iter_all()``, are faster validating raw pages as a whole
+    from JSON. The ``data`` of these responses is then a list of models.
+
+    Examples:
+        >>> with eager_validation():
+        ...     subscriptions = client.subscriptions.list(per_page=200).data
+    """
+    token = _eager_validation.set(True)
+    try:
+        yield
+    finally:
+        _eager_validation.reset(token)
+
+
+class LazyList(Sequence[M], Generic[M]):
+    """
+    Read-only list of models validated from the raw items of a page when accessed.
+
+    Each item is validated once, on first access, so reading a few items of a large page
+    doesn't pay for the rest. A ``ValidationError`` is raised when an invalid item is
+    accessed rather than when the page is received.
+
+    Args:
+        model: The model of the items
+        items: The decoded items of the page
+    """
+
+    __slots__ = ("_model", "_items", "_models")
+
+    def __init__(self, model: Type[M], items: List[Dict[str, Any]]):
+        self._model = model
+        self._items = items
+        self._models: List[Optional[M]] = [None] * len(items)
+
+    @property
+    def raw(self) -> List[Dict[str, Any]]:
+        """The decoded items, without validation."""
+        return self._items
+
+    def _get(self, index: int) -> M:
+        model = self._models[index]
+        if model is None:
+            model = self._models[index] = self._model.model_validate(self._items[index])
+        return model
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("list index out of range")
+        return self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(len(self._items)):
+            yield self._get(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SequenceABC) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"LazyList({self._model.__name__}, {len(self._items)} items)"
+
+
+class LazyListResponse:
+    """
+    Base class of list responses whose items are validated lazily.
+
+    Raw response bodies of these responses are decoded rather than validated as a whole,
+    the items are validated when accessed through a ``LazyList``.
+    """
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_constructor(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Build a function creating instances of an annotation without validation.
+
+    Nested models are built with ``model_construct`` as well, other values are kept as is.
+    """
+    origin = get_origin(annotation)
+
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _identity
+
+        inner = _get_constructor(args[0])
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+
+    if origin is list or origin is SequenceABC:
+        inner = _get_constructor(get_args(annotation)[0])
+        if inner is _identity:
+            return _identity
+        return lambda value: [inner(item) for item in value]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        nested = [
+            (name, _get_constructor(field.annotation))
+            for name, field in annotation.model_fields.items()
+        ]
+        nested = [(name, construct) for name, construct in nested if construct is not _identity]
+
+        def construct(value: Dict[str, Any]) -> BaseModel:
+            if nested:
+                value = dict(value)
+                for name, construct_field in nested:
+                    if value.get(name) is not None:
+                        value[name] = construct_field(value[name])
+            return annotation.model_construct(**value)
+
+        return construct
+
+    return _identity
+
+
+@lru_cache(maxsize=None)
+def _get_response_adapter(response_class: type) -> TypeAdapter:
+    """Build a validator for the fields of a response class, once per class."""
+    fields = {
+        name: (annotation, ...) for name, annotation in get_type_hints(response_class).items()
+    }
+    envelope = create_model(f"{response_class.__name__}Envelope", **fields)
+    return TypeAdapter(envelope)
+
+
+@lru_cache(maxsize=None)
+def _get_response_constructors(response_class: type) -> Tuple[Tuple[str, Callable], ...]:
+    """Get the constructor of every field of a response class, once per class."""
+    return tuple(
+        (name, _get_constructor(annotation))
+        for name, annotation in get_type_hints(response_class).items()
+    )
+
+
+def _construct_response(response_class: Type[R], payload: Dict[str, Any]) -> R:
+    """Build a response object from a decoded response without validating it."""
+    response = object.__new__(response_class)
+    for name, construct in _get_response_constructors(response_class):
+        setattr(response, name, construct(payload[name]))
+
+    return response
+
+
+def parse_response(
+    response_class: Type[R],
+    payload: ResponsePayload,
+    response_mode: RESPONSE_MODE = "model",
+    json_decoder: Optional[JSONDecoder] = None,
+) -> Union[R, Dict[str, Any]]:
+    """
+    Build a response object from an API response.
+
+    Raw response bodies are validated directly from JSON by pydantic-core, without
+    decoding them to Python dicts first. List responses are decoded instead, and their
+    items validated on access, unless parsed within :func:`eager_validation`.
+
+    Args:
+        response_class: The response class to build, e.g. ``CustomerListResponse``
+        payload: The raw response body, or the already decoded response
+        response_mode: ``"model"`` to validate the response, ``"construct"`` to build the
+            models with ``model_construct`` without validation, ``"raw"`` to return the
+            decoded JSON
+        json_decoder: Decoder for raw response bodies that aren't validated from JSON
+
+    Returns:
+        An instance of the response class, or a dict in ``"raw"`` mode
+
+    Raises:
+        ValueError: If the response mode is unknown
+    """
+    if response_mode == "model":
+        if (
+            issubclass(response_class, LazyListResponse)
+            and not isinstance(payload, dict)
+            and not _eager_validation.get()
+        ):
+            payload = (json_decoder or get_json_decoder())(payload)
+
+        if isinstance(payload, dict):
+            return response_class(payload)
+
+        envelope = _get_response_adapter(response_class).validate_json(payload)
+
+        response = object.__new__(response_class)
+        for name in type(envelope).model_fields:
+            setattr(response, name, getattr(envelope, name))
+
+        return response
+
+    if response_mode not in RESPONSE_MODES:
+        raise ValueError(f"Unknown response mode: {response_mode}")
+
+    if not isinstance(payload, dict):
+        payload = (json_decoder or get_json_decoder())(payload)
+
+    if response_mode == "raw":
+        return payload
+
+    return _construct_response(response_class, payload)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional, Literal, Dict, Any, List
+from typing import Optional, Literal, Dict, Any, List, Sequence
 
 from pydantic import BaseModel
 
+from paddle.models.responses.base import LazyList, LazyListResponse
 from paddle.models.responses.shared import ImportMeta, MetaWithPagination, Meta
 
 
@@ -59,16 +60,16 @@ class CustomerPortalSessionData(BaseModel):
 
 
 @dataclass
-class CustomerListResponse:
+class CustomerListResponse(LazyListResponse):
     """
     Response for the Customer List endpoint.
     """
 
-    data: List[CustomerData]
+    data: Sequence[CustomerData]
     meta: MetaWithPagination
 
     def __init__(self, response: Dict[str, Any]):
-        self.data = [CustomerData(**item) for item in response["data"]]
+        self.data = LazyList(CustomerData, response["data"])
         self.meta = MetaWithPagination(**response["meta"])
 
 
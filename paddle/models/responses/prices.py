@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Literal, Optional, List, Dict, Any, TYPE_CHECKING, TypedDict
+from typing import Literal, Optional, List, Dict, Any, TYPE_CHECKING, TypedDict, Sequence
 
 from pydantic import BaseModel
 
 from paddle.utils.constants import CURRENCY_CODE, COUNTRY_CODE
+from paddle.models.responses.base import LazyList, LazyListResponse
 from paddle.models.responses.shared import ImportMeta, MetaWithPagination, Meta, BillingCycle
 
 if TYPE_CHECKING:
@@ -71,16 +72,16 @@ class PriceDataWithProduct(PriceData):
 
 
 @dataclass
-class PriceListResponse:
+class PriceListResponse(LazyListResponse):
     """
     Response for the Price List endpoint.
     """
 
-    data: List[PriceDataWithProduct]
+    data: Sequence[PriceDataWithProduct]
     meta: MetaWithPagination
 
     def __init__(self, response: Dict[str, Any]):
-        self.data = [PriceDataWithProduct(**item) for item in response["data"]]
+        self.data = LazyList(PriceDataWithProduct, response["data"])
         self.meta = MetaWithPagination(**response["meta"])
 
 
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional, Literal, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Literal, Dict, Any, List, TYPE_CHECKING, Sequence
 
 from pydantic import BaseModel
 
 from paddle.utils.constants import TAX_CATEGORY
+from paddle.models.responses.base import LazyList, LazyListResponse
 from paddle.models.responses.shared import (
     ImportMeta,
     Meta,
@@ -33,16 +34,16 @@ class ProductDataWithPrices(ProductData):
 
 
 @dataclass
-class ProductListResponse:
+class ProductListResponse(LazyListResponse):
     """
     Response for the Product List endpoint.
     """
 
-    data: List[ProductDataWithPrices]
+    data: Sequence[ProductDataWithPrices]
     meta: MetaWithPagination
 
     def __init__(self, response: Dict[str, Any]):
-        self.data = [ProductDataWithPrices(**item) for item in response["data"]]
+        self.data = LazyList(ProductDataWithPrices, response["data"])
         self.meta = MetaWithPagination(**response["meta"])
 
 
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional, Literal, TypedDict, Dict, Any, List
+from typing import Optional, Literal, TypedDict, Dict, Any, List, Sequence
 
 from pydantic import BaseModel
 
+from paddle.models.responses.base import LazyList, LazyListResponse
 from paddle.models.responses.shared import (
     BillingCycle,
     ImportMeta,
@@ -234,16 +235,16 @@ class PreviewUpdateData(SubscriptionBase):
 
 
 @dataclass
-class SubscriptionListResponse:
+class SubscriptionListResponse(LazyListResponse):
     """
     Response for the Subscription List endpoint.
     """
 
-    data: List[SubscriptionData]
+    data: Sequence[SubscriptionData]
     meta: MetaWithPagination
 
     def __init__(self, response: Dict[str, Any]):
-        self.data = [SubscriptionData(**item) for item in response["data"]]
+        self.data = LazyList(SubscriptionData, response["data"])
         self.meta = MetaWithPagination(**response["meta"])
 
 
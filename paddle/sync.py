@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from paddle.utils.checkpoints import CheckpointStore, MemoryCheckpointStore
+from paddle.utils.pagination import iter_pages
+
+if TYPE_CHECKING:
+    from paddle.client import Client
+
+# How each resource is listed: ``order_by`` returning the most recently updated entities
+# first when the endpoint supports it, and the filters listing every entity
+SYNCED_RESOURCES: Dict[str, Dict[str, Any]] = {
+    "products": {"order_by": "updated_at[DESC]", "status": ["active", "archived"]},
+    "prices": {"order_by": "id[ASC]", "status": ["active", "archived"]},
+    "customers": {"order_by": "id[ASC]", "status": ["active", "archived"]},
+    "subscriptions": {"order_by": "id[ASC]"},
+}
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp returned by Paddle.
+
+    Args:
+        value: The timestamp, such as ``2024-04-12T10:18:49.738972Z``
+
+    Returns:
+        The timezone aware datetime
+
+    Examples:
+        >>> parse_timestamp("2024-04-12T10:18:49.5Z") < parse_timestamp("2024-04-12T10:18:49.51Z")
+        True
+    """
+    value = value.replace("Z", "+00:00")
+    if "." in value:
+        # Python < 3.11 only parses 3 or 6 fractional digits
+        head, rest = value.split(".", 1)
+        digits = len(rest) - len(rest.lstrip("0123456789"))
+        value = f"{head}.{rest[:digits][:6].ljust(6, '0')}{rest[digits:]}"
+
+    return datetime.fromisoformat(value)
+
+
+def _get_updated_at(item: Any) -> str:
+    if isinstance(item, dict):
+        return item["updated_at"]
+    return item.updated_at
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a delta sync."""
+
+    resource: str
+    upserted: int
+    updated_at: Optional[str]
+
+
+class DeltaSync:
+    """
+    Incremental sync emitting the entities changed since the previous run.
+
+    Each run remembers the latest ``updated_at`` it has seen in a checkpoint store, and
+    the next run only emits the entities updated since. Products are listed by
+    ``updated_at`` descending, so a run stops at the first product older than the
+    checkpoint and only requests the pages with changes. The prices, customers and
+    subscriptions endpoints can't be ordered by ``updated_at``: they are listed in full,
+    but only changed entities are emitted.
+
+    The cursor of the next page is checkpointed after every page, so a run interrupted
+    by an error resumes where it stopped. Delivery is at least once: entities updated
+    at the exact checkpoint time, and pages emitted before a crash, are emitted again,
+    so ``on_upsert`` should be idempotent.
+
+    Args:
+        client: The client to list the entities with. Its response mode decides whether
+            models or decoded JSON are emitted, ``"raw"`` being the fastest
+        checkpoints: Store of the checkpoints, in memory by default
+        per_page: Number of entities requested per page
+
+    Examples:
+        >>> sync = DeltaSync(client, FileCheckpointStore("sync.json"))
+        >>> sync.run("subscriptions", lambda subscriptions: db.upsert(subscriptions))
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        checkpoints: Optional[CheckpointStore] = None,
+        *,
+        per_page: int = 200,
+    ):
+        self.client = client
+        self.checkpoints = checkpoints if checkpoints is not None else MemoryCheckpointStore()
+        self.per_page = per_page
+
+    def run(
+        self,
+        resource: str,
+        on_upsert: Callable[[List[Any]], Any],
+        *,
+        key: Optional[str] = None,
+        **filters: Any,
+    ) -> SyncResult:
+        """
+        Emit the entities of a resource changed since the previous run.
+
+        The first run, without a checkpoint, emits every entity.
+
+        Args:
+            resource: ``"products"``, ``"prices"``, ``"customers"`` or ``"subscriptions"``
+            on_upsert: Called with the changed entities of each page, before the page is
+                checkpointed
+            key: Key of the checkpoint, the resource name by default. Use different keys
+                for syncs of the same resource with different filters
+            **filters: Other filters of the resource's ``list`` method
+
+        Returns:
+            The number of emitted entities and the new checkpoint time
+
+        Raises:
+            PaddleAPIError: If a list request fails, the next run resumes from the last
+                checkpointed page
+        """
+        if resource not in SYNCED_RESOURCES:
+            raise ValueError(f"Unknown synced resource: {resource}")
+
+        key = key or resource
+        settings = SYNCED_RESOURCES[resource]
+        checkpoint = self.checkpoints.load(key) or {}
+        since = checkpoint.get("updated_at")
+        since_time = parse_timestamp(since) if since else None
+        latest = checkpoint.get("next_updated_at", since)
+        latest_time = parse_timestamp(latest) if latest else None
+        ordered = settings["order_by"].startswith("updated_at")
+
+        list_kwargs = {**settings, "per_page": self.per_page, **filters}
+        list_resource = getattr(self.client, resource).list
+        pages = iter_pages(
+            lambda cursor: list_resource(**list_kwargs, after=cursor), checkpoint.get("after")
+        )
+
+        upserted = 0
+        for items, after in pages:
+            changed = []
+            for item in items:
+                updated_at = _get_updated_at(item)
+                updated_time = parse_timestamp(updated_at)
+                if since_time is not None and updated_time < since_time:
+                    if ordered:
+                        # Every following entity is older
+                        after = None
+                        break
+                    continue
+
+                changed.append(item)
+                if latest_time is None or updated_time > latest_time:
+                    latest, latest_time = updated_at, updated_time
+
+            if changed:
+                on_upsert(changed)
+                upserted += len(changed)
+
+            if after is None:
+                break
+            self.checkpoints.save(
+                key, {"updated_at": since, "next_updated_at": latest, "after": after}
+            )
+
+        self.checkpoints.save(key, {"updated_at": latest})
+        return SyncResult(resource=resource, upserted=upserted, updated_at=latest)
+
+    def reset(self, key: str) -> None:
+        """
+        Forget a checkpoint, the next run emits every entity again.
+
+        Args:
+            key: Key of the checkpoint, the resource name by default
+        """
+        self.checkpoints.save(key, None)
@@ -0,0 +1,641 @@
+import json
+import time
+import random
+import asyncio
+import threading
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl
+
+import httpx
+
+from paddle.utils.sharding import encode_id
+
+# Resources served by the fake API, and the prefix of their IDs
+RESOURCES = {"customers": "ctm_", "products": "pro_", "prices": "pri_", "subscriptions": "sub_"}
+
+# Resources that can be created with a POST request, subscriptions come from checkouts
+CREATABLE = ("customers", "products", "prices")
+
+# Resources listing only active entities without a status filter, like Paddle
+ACTIVE_BY_DEFAULT = ("customers", "products", "prices")
+
+# Query parameters that aren't filters on a field of the same name
+_NOT_FILTERS = {"after", "per_page", "order_by", "include"}
+
+# The time of the first generated ID, IDs of later entities are 1 millisecond apart
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+# A response before serialization: status, headers and JSON content
+Reply = Tuple[int, Dict[str, str], Dict[str, Any]]
+
+
+class FakePaddleAPI:
+    """
+    In-process stand-in for the Paddle API, to test and benchmark clients without network.
+
+    It serves ``/customers``, ``/products``, ``/prices`` and ``/subscriptions``: listing
+    with filters, ``order_by``, ``include`` and cursor pagination like Paddle, getting,
+    creating and updating entities. Entities are kept in memory and validate against the
+    SDK's response models. Like Paddle, customers, products and prices are only listed
+    when active, unless a ``status`` filter is given.
+
+    Lists are served from cached sorted IDs of each filter and order. Change entities with
+    requests, or edit ``entities`` in place before the first list request only.
+
+    Use it as an httpx transport, or as an ASGI app served by any ASGI server. Latency,
+    server errors and rate limiting can be added to exercise retries and rate limiting.
+
+    Args:
+        latency: Seconds each request takes
+        jitter: Maximum random seconds added to the latency
+        error_rate: Share of requests failing with one of ``error_statuses``
+        error_statuses: Statuses of the failed requests
+        rate_limit_rate: Share of requests failing with a 429
+        requests_per_second: Sustained requests per second allowed before answering 429,
+            like Paddle's per IP limit. No limit by default
+        retry_after: ``Retry-After`` seconds of the 429 responses
+        seed: Seed of the random numbers, for reproducible data and failures
+
+    Examples:
+        >>> api = FakePaddleAPI(latency=0.05, error_rate=0.01)
+        >>> api.populate(customers=10_000, products=20, subscriptions=5_000)
+        >>> client = Client(api_key="fake-key", transport=api.transport())
+        >>> sum(1 for _ in client.customers.iter_all())
+        10000
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503),
+        rate_limit_rate: float = 0.0,
+        requests_per_second: Optional[float] = None,
+        retry_after: int = 1,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.rate_limit_rate = rate_limit_rate
+        self.requests_per_second = requests_per_second
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+        self.entities: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in RESOURCES}
+        self.requests = 0
+        """Number of requests received"""
+        self.responses: Counter = Counter()
+        """Number of responses sent, by status code"""
+
+        self._indexes: Dict[Tuple[Any, ...], Tuple[Any, List[str], Dict[str, int]]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self._injected: Deque[Tuple[int, Optional[int]]] = deque()
+        self._sequence = 0
+        self._tokens = requests_per_second or 0.0
+        self._refilled_at = time.monotonic()
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        Get a transport for ``Client``, sleeping through the latency.
+
+        Returns:
+            The ``httpx`` transport
+        """
+        return httpx.MockTransport(self._handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """
+        Get a transport for ``AsyncClient``, awaiting the latency.
+
+        Returns:
+            The ``httpx`` transport
+        """
+        return httpx.MockTransport(self._ahandle)
+
+    def inject(self, status: int, count: int = 1, retry_after: Optional[int] = None) -> None:
+        """
+        Make the next requests fail, whatever the error rates.
+
+        Args:
+            status: Status of the failed responses, such as 429 or 503
+            count: Number of requests to fail
+            retry_after: ``Retry-After`` seconds of the responses, none by default
+        """
+        with self._lock:
+            self._injected.extend([(status, retry_after)] * count)
+
+    def reset_stats(self) -> None:
+        """Forget the counted requests and responses."""
+        with self._lock:
+            self.requests = 0
+            self.responses.clear()
+
+    def populate(
+        self,
+        *,
+        customers: int = 0,
+        products: int = 0,
+        prices_per_product: int = 2,
+        subscriptions: int = 0,
+        currency_codes: Sequence[str] = ("USD", "EUR", "GBP"),
+    ) -> None:
+        """
+        Add random entities.
+
+        Subscriptions belong to random existing customers, one is created if there are
+        none, and have one or two items of random existing recurring prices, in the same
+        currency and billing cycle.
+
+        Args:
+            customers: Number of customers to add
+            products: Number of products to add
+            prices_per_product: Number of prices of each new product, alternating
+                monthly and yearly
+            subscriptions: Number of subscriptions to add
+            currency_codes: Currencies of the prices and subscriptions
+        """
+        with self._lock:
+            for _ in range(customers):
+                self._add_customer({})
+            for _ in range(products):
+                product = self._add_product({})
+                for index in range(prices_per_product):
+                    interval = "month" if index % 2 == 0 else "year"
+                    self._add_price(
+                        {
+                            "product_id": product["id"],
+                            "billing_cycle": {"frequency": 1, "interval": interval},
+                            "unit_price": {
+                                "amount": str(self.random.randrange(500, 50_000, 100)),
+                                "currency_code": self.random.choice(currency_codes),
+                            },
+                        }
+                    )
+
+            if subscriptions and not self.entities["customers"]:
+                self._add_customer({})
+            customer_ids = list(self.entities["customers"])
+            prices = [price for price in self.entities["prices"].values() if price["billing_cycle"]]
+            for _ in range(subscriptions):
+                items = [self.random.choice(prices)] if prices else []
+                if items and self.random.random() < 0.3:
+                    others = [
+                        price
+                        for price in prices
+                        if price["unit_price"]["currency_code"]
+                        == items[0]["unit_price"]["currency_code"]
+                        and price["billing_cycle"] == items[0]["billing_cycle"]
+                        and price is not items[0]
+                    ]
+                    items.extend(self.random.sample(others, min(len(others), 1)))
+                self._add_subscription(self.random.choice(customer_ids), items)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """Serve requests as an ASGI app."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        headers = {key.decode(): value.decode() for key, value in scope["headers"]}
+        host = headers.get("host", "localhost")
+        query = dict(parse_qsl(scope["query_string"].decode()))
+
+        await asyncio.sleep(self._get_latency())
+        status, response_headers, content = self.dispatch(
+            scope["method"], scope["path"], query, body, f"{scope['scheme']}://{host}"
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (key.encode(), value.encode()) for key, value in response_headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def dispatch(
+        self, method: str, path: str, query: Dict[str, str], body: bytes, base_url: str
+    ) -> Response:
+        """
+        Answer a request, without latency.
+
+        Args:
+            method: The HTTP method
+            path: The URL path, such as ``/customers/ctm_01``
+            query: The query parameters
+            body: The JSON body
+            base_url: Scheme and host of the API, for the pagination links
+
+        Returns:
+            The status, headers and body of the response
+        """
+        with self._lock:
+            self.requests += 1
+            status, headers, content = self._failure() or self._route(
+                method, path, query, body, base_url
+            )
+            content["meta"] = {
+                "request_id": f"fake-{self.random.getrandbits(64):016x}",
+                **content.get("meta", {}),
+            }
+            self.responses[status] += 1
+            # Serialized within the lock, entities may be updated by other requests
+            encoded = json.dumps(content).encode()
+
+        return status, {"Content-Type": "application/json", **headers}, encoded
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self._get_latency())
+        return self._to_response(request)
+
+    async def _ahandle(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self._get_latency())
+        return self._to_response(request)
+
+    def _to_response(self, request: httpx.Request) -> httpx.Response:
+        status, headers, content = self.dispatch(
+            request.method,
+            request.url.path,
+            dict(request.url.params),
+            request.content,
+            f"{request.url.scheme}://{request.url.netloc.decode()}",
+        )
+        return httpx.Response(status, headers=headers, content=content)
+
+    def _get_latency(self) -> float:
+        return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _failure(self) -> Optional[Reply]:
+        """Get the injected or random failure of a request, if it fails."""
+        if self._injected:
+            status, retry_after = self._injected.popleft()
+            return _error(status, "injected_error", "Injected failure", retry_after)
+
+        if self.requests_per_second is not None:
+            now = time.monotonic()
+            self._tokens = min(
+                self.requests_per_second,
+                self._tokens + (now - self._refilled_at) * self.requests_per_second,
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return _rate_limited(self.retry_after)
+            self._tokens -= 1
+
+        if self.rate_limit_rate and self.random.random() < self.rate_limit_rate:
+            return _rate_limited(self.retry_after)
+        if self.error_rate and self.random.random() < self.error_rate:
+            status = self.random.choice(self.error_statuses)
+            return _error(status, "internal_error", "Injected server error")
+
+        return None
+
+    def _route(
+        self, method: str, path: str, query: Dict[str, str], body: bytes, base_url: str
+    ) -> Reply:
+        parts = path.strip("/").split("/")
+        resource = parts[0]
+        if resource not in RESOURCES or len(parts) > 2:
+            return _error(404, "not_found", f"Path {path} not found")
+
+        if len(parts) == 1:
+            if method == "GET":
+                return self._list(resource, query, base_url)
+            if method == "POST" and resource in CREATABLE:
+                return _json(201, {"data": self._create(resource, _load_body(body))})
+            return _error(405, "method_not_allowed", f"{method} {path} not allowed")
+
+        entity = self.entities[resource].get(parts[1])
+        if entity is None:
+            return _error(404, "entity_not_found", f"Entity {parts[1]} not found")
+        if method == "GET":
+            return _json(200, {"data": self._include(resource, entity, query)})
+        if method == "PATCH":
+            entity.update(_load_body(body))
+            self._version += 1
+            entity["updated_at"] = _format_time(datetime.now(timezone.utc))
+            return _json(200, {"data": entity})
+
+        return _error(405, "method_not_allowed", f"{method} {path} not allowed")
+
+    def _list(self, resource: str, query: Dict[str, str], base_url: str) -> Reply:
+        try:
+            per_page = int(query.get("per_page", 50))
+        except ValueError:
+            per_page = 0
+        if not 1 <= per_page <= 200:
+            return _error(400, "invalid_field", "per_page must be between 1 and 200")
+
+        field, descending = "id", False
+        if "order_by" in query:
+            field, _, direction = query["order_by"].rstrip("]").partition("[")
+            descending = direction == "DESC"
+
+        filters = {name: value for name, value in query.items() if name not in _NOT_FILTERS}
+        if resource in ACTIVE_BY_DEFAULT:
+            filters.setdefault("status", "active")
+        ids, positions = self._sorted_ids(resource, filters, field)
+        after = query.get("after")
+        if descending:
+            # Pages walk the ascending IDs backwards, from before the cursor
+            if after is None:
+                end = len(ids)
+            elif field == "id":
+                # IDs are compared, so the cursor doesn't need to be an existing entity
+                end = bisect_left(ids, after)
+            else:
+                end = positions.get(after, 0)
+            page_ids = ids[max(0, end - per_page) : end][::-1]
+            remaining = end
+        else:
+            if after is None:
+                start = 0
+            elif field == "id":
+                start = bisect_right(ids, after)
+            else:
+                start = positions[after] + 1 if after in positions else len(ids)
+            page_ids = ids[start : start + per_page]
+            remaining = len(ids) - start
+
+        page = [self.entities[resource][id] for id in page_ids]
+        total = len(ids)
+
+        next_query = {**query, "after": page[-1]["id"]} if page else query
+        return _json(
+            200,
+            {
+                "data": [self._include(resource, entity, query) for entity in page],
+                "meta": {
+                    "pagination": {
+                        "per_page": per_page,
+                        "next": f"{base_url}/{resource}?{httpx.QueryParams(next_query)}",
+                        "has_more": remaining > per_page,
+                        "estimated_total": total,
+                    },
+                },
+            },
+        )
+
+    def _sorted_ids(
+        self, resource: str, filters: Dict[str, str], field: str
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Get the IDs of the entities matching filters in ascending order of a field, and the
+        position of each ID when not ordered by ID, cached until entities change.
+        """
+        entities = self.entities[resource]
+        key = (resource, tuple(sorted(filters.items())), field)
+        # Rebuilt after requests changing entities, or entities added or removed in place
+        version = (self._version, len(entities))
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] != version:
+            matching = [
+                entity
+                for entity in entities.values()
+                if all(_matches(entity, name, value) for name, value in filters.items())
+            ]
+            if field == "id":
+                ids, positions = sorted(entity["id"] for entity in matching), {}
+            else:
+                matching.sort(key=lambda entity: _sort_key(_get_field(entity, field), entity["id"]))
+                ids = [entity["id"] for entity in matching]
+                positions = {id: position for position, id in enumerate(ids)}
+            cached = self._indexes[key] = (version, ids, positions)
+
+        return cached[1], cached[2]
+
+    def _include(
+        self, resource: str, entity: Dict[str, Any], query: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Add the related entities asked with ``include``."""
+        include = query.get("include", "").split(",")
+        if resource == "products" and "prices" in include:
+            prices = self.entities["prices"].values()
+            return {
+                **entity,
+                "prices": [price for price in prices if price["product_id"] == entity["id"]],
+            }
+        if resource == "prices" and "product" in include:
+            return {**entity, "product": self.entities["products"].get(entity["product_id"])}
+
+        return entity
+
+    def _create(self, resource: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        if resource == "customers":
+            return self._add_customer(fields)
+        if resource == "products":
+            return self._add_product(fields)
+        return self._add_price(fields)
+
+    def _new_id(self, resource: str) -> Tuple[str, str]:
+        """Get a new ID and its creation time, IDs sort by creation like Paddle's."""
+        self._sequence += 1
+        created = _EPOCH + timedelta(milliseconds=self._sequence)
+        value = (int(created.timestamp() * 1000) << 80) | self.random.getrandbits(80)
+        return encode_id(RESOURCES[resource], value), _format_time(created)
+
+    def _add(self, resource: str, entity: Dict[str, Any]) -> Dict[str, Any]:
+        self.entities[resource][entity["id"]] = entity
+        self._version += 1
+        return entity
+
+    def _add_customer(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        id, created_at = self._new_id("customers")
+        return self._add(
+            "customers",
+            {
+                "id": id,
+                "name": f"Customer {self._sequence}",
+                "email": f"customer{self._sequence}@example.com",
+                "marketing_consent": False,
+                "status": "active",
+                "custom_data": None,
+                "locale": "en",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "import_meta": None,
+                **fields,
+            },
+        )
+
+    def _add_product(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        id, created_at = self._new_id("products")
+        return self._add(
+            "products",
+            {
+                "id": id,
+                "name": f"Product {self._sequence}",
+                "description": None,
+                "type": "standard",
+                "tax_category": "standard",
+                "image_url": None,
+                "custom_data": None,
+                "status": "active",
+                "import_meta": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+                **fields,
+            },
+        )
+
+    def _add_price(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        id, created_at = self._new_id("prices")
+        return self._add(
+            "prices",
+            {
+                "id": id,
+                "product_id": None,
+                "description": "Price",
+                "type": "standard",
+                "name": None,
+                "billing_cycle": {"frequency": 1, "interval": "month"},
+                "trial_period": None,
+                "tax_mode": "account_setting",
+                "unit_price": {"amount": "1000", "currency_code": "USD"},
+                "unit_price_overrides": [],
+                "quantity": {"minimum": 1, "maximum": 100},
+                "status": "active",
+                "custom_data": None,
+                "import_meta": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+                **fields,
+            },
+        )
+
+    def _add_subscription(self, customer_id: str, prices: List[Dict[str, Any]]) -> Dict[str, Any]:
+        id, created_at = self._new_id("subscriptions")
+        billing_cycle = prices[0]["billing_cycle"] if prices else None
+        billing_cycle = billing_cycle or {"frequency": 1, "interval": "month"}
+        return self._add(
+            "subscriptions",
+            {
+                "id": id,
+                "status": "active",
+                "customer_id": customer_id,
+                "address_id": encode_id("add_", self.random.getrandbits(128)),
+                "business_id": None,
+                "currency_code": prices[0]["unit_price"]["currency_code"] if prices else "USD",
+                "created_at": created_at,
+                "updated_at": created_at,
+                "started_at": created_at,
+                "first_billed_at": created_at,
+                "next_billed_at": None,
+                "paused_at": None,
+                "canceled_at": None,
+                "discount": None,
+                "collection_mode": "automatic",
+                "billing_details": None,
+                "current_billing_period": None,
+                "billing_cycle": billing_cycle,
+                "scheduled_change": None,
+                "management_urls": {
+                    "update_payment_method": None,
+                    "cancel": f"https://example.com/subscriptions/{id}/cancel",
+                },
+                "items": [
+                    {
+                        "status": "active",
+                        "quantity": self.random.randint(1, 5),
+                        "recurring": True,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                        "previously_billed_at": None,
+                        "next_billed_at": None,
+                        "trial_dates": None,
+                        "price": price,
+                        "product": self.entities["products"].get(price["product_id"]),
+                    }
+                    for price in prices
+                ],
+                "custom_data": None,
+                "import_meta": None,
+            },
+        )
+
+
+def _get_field(entity: Dict[str, Any], field: str) -> Any:
+    """Get a field of an entity, dotted for nested fields."""
+    value: Any = entity
+    for name in field.split("."):
+        value = value.get(name) if isinstance(value, dict) else None
+
+    return value
+
+
+def _sort_key(value: Any, id: str) -> Tuple[bool, str, str]:
+    # Nulls last, values compared as strings since fields are either numbers or strings
+    return value is None, json.dumps(value) if not isinstance(value, str) else value, id
+
+
+def _matches(entity: Dict[str, Any], name: str, value: str) -> bool:
+    """Whether an entity passes a list filter."""
+    values = value.split(",")
+    if name == "price_id":
+        return any(item["price"]["id"] in values for item in entity.get("items", []))
+    if name == "scheduled_change_action":
+        change = entity.get("scheduled_change")
+        return change is not None and change["action"] in values
+    if name == "recurring":
+        return (entity.get("billing_cycle") is not None) == (value == "true")
+
+    return str(_get_field(entity, name)) in values
+
+
+def _format_time(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _load_body(body: bytes) -> Dict[str, Any]:
+    return json.loads(body) if body else {}
+
+
+def _json(status: int, content: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Reply:
+    return status, headers or {}, content
+
+
+def _error(status: int, code: str, detail: str, retry_after: Optional[int] = None) -> Reply:
+    """Build an error response, in the format of Paddle's."""
+    error_type = "api_error" if status >= 500 else "request_error"
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+    return _json(
+        status,
+        {
+            "error": {
+                "type": error_type,
+                "code": code,
+                "detail": detail,
+                "documentation_url": f"https://developer.paddle.com/errors/shared/{code}",
+            }
+        },
+        headers,
+    )
+
+
+def _rate_limited(retry_after: int) -> Reply:
+    return _error(429, "too_many_requests", "Too many requests", retry_after)
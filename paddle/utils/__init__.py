@@ -1,3 +1,18 @@
-__all__ = ["handle_status_code", "is_retryable_status_code", "get_retry_delay"]
+__all__ = [
+    "handle_status_code",
+    "is_retryable_status_code",
+    "get_retry_delay",
+    "parse_retry_after",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryBudget",
+]
 
-from .request import handle_status_code, is_retryable_status_code, get_retry_delay
+from .request import (
+    handle_status_code,
+    is_retryable_status_code,
+    get_retry_delay,
+    parse_retry_after,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, RetryBudget
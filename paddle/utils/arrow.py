@@ -0,0 +1,135 @@
+import os
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from paddle.utils.export import KEEP_AS_JSON, flatten, model_columns, to_json_value
+
+
+def model_schema(
+    model: Type[BaseModel], explode: Optional[str] = None, columns: Optional[Sequence[str]] = None
+) -> Any:
+    """
+    Get the Arrow schema of the flattened entities of a response model.
+
+    Requires ``pyarrow``.
+
+    Args:
+        model: The response model of the entities
+        explode: Name of the list field exported as one record per element
+        columns: Columns to keep, all of them by default
+
+    Returns:
+        The ``pyarrow.Schema``, with ``bool``, ``int64``, ``float64`` and ``string`` columns
+
+    Raises:
+        KeyError: If a column isn't one of the model
+    """
+    import pyarrow as pa
+
+    types = {bool: pa.bool_(), int: pa.int64(), float: pa.float64(), str: pa.string()}
+    model_types = model_columns(model, explode)
+    names = list(columns) if columns is not None else list(model_types)
+
+    return pa.schema([(name, types[model_types[name]]) for name in names])
+
+
+def iter_record_batches(
+    pages: Iterable[List[Dict[str, Any]]], schema: Any = None, batch_size: int = 10_000
+) -> Iterator[Any]:
+    """
+    Turn pages of entities into Arrow record batches of flattened entities.
+
+    Pages are buffered until ``batch_size`` entities, so the batches, and the Parquet row
+    groups written from them, don't get as small as a page.
+
+    Requires ``pyarrow``.
+
+    Args:
+        pages: The decoded JSON entities of each page
+        schema: Schema of the batches. By default it is inferred from the first batch,
+            with the columns that are always null typed as strings
+        batch_size: Number of entities per batch
+
+    Yields:
+        The ``pyarrow.RecordBatch`` objects
+    """
+    import pyarrow as pa
+
+    rows: List[Dict[str, Any]] = []
+    for items in pages:
+        for item in items:
+            rows.append(
+                {
+                    key: to_json_value(value)
+                    for key, value in flatten(item, keep=KEEP_AS_JSON).items()
+                }
+            )
+        while len(rows) >= batch_size:
+            batch, rows = rows[:batch_size], rows[batch_size:]
+            schema = schema if schema is not None else _infer_schema(batch)
+            yield pa.RecordBatch.from_pylist(batch, schema=schema)
+
+    if rows:
+        schema = schema if schema is not None else _infer_schema(rows)
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def _infer_schema(rows: List[Dict[str, Any]]) -> Any:
+    import pyarrow as pa
+
+    # Unlike ``from_pylist``, inferring a struct type looks at the keys of every row
+    fields = pa.array(rows).type
+
+    return pa.schema(
+        [
+            (field.name, pa.string() if pa.types.is_null(field.type) else field.type)
+            for field in fields
+        ]
+    )
+
+
+def write_parquet(
+    pages: Iterable[List[Dict[str, Any]]],
+    path: Union[str, os.PathLike],
+    schema: Any = None,
+    batch_size: int = 10_000,
+    compression: str = "snappy",
+) -> int:
+    """
+    Write pages of entities to a Parquet file, one row group per batch.
+
+    Requires ``pyarrow``.
+
+    Args:
+        pages: The decoded JSON entities of each page
+        path: Path of the file
+        schema: Schema of the file, see :func:`iter_record_batches`
+        batch_size: Number of entities per row group
+        compression: Parquet codec, such as ``"snappy"``, ``"zstd"`` or ``"none"``
+
+    Returns:
+        The number of written entities
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    count = 0
+    writer = None
+    try:
+        for batch in iter_record_batches(pages, schema, batch_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+            writer.write_batch(batch)
+            count += batch.num_rows
+
+        if writer is None:
+            # An empty export still gets a valid file
+            schema = schema if schema is not None else pa.schema([])
+            writer = pq.ParquetWriter(path, schema, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return count
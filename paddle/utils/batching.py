@@ -0,0 +1,92 @@
+from typing import Any, Dict, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+# Paddle returns at most 200 entities per page
+MAX_IDS_PER_REQUEST = 200
+
+# Every status of customers, products and prices, whose list endpoints only return active
+# entities by default
+ALL_STATUSES = ["active", "archived"]
+
+# Keep the id filter below the common 8 KB URL length limit of proxies and servers, which
+# still fits 200 Paddle IDs
+MAX_ID_FILTER_LENGTH = 7500
+
+
+class GetManyResult(Dict[str, T]):
+    """
+    Entities fetched by ID, keyed by ID.
+
+    Args:
+        missing: The requested IDs that were not returned, in request order
+    """
+
+    def __init__(self, *args: Any, missing: List[str], **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.missing = missing
+
+
+def chunk_ids(
+    ids: Iterable[str],
+    max_ids: int = MAX_IDS_PER_REQUEST,
+    max_length: int = MAX_ID_FILTER_LENGTH,
+) -> List[List[str]]:
+    """
+    Split IDs into chunks that each fit in one ``id`` filtered list request.
+
+    Duplicates are dropped and the order of the IDs is kept.
+
+    Args:
+        ids: The IDs to split
+        max_ids: Maximum number of IDs per chunk
+        max_length: Maximum length of the URL encoded, comma separated IDs of a chunk
+
+    Returns:
+        The chunks of IDs
+
+    Examples:
+        >>> chunk_ids(["ctm_1", "ctm_2", "ctm_1", "ctm_3"], max_ids=2)
+        [['ctm_1', 'ctm_2'], ['ctm_3']]
+    """
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    length = 0
+
+    for id in dict.fromkeys(ids):
+        # Commas are URL encoded as %2C
+        id_length = len(id) + 3
+        if chunk and (len(chunk) >= max_ids or length + id_length > max_length):
+            chunks.append(chunk)
+            chunk, length = [], 0
+
+        chunk.append(id)
+        length += id_length
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def collect_by_id(ids: Iterable[List[str]], pages: Iterable[Any]) -> GetManyResult:
+    """
+    Key the items of list responses by ID.
+
+    Args:
+        ids: The requested chunks of IDs
+        pages: The list responses, or their decoded JSON in raw response mode
+
+    Returns:
+        The items keyed by ID, with the IDs that were not returned in ``missing``
+    """
+    found = {}
+    for page in pages:
+        for item in page["data"] if isinstance(page, dict) else page.data:
+            found[item["id"] if isinstance(item, dict) else item.id] = item
+
+    requested = [id for chunk in ids for id in chunk]
+    return GetManyResult(
+        {id: found[id] for id in requested if id in found},
+        missing=[id for id in requested if id not in found],
+    )
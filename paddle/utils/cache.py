@@ -0,0 +1,242 @@
+import time
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Mapping, Optional, Tuple
+
+# Resources returning each other's data through ``include``, e.g. products with their prices
+RELATED_RESOURCES = {
+    "products": ("prices",),
+    "prices": ("products",),
+}
+
+MISSING = object()
+
+
+def split_path(path: str) -> Tuple[str, Optional[str]]:
+    """
+    Get the resource and entity ID of an API endpoint path.
+
+    Args:
+        path: API endpoint path, such as ``/products/pro_01``
+
+    Returns:
+        The resource name and the entity ID, or None for collection paths
+
+    Examples:
+        >>> split_path("/products/pro_01")
+        ('products', 'pro_01')
+        >>> split_path("/prices")
+        ('prices', None)
+    """
+    parts = path.strip("/").split("/", 2)
+    return parts[0], parts[1] if len(parts) > 1 else None
+
+
+@dataclass
+class CacheStats:
+    """Counters of a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry:
+    """A cached response and what it was fetched from."""
+
+    __slots__ = ("value", "expires_at", "resource", "entity_id")
+
+    def __init__(self, value: Any, expires_at: float, resource: str, entity_id: Optional[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.resource = resource
+        self.entity_id = entity_id
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of GET responses with a time to live per resource.
+
+    Entries are dropped once their TTL has passed, and the least recently used entry is
+    evicted when the cache is full. Writes made through a client using the cache
+    invalidate the entries of the entity they changed, the collections of its resource
+    and the resources including it.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a response stays cached, 0 to not cache responses by default
+        resource_ttls: TTL per resource name (``"products"``, ``"prices"``, ...), overriding
+            ``ttl``
+        timer: Monotonic clock returning seconds
+
+    Examples:
+        >>> cache = ResponseCache(ttl=0, resource_ttls={"products": 300, "prices": 300})
+        >>> client = Client(api_key="...", cache=cache)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        resource_ttls: Optional[Mapping[str, float]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than or equal to 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.resource_ttls = dict(resource_ttls or {})
+        self.timer = timer
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._generation = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                size=len(self._entries),
+            )
+
+    @property
+    def generation(self) -> int:
+        """Counter increased by every invalidation, see ``set``."""
+        return self._generation
+
+    def get_ttl(self, resource: str) -> float:
+        """
+        Get the TTL of a resource.
+
+        Args:
+            resource: The resource name
+
+        Returns:
+            The TTL in seconds, 0 or less if the resource isn't cached
+        """
+        return self.resource_ttls.get(resource, self.ttl)
+
+    def is_cached(self, path: str) -> bool:
+        """
+        Check whether responses of an API endpoint are cached.
+
+        Args:
+            path: API endpoint path
+
+        Returns:
+            Whether the TTL of the path's resource is greater than 0
+        """
+        return self.get_ttl(split_path(path)[0]) > 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a cached response.
+
+        Args:
+            key: The request key
+
+        Returns:
+            The cached response, or ``MISSING``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self.timer():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._stats.misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, path: str, generation: Optional[int] = None) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: The request key
+            value: The response
+            path: API endpoint path the response was fetched from
+            generation: ``generation`` read before sending the request. The response isn't
+                cached if an invalidation happened since, it may predate the change.
+        """
+        resource, entity_id = split_path(path)
+        ttl = self.get_ttl(resource)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._entries[key] = _Entry(value, self.timer() + ttl, resource, entity_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, resource: Optional[str] = None, entity_id: Optional[str] = None) -> int:
+        """
+        Drop cached responses that may be outdated by a change.
+
+        Args:
+            resource: The changed resource, every response is dropped if not given
+            entity_id: The changed entity, every response of the resource is dropped if not
+                given. Otherwise only the responses of the entity and the collections of the
+                resource are.
+
+        Returns:
+            The number of dropped responses
+        """
+        related = RELATED_RESOURCES.get(resource, ()) if resource is not None else ()
+
+        def is_outdated(entry: _Entry) -> bool:
+            if resource is None or entry.resource in related:
+                return True
+            if entry.resource != resource:
+                return False
+            return entity_id is None or entry.entity_id in (None, entity_id)
+
+        with self._lock:
+            self._generation += 1
+            keys = [key for key, entry in self._entries.items() if is_outdated(entry)]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+
+            return len(keys)
+
+    def invalidate_path(self, path: str) -> int:
+        """
+        Drop cached responses that may be outdated by a write to an API endpoint.
+
+        Args:
+            path: API endpoint path of the write, such as ``/products/pro_01``
+
+        Returns:
+            The number of dropped responses
+        """
+        return self.invalidate(*split_path(path))
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.invalidate()
@@ -0,0 +1,101 @@
+import os
+import json
+import tempfile
+import threading
+
+from typing import Any, Dict, Optional
+
+
+class CheckpointStore:
+    """
+    Base class of stores keeping the progress of long running jobs, such as syncs.
+
+    Checkpoints are small JSON serializable dicts saved under a key. Subclasses implement
+    ``load`` and ``save`` on top of any storage, e.g. a database table or Redis.
+    """
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a checkpoint.
+
+        Args:
+            key: The key of the checkpoint
+
+        Returns:
+            The checkpoint, or None if none was saved
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, checkpoint: Optional[Dict[str, Any]]) -> None:
+        """
+        Save a checkpoint, replacing the previous one.
+
+        Args:
+            key: The key of the checkpoint
+            checkpoint: The checkpoint, None to delete it
+        """
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store keeping checkpoints in memory, for the lifetime of the process."""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        checkpoint = self._checkpoints.get(key)
+        return dict(checkpoint) if checkpoint is not None else None
+
+    def save(self, key: str, checkpoint: Optional[Dict[str, Any]]) -> None:
+        if checkpoint is None:
+            self._checkpoints.pop(key, None)
+        else:
+            self._checkpoints[key] = dict(checkpoint)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store keeping every checkpoint in one JSON file.
+
+    The file is replaced atomically on each save, so a crash never leaves a partially
+    written checkpoint behind.
+
+    Args:
+        path: Path of the JSON file, created on the first save
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, checkpoint: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoint is None:
+                checkpoints.pop(key, None)
+            else:
+                checkpoints[key] = checkpoint
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump(checkpoints, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
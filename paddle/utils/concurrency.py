@@ -0,0 +1,204 @@
+import asyncio
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+ItemT = TypeVar("ItemT")
+R = TypeVar("R")
+
+
+@dataclass
+class BulkResult(Generic[ItemT, R]):
+    """
+    Outcome of one item of a bulk operation.
+
+    Args:
+        index: Position of the item in the input
+        item: The input item
+        result: The result of the operation, if it succeeded
+        error: The exception raised by the operation, if it failed
+    """
+
+    index: int
+    item: ItemT
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than or equal to 1")
+
+
+def map_concurrently(
+    func: Callable[[ItemT], R],
+    items: Iterable[ItemT],
+    concurrency: int = 10,
+    ordered: bool = True,
+) -> Iterator[BulkResult[ItemT, R]]:
+    """
+    Call a function on every item from a thread pool, with bounded concurrency.
+
+    Items are read from the iterable as results are consumed, so the input can be a
+    generator over millions of items. Errors are returned as results instead of stopping
+    the iteration.
+
+    Args:
+        func: Function to call with each item
+        items: The input items
+        concurrency: Maximum number of calls running at once
+        ordered: Whether results are yielded in input order, rather than as they complete.
+            Ordered results buffer up to twice ``concurrency`` calls so a slow call doesn't
+            leave the pool idle.
+
+    Yields:
+        A ``BulkResult`` per item
+    """
+    _check_concurrency(concurrency)
+
+    def call(index: int, item: ItemT) -> BulkResult[ItemT, R]:
+        try:
+            return BulkResult(index, item, result=func(item))
+        except Exception as e:
+            return BulkResult(index, item, error=e)
+
+    window = concurrency * 2 if ordered else concurrency
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    ordered_pending: Deque[Future] = deque()
+    pending: Set[Future] = set()
+
+    def next_results() -> Iterator[BulkResult[ItemT, R]]:
+        nonlocal pending
+        if ordered:
+            yield ordered_pending.popleft().result()
+        else:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    try:
+        for index, item in enumerate(items):
+            if len(ordered_pending) + len(pending) >= window:
+                yield from next_results()
+
+            future = executor.submit(call, index, item)
+            if ordered:
+                ordered_pending.append(future)
+            else:
+                pending.add(future)
+
+        while ordered_pending or pending:
+            yield from next_results()
+    finally:
+        # Don't start calls for items the consumer won't read
+        for future in (*ordered_pending, *pending):
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def _aenumerate(
+    items: Union[Iterable[ItemT], AsyncIterable[ItemT]],
+) -> AsyncIterator[Tuple[int, ItemT]]:
+    index = 0
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for item in items:
+            yield index, item
+            index += 1
+
+
+async def amap_concurrently(
+    func: Callable[[ItemT], Awaitable[R]],
+    items: Union[Iterable[ItemT], AsyncIterable[ItemT]],
+    concurrency: int = 10,
+    ordered: bool = True,
+) -> AsyncIterator[BulkResult[ItemT, R]]:
+    """
+    Await a coroutine function on every item, with bounded concurrency.
+
+    Items are read from the iterable as results are consumed, so the input can be a
+    generator over millions of items. Errors are returned as results instead of stopping
+    the iteration.
+
+    Args:
+        func: Coroutine function to await with each item
+        items: The input items, an iterable or an asynchronous iterable
+        concurrency: Maximum number of calls running at once
+        ordered: Whether results are yielded in input order, rather than as they complete.
+            Ordered results buffer up to twice ``concurrency`` calls so a slow call doesn't
+            leave the other slots idle.
+
+    Yields:
+        A ``BulkResult`` per item
+    """
+    _check_concurrency(concurrency)
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def call(index: int, item: ItemT) -> BulkResult[ItemT, R]:
+        async with slots:
+            try:
+                return BulkResult(index, item, result=await func(item))
+            except Exception as e:
+                return BulkResult(index, item, error=e)
+
+    window = concurrency * 2 if ordered else concurrency
+    ordered_pending: Deque[asyncio.Future] = deque()
+    pending: Set[asyncio.Future] = set()
+
+    async def next_results() -> List[BulkResult[ItemT, R]]:
+        nonlocal pending
+        if ordered:
+            result = await ordered_pending[0]
+            ordered_pending.popleft()
+            return [result]
+
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        return [task.result() for task in done]
+
+    try:
+        async for index, item in _aenumerate(items):
+            if len(ordered_pending) + len(pending) >= window:
+                for result in await next_results():
+                    yield result
+
+            task = asyncio.ensure_future(call(index, item))
+            if ordered:
+                ordered_pending.append(task)
+            else:
+                pending.add(task)
+
+        while ordered_pending or pending:
+            for result in await next_results():
+                yield result
+    finally:
+        tasks = [*ordered_pending, *pending]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,65 @@
+import json
+
+from typing import Any, Callable, Literal, Union
+
+JSONDecoder = Callable[[bytes], Any]
+
+JSON_DECODER = Literal["auto", "json", "orjson", "msgspec"]
+
+RESPONSE_MODE = Literal["model", "construct", "raw"]
+
+RESPONSE_MODES = ("model", "construct", "raw")
+
+
+def _get_orjson_decoder() -> JSONDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _get_msgspec_decoder() -> JSONDecoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def get_json_decoder(decoder: Union[JSON_DECODER, JSONDecoder] = "auto") -> JSONDecoder:
+    """
+    Get a function decoding JSON response bodies.
+
+    Every decoder raises a ``ValueError`` on invalid JSON.
+
+    Args:
+        decoder: ``"json"`` for the standard library, ``"orjson"`` or ``"msgspec"`` for the
+            optional faster backends, ``"auto"`` for the fastest one installed, or any
+            callable taking bytes
+
+    Returns:
+        A function taking the raw response body and returning the decoded value
+
+    Raises:
+        ImportError: If the requested backend is not installed
+        ValueError: If the decoder name is unknown
+
+    Examples:
+        >>> get_json_decoder("json")(b'{"data": []}')
+        {'data': []}
+    """
+    if callable(decoder):
+        return decoder
+
+    if decoder == "json":
+        return json.loads
+    elif decoder == "orjson":
+        return _get_orjson_decoder()
+    elif decoder == "msgspec":
+        return _get_msgspec_decoder()
+    elif decoder == "auto":
+        for get_decoder in (_get_orjson_decoder, _get_msgspec_decoder):
+            try:
+                return get_decoder()
+            except ImportError:
+                continue
+        return json.loads
+
+    raise ValueError(f"Unknown JSON decoder: {decoder}")
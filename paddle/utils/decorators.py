@@ -1,61 +1,54 @@
+import types
 import asyncio
 import inspect
 
 from functools import wraps
-from typing import TypeVar, Callable, get_type_hints, cast, get_origin, get_args, Union
+from typing import Callable, TypeVar, cast
 
-from pydantic import ValidationError, create_model
+from pydantic import validate_call
 
 T = TypeVar("T", bound=Callable)
 
 
+def _build_validator(func: Callable) -> Callable:
+    """Build a function validating the arguments of ``func`` like it, without calling it."""
+
+    def validate(*args, **kwargs):
+        return None
+
+    # Same globals, signature and annotations, so pydantic resolves the same types
+    validator = types.FunctionType(validate.__code__, func.__globals__, func.__name__)
+    validator.__signature__ = inspect.signature(func)
+    validator.__annotations__ = dict(func.__annotations__)
+    validator.__module__ = func.__module__
+    validator.__qualname__ = func.__qualname__
+    return validate_call(validator)
+
+
 def validate_params(func: T) -> T:
     """
     Decorator that validates function parameters using Pydantic.
     Works with both synchronous and asynchronous functions.
     Properly handles optional parameters and default values.
+
+    The validator is built once, on the first call, and binds the arguments of each call in
+    pydantic-core. Model instances passed as arguments are not validated
+    again. The function is called with the original arguments, not the validated values.
+
+    Methods of objects with a false ``_validate_params`` attribute are not validated, which
+    is how resources follow the ``validate_params`` setting of their client.
     """
-    # Get type hints and function signature
-    hints = get_type_hints(func)
-    sig = inspect.signature(func)
+    validator = None
 
-    # Remove return annotation if present
-    hints.pop("return", None)
+    def validate(*args, **kwargs) -> None:
+        # Build the validator on first call, pydantic-core binds and validates the arguments
+        nonlocal validator
+        if validator is None:
+            validator = _build_validator(func)
+        validator(*args, **kwargs)
 
     # Check if the function is a method
-    is_method = any(param.name == "self" for param in sig.parameters.values())
-
-    # Create field definitions with proper defaults
-    fields = {}
-    for name, param in sig.parameters.items():
-        # Skip 'self' parameter for methods
-        if name == "self":
-            continue
-
-        if name in hints:
-            # Determine if the parameter is optional
-            is_optional = False
-            annotation = hints[name]
-
-            # Check if it's an Optional type (Union[Type, None])
-            if get_origin(annotation) is Union and type(None) in get_args(annotation):
-                is_optional = True
-
-            # Check if it has a default value
-            has_default = param.default is not param.empty
-
-            if has_default:
-                # Use the actual default value
-                fields[name] = (annotation, param.default)
-            elif is_optional:
-                # For Optional types without defaults, use None
-                fields[name] = (annotation, None)
-            else:
-                # Required field
-                fields[name] = (annotation, ...)
-
-    # Create validation model
-    ValidatorModel = create_model(f"{func.__name__}Validator", **fields)
+    is_method = any(param.name == "self" for param in inspect.signature(func).parameters.values())
 
     # Check if the function is async
     is_async = asyncio.iscoroutinefunction(func)
@@ -65,44 +58,17 @@ def validate_params(func: T) -> T:
 
             @wraps(func)
             async def async_method_wrapper(self, *args, **kwargs):
-                try:
-                    # Get the parameter names from the signature
-                    param_names = list(sig.parameters.keys())
-                    if is_method:
-                        param_names.remove("self")
-
-                    # Create a dict of all arguments
-                    all_args = {}
-                    for i, arg in enumerate(args):
-                        all_args[param_names[i]] = arg
-                    all_args.update(kwargs)
-
-                    ValidatorModel(**all_args)
-                    return await func(self, *args, **kwargs)
-                except ValidationError as e:
-                    print(f"Validation error in {func.__name__}: {e}")
-                    raise
+                if getattr(self, "_validate_params", True):
+                    validate(self, *args, **kwargs)
+                return await func(self, *args, **kwargs)
 
             return cast(T, async_method_wrapper)
         else:
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                try:
-                    # Get the parameter names from the signature
-                    param_names = list(sig.parameters.keys())
-
-                    # Create a dict of all arguments
-                    all_args = {}
-                    for i, arg in enumerate(args):
-                        all_args[param_names[i]] = arg
-                    all_args.update(kwargs)
-
-                    ValidatorModel(**all_args)
-                    return await func(*args, **kwargs)
-                except ValidationError as e:
-                    print(f"Validation error in {func.__name__}: {e}")
-                    raise
+                validate(*args, **kwargs)
+                return await func(*args, **kwargs)
 
             return cast(T, async_wrapper)
     else:
@@ -110,43 +76,16 @@ def validate_params(func: T) -> T:
 
             @wraps(func)
             def sync_method_wrapper(self, *args, **kwargs):
-                try:
-                    # Get the parameter names from the signature
-                    param_names = list(sig.parameters.keys())
-                    if is_method:
-                        param_names.remove("self")
-
-                    # Create a dict of all arguments
-                    all_args = {}
-                    for i, arg in enumerate(args):
-                        all_args[param_names[i]] = arg
-                    all_args.update(kwargs)
-
-                    ValidatorModel(**all_args)
-                    return func(self, *args, **kwargs)
-                except ValidationError as e:
-                    print(f"Validation error in {func.__name__}: {e}")
-                    raise
+                if getattr(self, "_validate_params", True):
+                    validate(self, *args, **kwargs)
+                return func(self, *args, **kwargs)
 
             return cast(T, sync_method_wrapper)
         else:
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                try:
-                    # Get the parameter names from the signature
-                    param_names = list(sig.parameters.keys())
-
-                    # Create a dict of all arguments
-                    all_args = {}
-                    for i, arg in enumerate(args):
-                        all_args[param_names[i]] = arg
-                    all_args.update(kwargs)
-
-                    ValidatorModel(**all_args)
-                    return func(*args, **kwargs)
-                except ValidationError as e:
-                    print(f"Validation error in {func.__name__}: {e}")
-                    raise
+                validate(*args, **kwargs)
+                return func(*args, **kwargs)
 
             return cast(T, sync_wrapper)
@@ -0,0 +1,293 @@
+import os
+import bz2
+import csv
+import gzip
+import json
+import lzma
+
+from typing import (
+    IO,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+EXPORT_FORMAT = Literal["ndjson", "csv", "parquet"]
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+# Objects whose keys are up to the merchant, kept whole instead of flattened into columns
+KEEP_AS_JSON = ("custom_data",)
+
+# Compressed file openers, by compression name and file extension
+_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+
+def flatten(item: Dict[str, Any], prefix: str = "", keep: Collection[str] = ()) -> Dict[str, Any]:
+    """
+    Flatten the nested objects of an entity into dotted keys.
+
+    Lists are kept as they are, they can't be flattened into a fixed set of columns.
+
+    Args:
+        item: The decoded JSON of an entity
+        prefix: Prefix of the keys, used for nested objects
+        keep: Keys of the objects to keep whole, at any depth
+
+    Returns:
+        The flat entity
+
+    Examples:
+        >>> flatten({"id": "pri_01", "unit_price": {"amount": "100", "currency_code": "USD"}})
+        {'id': 'pri_01', 'unit_price.amount': '100', 'unit_price.currency_code': 'USD'}
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in item.items():
+        if isinstance(value, dict) and value and key not in keep:
+            flat.update(flatten(value, f"{prefix}{key}.", keep))
+        else:
+            flat[f"{prefix}{key}"] = value
+
+    return flat
+
+
+def explode_records(items: Iterable[Dict[str, Any]], field: str) -> Iterator[Dict[str, Any]]:
+    """
+    Turn entities into one record per element of one of their lists.
+
+    Each record holds the other fields of its entity and one element of the list, so
+    flattening it gives columns such as ``items.price.id`` for subscription items.
+    Entities with an empty list still give one record, without the list field.
+
+    Args:
+        items: The decoded JSON of the entities
+        field: Name of the list field
+
+    Yields:
+        The records
+    """
+    for item in items:
+        elements = item.get(field) or [None]
+        for element in elements:
+            record = {key: value for key, value in item.items() if key != field}
+            if element is not None:
+                record[field] = element
+            yield record
+
+
+def model_columns(
+    model: Type[BaseModel], explode: Optional[str] = None, keep: Collection[str] = KEEP_AS_JSON
+) -> Dict[str, Any]:
+    """
+    Get the flattened columns of a response model, as ``flatten`` names them.
+
+    Args:
+        model: The response model of the entities
+        explode: Name of the list field exported as one record per element
+        keep: Names of the objects kept whole
+
+    Returns:
+        The type of each column, ``bool``, ``int``, ``float`` or ``str``, keyed by name.
+        Lists and objects kept whole are ``str`` columns holding JSON.
+
+    Examples:
+        >>> model_columns(BillingCycle)
+        {'frequency': <class 'int'>, 'interval': <class 'str'>}
+    """
+    columns: Dict[str, Any] = {}
+    # The ID comes first, even when declared by a subclass
+    fields = sorted(model.model_fields.items(), key=lambda field: field[0] != "id")
+    for name, field in fields:
+        annotation = _strip_optional(field.annotation)
+        if name == explode and get_origin(annotation) in (list, List, Sequence):
+            annotation = _strip_optional(get_args(annotation)[0])
+        columns.update(_annotation_columns(annotation, name, keep))
+
+    return columns
+
+
+def _annotation_columns(annotation: Any, name: str, keep: Collection[str]) -> Dict[str, Any]:
+    """Get the columns of a field, the nested ones if it is a model."""
+    annotation = _strip_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and name not in keep:
+        columns: Dict[str, Any] = {}
+        for field_name, field in annotation.model_fields.items():
+            columns.update(_annotation_columns(field.annotation, f"{name}.{field_name}", keep))
+        return columns
+
+    if get_origin(annotation) is Literal:
+        annotation = type(get_args(annotation)[0])
+    if annotation not in (bool, int, float):
+        annotation = str
+
+    return {name: annotation}
+
+
+def _strip_optional(annotation: Any) -> Any:
+    """Get ``X`` from ``Optional[X]``."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+
+    return annotation
+
+
+def to_json_value(value: Any) -> Any:
+    """Encode the lists and objects left in a flat record as JSON."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+
+    return value
+
+
+def open_export_file(path: Union[str, os.PathLike], compression: Optional[str] = "infer") -> IO:
+    """
+    Open a file to write an export to, compressing it on the fly if needed.
+
+    Args:
+        path: Path of the file
+        compression: ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+            extension, or None
+
+    Returns:
+        The file, opened for writing text
+    """
+    if compression == "infer":
+        compression = _EXTENSIONS.get(os.path.splitext(os.fspath(path))[1])
+    if compression is None:
+        return open(path, "w", encoding="utf-8", newline="")
+    if compression not in _OPENERS:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    return _OPENERS[compression](path, "wt", encoding="utf-8", newline="")
+
+
+def write_export(
+    pages: Iterable[List[Dict[str, Any]]],
+    path: Union[str, os.PathLike],
+    format: EXPORT_FORMAT = "ndjson",
+    compression: Optional[str] = "infer",
+    columns: Optional[Sequence[str]] = None,
+    explode: Optional[str] = None,
+    model: Optional[Type[BaseModel]] = None,
+) -> int:
+    """
+    Write pages of entities to a file, one page at a time.
+
+    The export is written to a temporary file next to ``path``, which is renamed once
+    complete, so a failed export never leaves a truncated file at ``path``.
+
+    With the CSV and Parquet formats, nested objects are flattened into dotted columns,
+    while lists and ``custom_data`` are written as JSON. The columns are those of
+    ``model`` if given, or else of the first page. Keys missing from them are left out.
+
+    Args:
+        pages: The decoded JSON entities of each page
+        path: Path of the file
+        format: ``"ndjson"`` for one JSON object per line, ``"csv"``, or ``"parquet"``
+            which requires ``pyarrow``
+        compression: ``"gzip"``, ``"bz2"``, ``"xz"``, ``"infer"`` to pick it from the file
+            extension, or None. Parquet files are compressed internally, with ``"snappy"``
+            unless another Parquet codec is given.
+        columns: Columns to write, dotted for nested fields
+        explode: Name of a list field to write as one record per element, such as
+            ``"items"`` for subscriptions
+        model: Response model of the entities, giving the columns and their types
+
+    Returns:
+        The number of exported records
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
+
+    if explode is not None:
+        pages = (list(explode_records(items, explode)) for items in pages)
+
+    temp_path = f"{os.fspath(path)}.part"
+    try:
+        if format == "parquet":
+            from paddle.utils.arrow import model_schema, write_parquet
+
+            schema = model_schema(model, explode, columns) if model is not None else None
+            count = write_parquet(
+                pages,
+                temp_path,
+                schema=schema,
+                compression="snappy" if compression in ("infer", None) else compression,
+            )
+        else:
+            if compression == "infer":
+                compression = _EXTENSIONS.get(os.path.splitext(os.fspath(path))[1])
+            if columns is None and model is not None:
+                columns = list(model_columns(model, explode))
+
+            with open_export_file(temp_path, compression) as file:
+                if format == "ndjson":
+                    count = _write_ndjson(file, pages)
+                else:
+                    count = _write_csv(file, pages, columns)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return count
+
+
+def _write_ndjson(file: IO, pages: Iterable[List[Dict[str, Any]]]) -> int:
+    count = 0
+    for items in pages:
+        file.writelines(json.dumps(item, separators=(",", ":")) + "\n" for item in items)
+        count += len(items)
+
+    return count
+
+
+def _write_csv(
+    file: IO, pages: Iterable[List[Dict[str, Any]]], columns: Optional[Sequence[str]]
+) -> int:
+    writer = None
+    if columns is not None:
+        writer = csv.DictWriter(file, columns, extrasaction="ignore")
+        writer.writeheader()
+
+    count = 0
+    for items in pages:
+        rows = [flatten(item, keep=KEEP_AS_JSON) for item in items]
+        if writer is None and rows:
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(file, fieldnames, extrasaction="ignore")
+            writer.writeheader()
+        if writer is not None:
+            writer.writerows(_to_csv_row(row) for row in rows)
+        count += len(rows)
+
+    return count
+
+
+def _to_csv_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Format the values of a flat entity for CSV."""
+    for key, value in row.items():
+        if value is None:
+            row[key] = ""
+        elif isinstance(value, bool):
+            row[key] = "true" if value else "false"
+        else:
+            row[key] = to_json_value(value)
+
+    return row
@@ -0,0 +1,124 @@
+import asyncio
+
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncBatchLoader(Generic[K, V]):
+    """
+    Batches the keys loaded within a short window into a single call.
+
+    Every ``load`` made within ``window`` seconds of the first one is resolved by one call
+    to ``load_many``, or earlier once ``max_batch_size`` distinct keys are pending. Keys
+    loaded several times in a batch are only requested once.
+
+    Args:
+        load_many: Coroutine function taking a list of keys and returning the values keyed by
+            key, keys missing from the result are not found
+        max_batch_size: Maximum number of distinct keys per call
+        window: Seconds to wait for more keys after the first key of a batch
+        missing_error: Function creating the exception raised for a key that wasn't found,
+            ``KeyError`` by default
+
+    Examples:
+        >>> loader = AsyncBatchLoader(client.customers.get_many)
+        >>> customers = await asyncio.gather(loader.load("ctm_01"), loader.load("ctm_02"))
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[Mapping[K, V]]],
+        *,
+        max_batch_size: int = 100,
+        window: float = 0.002,
+        missing_error: Optional[Callable[[K], Exception]] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than or equal to 1")
+
+        self.load_many = load_many
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.missing_error = missing_error or KeyError
+        self._batch: Dict[K, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        """
+        Load the value of a key along with the other keys of the current batch.
+
+        Args:
+            key: The key to load
+
+        Returns:
+            The value of the key
+
+        Raises:
+            Exception: The error raised by ``load_many``, or ``missing_error`` if the key
+                wasn't found
+        """
+        future = self._batch.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._batch[key] = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+
+            if len(self._batch) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+
+        # Other callers may wait for the same key, don't cancel it for them
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Send the current batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch = self._batch, {}
+        if batch:
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: Dict[K, asyncio.Future]) -> None:
+        """Load a batch and resolve the future of each key."""
+        try:
+            values = await self.load_many(list(batch))
+            for key, future in batch.items():
+                if future.done():
+                    continue
+                if key in values:
+                    future.set_result(values[key])
+                else:
+                    future.set_exception(self.missing_error(key))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Never leave a caller waiting, e.g. if the batch was cancelled
+            for future in batch.values():
+                future.cancel()
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # Every caller waiting for the key may have been cancelled
+    if not future.cancelled():
+        future.exception()
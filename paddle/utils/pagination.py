@@ -0,0 +1,283 @@
+import json
+import asyncio
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from paddle.models.responses.base import eager_validation
+from paddle.models.responses.shared import Pagination
+from paddle.utils.checkpoints import CheckpointStore
+
+
+def get_next_cursor(pagination: Union[Pagination, Dict[str, Any]]) -> Optional[str]:
+    """
+    Get the cursor for the next page from a pagination object.
+
+    Args:
+        pagination: The pagination metadata of a list response, or its decoded JSON
+
+    Returns:
+        The value of the ``after`` query parameter in ``pagination.next``,
+        or None if there are no more pages
+
+    Examples:
+        >>> get_next_cursor(Pagination(
+        ...     per_page=50,
+        ...     next="https://api.paddle.com/customers?after=ctm_01",
+        ...     has_more=True,
+        ...     estimated_total=100,
+        ... ))
+        'ctm_01'
+    """
+    if isinstance(pagination, dict):
+        has_more, next_url = pagination.get("has_more"), pagination.get("next")
+    else:
+        has_more, next_url = pagination.has_more, pagination.next
+
+    if not has_more or not next_url:
+        return None
+
+    values = parse_qs(urlsplit(next_url).query).get("after")
+    return values[0] if values else None
+
+
+def _get_page_items(page: Any) -> list:
+    """Get the items of a list response, or of its decoded JSON in raw response mode."""
+    if isinstance(page, dict):
+        return page["data"]
+    return page.data
+
+
+def _get_page_cursor(page: Any) -> Optional[str]:
+    """Get the cursor for the page after a list response."""
+    if isinstance(page, dict):
+        return get_next_cursor(page["meta"]["pagination"])
+    return get_next_cursor(page.meta.pagination)
+
+
+def _fetch_validated(fetch_page: Callable[[Optional[str]], Any], cursor: Optional[str]) -> Any:
+    """Fetch a page whose items are all read, validating them as a whole."""
+    with eager_validation():
+        return fetch_page(cursor)
+
+
+async def _afetch_validated(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]], cursor: Optional[str]
+) -> Any:
+    """Fetch a page whose items are all read, validating them as a whole."""
+    with eager_validation():
+        return await fetch_page(cursor)
+
+
+def paginate(
+    fetch_page: Callable[[Optional[str]], Any],
+    after: Optional[str] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over every item of a paginated list endpoint.
+
+    Only one page is held in memory at a time.
+
+    With a checkpoint store, the cursor of the next page is saved once every item of a
+    page has been consumed, and a new iteration with the same key resumes from it instead
+    of ``after``. The checkpoint is deleted when the last item has been consumed. Delivery
+    is at least once: the items of a page that was partially consumed when the iteration
+    stopped are yielded again.
+
+    Args:
+        fetch_page: Function that takes a cursor and returns a list response, or its
+            decoded JSON in raw response mode
+        after: The cursor to start from
+        checkpoints: Store to save the progress in
+        checkpoint_key: Key of the checkpoint, required with ``checkpoints``
+
+    Yields:
+        The items of each page, in order
+    """
+    if checkpoints is None:
+        for items, _ in iter_pages(fetch_page, after):
+            yield from items
+        return
+
+    if checkpoint_key is None:
+        raise ValueError("checkpoint_key is required with checkpoints")
+
+    checkpoint = checkpoints.load(checkpoint_key)
+    if checkpoint is not None:
+        after = checkpoint["after"]
+
+    for items, next_cursor in iter_pages(fetch_page, after):
+        yield from items
+
+        # Only reached once the consumer asks for the item after the page
+        checkpoint = {"after": next_cursor} if next_cursor is not None else None
+        checkpoints.save(checkpoint_key, checkpoint)
+
+
+def get_checkpoint_key(name: str, params: Dict[str, Any]) -> str:
+    """
+    Build the default checkpoint key of an iteration over a list endpoint.
+
+    Args:
+        name: Name of the listed resource
+        params: Filters of the list request, iterations with other filters get other keys
+
+    Returns:
+        The checkpoint key
+
+    Examples:
+        >>> get_checkpoint_key("customers", {"status": ["active"]})
+        'customers:{"status": ["active"]}'
+    """
+    return f"{name}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+def iter_pages(
+    fetch_page: Callable[[Optional[str]], Any],
+    after: Optional[str] = None,
+) -> Iterator[Tuple[list, Optional[str]]]:
+    """
+    Iterate over the pages of a paginated list endpoint.
+
+    Each page comes with the cursor of the page after it, so callers can record how far
+    they got and resume from there later. Pages are expected to be read in full, so their
+    items are validated when received, see :func:`~paddle.models.responses.base.eager_validation`.
+
+    Args:
+        fetch_page: Function that takes a cursor and returns a list response, or its
+            decoded JSON in raw response mode
+        after: The cursor to start from
+
+    Yields:
+        The items of each page and the cursor of the next page, None for the last page
+    """
+    while True:
+        page = _fetch_validated(fetch_page, after)
+        after = _get_page_cursor(page)
+        yield _get_page_items(page), after
+
+        if after is None:
+            return
+
+
+async def apaginate(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+    after: Optional[str] = None,
+    prefetch: int = 0,
+    checkpoints: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronously iterate over every item of a paginated list endpoint.
+
+    Without prefetching, pages are requested one after another and only one page is
+    held in memory at a time. With ``prefetch`` set, the request for the next page is
+    issued as soon as its cursor is known, so network latency overlaps with the
+    consumer processing the current page.
+
+    Checkpoints work like with :func:`paginate`: the cursor of the next page is saved
+    once every item of a page has been consumed, not when the page is prefetched. Like
+    :func:`iter_pages`, items are validated when their page is received.
+
+    Args:
+        fetch_page: Coroutine function that takes a cursor and returns a list response
+        after: The cursor to start from
+        prefetch: Maximum number of pages requested ahead of the consumer
+        checkpoints: Store to save the progress in
+        checkpoint_key: Key of the checkpoint, required with ``checkpoints``
+
+    Yields:
+        The items of each page, in order
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be greater than or equal to 0")
+
+    if checkpoints is not None:
+        if checkpoint_key is None:
+            raise ValueError("checkpoint_key is required with checkpoints")
+
+        checkpoint = checkpoints.load(checkpoint_key)
+        if checkpoint is not None:
+            after = checkpoint["after"]
+
+    def fetch_validated(cursor: Optional[str]) -> Awaitable[Any]:
+        return _afetch_validated(fetch_page, cursor)
+
+    if prefetch:
+        pages = _prefetch_pages(fetch_validated, after, prefetch)
+    else:
+        pages = _fetch_pages(fetch_validated, after)
+    try:
+        async for page in pages:
+            for item in _get_page_items(page):
+                yield item
+
+            if checkpoints is not None:
+                # Only reached once the consumer asks for the item after the page
+                next_cursor = _get_page_cursor(page)
+                checkpoint = {"after": next_cursor} if next_cursor is not None else None
+                checkpoints.save(checkpoint_key, checkpoint)
+    finally:
+        await pages.aclose()
+
+
+async def _fetch_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+    after: Optional[str],
+) -> AsyncIterator[Any]:
+    """Fetch pages one after another, as they are consumed."""
+    while True:
+        page = await fetch_page(after)
+        yield page
+
+        after = _get_page_cursor(page)
+        if after is None:
+            return
+
+
+async def _prefetch_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+    after: Optional[str],
+    prefetch: int,
+) -> AsyncIterator[Any]:
+    """Fetch pages in a background task, keeping up to ``prefetch`` pages ahead."""
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+    done = object()
+
+    async def produce() -> None:
+        cursor = after
+        try:
+            while True:
+                await slots.acquire()
+                page = await fetch_page(cursor)
+                queue.put_nowait(page)
+
+                cursor = _get_page_cursor(page)
+                if cursor is None:
+                    queue.put_nowait(done)
+                    return
+        except Exception as e:
+            queue.put_nowait(e)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is done:
+                return
+            if isinstance(page, Exception):
+                raise page
+
+            # Free a slot before handing the page over so the next request runs
+            # while the consumer is busy with this one.
+            slots.release()
+            yield page
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,103 @@
+import time
+import asyncio
+import threading
+
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter shared by every resource of a client.
+
+    Requests take a token from the bucket, which refills at ``rate`` tokens per second
+    up to ``burst`` tokens. When the bucket is empty, callers are given increasing
+    reservation times instead of all waking up at once. A 429 response pauses the
+    bucket for the ``Retry-After`` delay and halves the refill rate, which then
+    recovers gradually with every successful request.
+
+    Args:
+        rate: Maximum sustained number of requests per second
+        burst: Maximum number of requests that can be sent at once
+        min_rate: Lowest rate the limiter slows down to after rate limit errors
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, min_rate: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.min_rate = min_rate if min_rate is not None else self.rate / 10
+
+        if self.burst < 1:
+            raise ValueError("burst must be greater than or equal to 1")
+
+        self._current_rate = self.rate
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self) -> float:
+        """The refill rate currently in effect, in requests per second."""
+        return self._current_rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        start = max(self._updated_at, self._paused_until)
+        if now > start:
+            self._tokens = min(self.burst, self._tokens + (now - start) * self._current_rate)
+        self._updated_at = max(now, self._updated_at)
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        Returns:
+            The number of seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            delay = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self._current_rate
+
+            return delay
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait until a request may be sent without blocking the event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        """Record a successful request, gradually restoring the configured rate."""
+        with self._lock:
+            if self._current_rate < self.rate:
+                self._current_rate = min(self.rate, self._current_rate + self.rate / 20)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a rate limit (429) response.
+
+        Args:
+            retry_after: Seconds to pause all requests for, usually taken from the
+                ``Retry-After`` header
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._current_rate = max(self.min_rate, self._current_rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
@@ -58,6 +58,25 @@ def is_retryable_status_code(status_code: int) -> bool:
     return False
 
 
+def parse_retry_after(retry_after_header: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a Retry-After header.
+
+    Args:
+        retry_after_header: The value of the Retry-After header if present
+
+    Returns:
+        The delay in seconds, or None if the header is missing or not a number
+    """
+    if not retry_after_header:
+        return None
+
+    try:
+        return float(retry_after_header)
+    except ValueError:
+        return None
+
+
 def get_retry_delay(status_code: int, retry_after_header: Optional[str] = None) -> float:
     """
     Get the recommended delay before retrying a request.
@@ -69,11 +88,9 @@ def get_retry_delay(status_code: int, retry_after_header: Optional[str] = None)
     Returns:
         The recommended delay in seconds
     """
-    if retry_after_header:
-        try:
-            return float(retry_after_header)
-        except ValueError:
-            pass
+    retry_after = parse_retry_after(retry_after_header)
+    if retry_after is not None:
+        return retry_after
 
     # Default retry delays based on status code
     if status_code == 429:  # Rate limit
@@ -0,0 +1,153 @@
+import random
+import threading
+
+from typing import Literal, Optional
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests sent by a client.
+
+    Every request adds ``ratio`` to the budget and every retry spends one from it, so
+    during an outage retries can never exceed ``ratio`` times the regular traffic plus a
+    small ``reserve``. The budget is thread-safe and meant to be shared by all requests
+    of a client.
+
+    Args:
+        ratio: Number of retries allowed per request sent
+        reserve: Number of retries that can be spent at once when the budget is full
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: int = 10):
+        if ratio < 0:
+            raise ValueError("ratio must be greater than or equal to 0")
+
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """Number of retries currently available."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._balance = min(float(self.reserve), self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Spend one retry from the budget.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed request.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` and are randomized
+    with jitter, so clients that failed together don't retry together. A ``Retry-After``
+    value sent by the API is used as the lower bound of the delay.
+
+    Args:
+        max_retries: Maximum number of retries per request
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound of a single delay, in seconds
+        jitter: ``"full"`` picks a delay between 0 and the exponential backoff,
+            ``"decorrelated"`` picks a delay between ``base_delay`` and three times the
+            previous delay, ``"none"`` uses the exponential backoff as is
+        max_elapsed: Give up once retrying would exceed this many seconds since the
+            first attempt
+        budget: Retry budget shared by every request of the client
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: Literal["full", "decorrelated", "none"] = "full",
+        max_elapsed: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+    ):
+        if jitter not in ("full", "decorrelated", "none"):
+            raise ValueError(f"Unknown jitter strategy: {jitter}")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.budget = budget
+
+    def record_request(self) -> None:
+        """Record a new request, before any retry."""
+        if self.budget:
+            self.budget.deposit()
+
+    def compute_delay(self, attempt: int, previous_delay: Optional[float] = None) -> float:
+        """
+        Compute the backoff delay for a retry.
+
+        Args:
+            attempt: Number of retries already made for the request
+            previous_delay: The delay used before the previous retry
+
+        Returns:
+            The delay in seconds
+        """
+        if self.jitter == "decorrelated":
+            upper = max(self.base_delay, (previous_delay or self.base_delay) * 3)
+            return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+        backoff = min(self.max_delay, self.base_delay * 2**attempt)
+        if self.jitter == "full":
+            return random.uniform(0, backoff)
+
+        return backoff
+
+    def get_retry_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        previous_delay: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Get the delay before the next retry.
+
+        Args:
+            attempt: Number of retries already made for the request
+            elapsed: Seconds since the first attempt
+            previous_delay: The delay used before the previous retry
+            retry_after: Delay requested by the API through the Retry-After header
+
+        Returns:
+            The delay in seconds, or None if the request should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self.compute_delay(attempt, previous_delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+
+        if self.budget and not self.budget.withdraw():
+            return None
+
+        return delay
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(
+    method: str, path: str, params: Optional[Dict[str, Any]] = None, *options: Any
+) -> Tuple[Any, ...]:
+    """
+    Build a key identifying identical requests.
+
+    Args:
+        method: HTTP method
+        path: API endpoint path
+        params: Query parameters, their order doesn't matter
+        *options: Other request options changing the result
+
+    Returns:
+        A hashable key
+    """
+    frozen_params = tuple(sorted((name, str(value)) for name, value in (params or {}).items()))
+    return (method, path, frozen_params, *options)
+
+
+class _Call:
+    """A call in flight and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time, sharing its outcome with concurrent callers.
+
+    Threads calling ``do`` with the key of a call in flight wait for that call and get its
+    result, or its exception, instead of making their own. The next call with the same key
+    once the call has finished runs again, nothing is cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call a function, unless a call with the same key is in flight.
+
+        Args:
+            key: Key identifying identical calls
+            func: The function to call
+
+        Returns:
+            The result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Runs at most one coroutine per key at a time, sharing its outcome with concurrent callers.
+
+    The coroutine runs in its own task, so a cancelled caller doesn't cancel it for the
+    others waiting on it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await a coroutine function, unless a call with the same key is in flight.
+
+        Args:
+            key: Key identifying identical calls
+            func: The coroutine function to await
+
+        Returns:
+            The result of the call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Mark the exception as retrieved, every caller may have been cancelled
+        if not task.cancelled():
+            task.exception()
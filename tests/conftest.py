@@ -15,3 +15,47 @@ def test_client():
 async def test_async_client():
     # Unit test version, no network calls
     return AsyncClient(api_key="fake-key", environment=Environment.SANDBOX)
+
+
+def _make_customer(customer_id, **fields):
+    return {
+        "id": customer_id,
+        "email": f"{customer_id}@example.com",
+        "marketing_consent": False,
+        "status": "active",
+        "locale": "en",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        **fields,
+    }
+
+
+def _make_page(items, next_after=None, per_page=None, estimated_total=None, resource="customers"):
+    return {
+        "data": items,
+        "meta": {
+            "request_id": "test",
+            "pagination": {
+                "per_page": per_page or len(items),
+                "next": (
+                    f"https://sandbox-api.paddle.com/{resource}?after={next_after}"
+                    if next_after
+                    else ""
+                ),
+                "has_more": next_after is not None,
+                "estimated_total": estimated_total or len(items),
+            },
+        },
+    }
+
+
+@pytest.fixture
+def make_customer():
+    # Builds the JSON of a customer, with the required fields
+    return _make_customer
+
+
+@pytest.fixture
+def make_page():
+    # Builds the JSON of a list response, with more pages after ``next_after`` if given
+    return _make_page
@@ -0,0 +1,162 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from paddle.analytics import SubscriptionArrays, compute_mrr  # noqa: E402
+from paddle.models.responses.subscriptions import SubscriptionListResponse  # noqa: E402
+
+
+def _item(amount, currency_code="USD", quantity=1, cycle=None, **kwargs):
+    price = {
+        "unit_price": {"amount": str(amount), "currency_code": currency_code},
+        "billing_cycle": cycle,
+        "unit_price_overrides": kwargs.pop("overrides", []),
+    }
+    return {"status": "active", "recurring": True, "quantity": quantity, "price": price, **kwargs}
+
+
+def _subscription(id, items, currency_code="USD", status="active", cycle=None, change=None):
+    return {
+        "id": id,
+        "status": status,
+        "currency_code": currency_code,
+        "billing_cycle": cycle or {"frequency": 1, "interval": "month"},
+        "scheduled_change": change,
+        "items": items,
+    }
+
+
+CANCEL = {"action": "cancel", "effective_at": "2024-02-01T00:00:00Z", "resume_at": None}
+
+SUBSCRIPTIONS = [
+    _subscription("sub_01", [_item(1000, quantity=2), _item(500, recurring=False)]),
+    _subscription(
+        "sub_02",
+        [_item(12000, cycle={"frequency": 1, "interval": "year"})],
+        cycle={"frequency": 1, "interval": "year"},
+        change=CANCEL,
+    ),
+    _subscription("sub_03", [_item(100, cycle={"frequency": 2, "interval": "week"})]),
+    _subscription(
+        "sub_04",
+        [
+            _item(
+                999,
+                overrides=[
+                    {
+                        "country_codes": ["FR"],
+                        "unit_price": {"amount": "899", "currency_code": "EUR"},
+                    }
+                ],
+            ),
+            _item(300, status="trialing"),
+        ],
+        currency_code="EUR",
+        status="past_due",
+    ),
+    _subscription("sub_05", [_item(5000)], status="paused"),
+    _subscription("sub_06", [_item(5000)], status="canceled"),
+]
+
+
+def test_monthly_amounts():
+    arrays = SubscriptionArrays.from_pages([SUBSCRIPTIONS])
+
+    assert arrays.subscription_ids == ["sub_01", "sub_02", "sub_03", "sub_04"]
+    assert arrays.currency_codes == ["USD", "EUR"]
+    # 1000 x 2 monthly, 12000 yearly, 100 every 2 weeks, 899 EUR from the override
+    assert arrays.monthly_amounts().tolist() == [2000, 1000, 217, 899]
+    assert arrays.item_currency.tolist() == [0, 0, 0, 1]
+
+
+def test_compute_mrr():
+    report = compute_mrr([SUBSCRIPTIONS[:3], SUBSCRIPTIONS[3:]])
+
+    usd = report["USD"]
+    assert (usd.subscriptions, usd.mrr, usd.arr) == (3, 3217, 38604)
+    assert (usd.at_risk_subscriptions, usd.at_risk_mrr, usd.at_risk_arr) == (1, 1000, 12000)
+    eur = report["EUR"]
+    assert (eur.subscriptions, eur.mrr, eur.at_risk_mrr) == (1, 899, 0)
+    assert report.subscriptions == 4
+    assert report.at_risk_subscriptions == 1
+
+
+def test_compute_mrr_rounds_in_integers():
+    # 7 every 3 days is 71.1666... a month, 10^15 a year 83333333333333.33... a month
+    arrays = SubscriptionArrays.from_pages(
+        [
+            [
+                _subscription("sub_01", [_item(7, cycle={"frequency": 3, "interval": "day"})]),
+                _subscription(
+                    "sub_02", [_item(10**15, cycle={"frequency": 1, "interval": "year"})]
+                ),
+            ]
+        ]
+    )
+
+    assert arrays.monthly_amounts().tolist() == [71, 83333333333333]
+    assert compute_mrr(arrays)["USD"].mrr == 83333333333404
+
+
+def test_compute_mrr_from_list_responses():
+    response = {
+        "data": [
+            {
+                "id": "sub_01",
+                "status": "active",
+                "customer_id": "ctm_01",
+                "address_id": "add_01",
+                "currency_code": "GBP",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+                "collection_mode": "automatic",
+                "billing_cycle": {"frequency": 1, "interval": "month"},
+                "management_urls": {"cancel": "https://example.com/cancel"},
+                "items": [
+                    {
+                        "status": "active",
+                        "quantity": 3,
+                        "recurring": True,
+                        "created_at": "2024-01-01T00:00:00Z",
+                        "updated_at": "2024-01-01T00:00:00Z",
+                        "price": {
+                            "id": "pri_01",
+                            "product_id": "pro_01",
+                            "description": "Monthly",
+                            "type": "standard",
+                            "tax_mode": "account_setting",
+                            "unit_price": {"amount": "1500", "currency_code": "GBP"},
+                            "unit_price_overrides": [],
+                            "quantity": {"minimum": 1, "maximum": 10},
+                            "status": "active",
+                            "created_at": "2024-01-01T00:00:00Z",
+                            "updated_at": "2024-01-01T00:00:00Z",
+                        },
+                        "product": {
+                            "id": "pro_01",
+                            "name": "Pro",
+                            "type": "standard",
+                            "tax_category": "standard",
+                            "status": "active",
+                            "created_at": "2024-01-01T00:00:00Z",
+                            "updated_at": "2024-01-01T00:00:00Z",
+                        },
+                    }
+                ],
+            }
+        ],
+        "meta": {
+            "request_id": "test",
+            "pagination": {"per_page": 200, "next": "", "has_more": False, "estimated_total": 1},
+        },
+    }
+
+    assert compute_mrr([response])["GBP"].mrr == 4500
+    assert compute_mrr([SubscriptionListResponse(response)])["GBP"].mrr == 4500
+
+
+def test_compute_mrr_without_subscriptions():
+    report = compute_mrr([[]])
+
+    assert report.currencies == {}
+    assert report.subscriptions == 0
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from unittest.mock import patch
+
+from paddle.aio.client import AsyncClient
+from paddle.client import Client
+from paddle.exceptions import PaddleAPIError
+from paddle.testing import FakePaddleAPI
+from paddle.utils.batching import chunk_ids
+
+
+@pytest.fixture
+def list_customers(make_customer, make_page):
+    def list_customers(**kwargs):
+        # Every requested customer exists, except the ones ending with 0
+        ids = kwargs["id"].split(",")
+        customers = [make_customer(id) for id in ids if not id.endswith("0")]
+        return json.dumps(make_page(customers)).encode()
+
+    return list_customers
+
+
+def test_chunk_ids():
+    ids = [f"ctm_{index:026d}" for index in range(450)]
+
+    chunks = chunk_ids(ids + ids[:10])
+    assert [len(chunk) for chunk in chunks] == [200, 200, 50]
+    assert [id for chunk in chunks for id in chunk] == ids
+
+    chunks = chunk_ids(ids, max_length=330)
+    assert all(len(chunk) == 10 for chunk in chunks)
+
+
+def test_get_many(test_client, list_customers):
+    ids = [f"ctm_{index}" for index in range(1, 401)]
+
+    with patch.object(test_client.customers, "_list", side_effect=list_customers) as mock_list:
+        customers = test_client.customers.get_many(ids)
+
+    assert mock_list.call_count == 2
+    assert mock_list.call_args_list[0].kwargs["per_page"] == 200
+    assert len(customers) == 360
+    assert customers["ctm_1"].email == "ctm_1@example.com"
+    assert customers.missing == [id for id in ids if id.endswith("0")]
+
+
+def test_get_many_raw_mode(test_client, list_customers):
+    raw_client = test_client.with_response_mode("raw")
+
+    with patch.object(raw_client.customers, "_list", side_effect=list_customers):
+        customers = raw_client.customers.get_many(["ctm_1", "ctm_10"])
+
+    assert customers["ctm_1"]["email"] == "ctm_1@example.com"
+    assert customers.missing == ["ctm_10"]
+
+
+def test_get_many_includes_archived():
+    api = FakePaddleAPI(seed=1)
+    api.populate(products=3)
+    client = Client(api_key="fake-key", transport=api.transport())
+    ids = sorted(api.entities["products"])
+    client.products.update(ids[0], status="archived")
+
+    products = client.products.get_many([*ids, "pro_x"])
+
+    assert list(products) == ids
+    assert products.missing == ["pro_x"]
+    assert list(client.products.get_many(ids, status=["active"])) == ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_includes_archived():
+    api = FakePaddleAPI(seed=1)
+    api.populate(products=1, prices_per_product=2)
+    client = AsyncClient(api_key="fake-key", transport=api.async_transport())
+    ids = sorted(api.entities["prices"])
+    api.dispatch("PATCH", f"/prices/{ids[0]}", {}, b'{"status": "archived"}', "http://test")
+
+    prices = await client.prices.get_many(ids)
+
+    assert list(prices) == ids
+    assert (await client.prices.load(ids[0])).status == "archived"
+
+
+@pytest.mark.asyncio
+async def test_async_get_many(test_async_client, list_customers):
+    ids = [f"ctm_{index}" for index in range(1, 1001)]
+
+    async def alist_customers(**kwargs):
+        return list_customers(**kwargs)
+
+    with patch.object(
+        test_async_client.customers, "_list", side_effect=alist_customers
+    ) as mock_list:
+        customers = await test_async_client.customers.get_many(ids, concurrency=2)
+
+    assert mock_list.call_count == 5
+    assert list(customers) == [id for id in ids if not id.endswith("0")]
+    assert len(customers.missing) == 100
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_error(test_async_client):
+    async def list_customers(**kwargs):
+        raise PaddleAPIError(500, "Internal error")
+
+    with patch.object(test_async_client.customers, "_list", side_effect=list_customers):
+        with pytest.raises(PaddleAPIError):
+            await test_async_client.customers.get_many(["ctm_1"])
@@ -0,0 +1,108 @@
+import httpx
+import pytest
+
+from unittest.mock import patch
+
+from paddle.aio.client import AsyncClient
+from paddle.client import Client
+from paddle.utils.cache import MISSING, ResponseCache, split_path
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_split_path():
+    assert split_path("/products/pro_01") == ("products", "pro_01")
+    assert split_path("/customers/ctm_01/addresses/add_01") == ("customers", "ctm_01")
+    assert split_path("/prices") == ("prices", None)
+
+
+def test_cache_ttl_and_stats():
+    timer = FakeTimer()
+    cache = ResponseCache(ttl=10, resource_ttls={"customers": 0}, timer=timer)
+
+    cache.set("product", b"product", "/products/pro_01")
+    cache.set("customer", b"customer", "/customers/ctm_01")
+
+    assert cache.get("product") == b"product"
+    assert cache.get("customer") is MISSING
+    timer.now = 10
+    assert cache.get("product") is MISSING
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 0)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+
+    cache.set("a", 1, "/products/pro_a")
+    cache.set("b", 2, "/products/pro_b")
+    cache.get("a")
+    cache.set("c", 3, "/products/pro_c")
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_cache_invalidate():
+    cache = ResponseCache()
+    cache.set("product", 1, "/products/pro_01")
+    cache.set("other_product", 2, "/products/pro_02")
+    cache.set("products", 3, "/products")
+    cache.set("prices", 4, "/prices")
+    cache.set("customer", 5, "/customers/ctm_01")
+
+    # Lists of the resource and resources including products may contain the product
+    assert cache.invalidate_path("/products/pro_01") == 3
+    assert cache.get("other_product") == 2
+    assert cache.get("customer") == 5
+
+    generation = cache.generation
+    cache.clear()
+    cache.set("product", 1, "/products/pro_01", generation)
+    assert cache.stats.size == 0
+
+
+def test_client_caches_gets_and_invalidates_on_write():
+    client = Client(api_key="fake-key", cache=ResponseCache(resource_ttls={"customers": 0}))
+
+    with patch.object(
+        client._client, "request", return_value=httpx.Response(200, content=b'{"data": {}}')
+    ) as mock_request:
+        for _ in range(3):
+            client._request("GET", "/products/pro_01", params={"include": "prices"}, raw=True)
+        client._request("GET", "/customers/ctm_01")
+        client._request("GET", "/customers/ctm_01")
+        assert mock_request.call_count == 3
+
+        client._request("PATCH", "/prices/pri_01", json={"description": "Price"})
+        client._request("GET", "/products/pro_01", params={"include": "prices"}, raw=True)
+        assert mock_request.call_count == 5
+
+    assert client.cache.stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_cache():
+    client = AsyncClient(api_key="fake-key", cache=ResponseCache())
+
+    async def request(**kwargs):
+        return httpx.Response(200, content=b'{"data": {}}')
+
+    with patch.object(client._client, "request", side_effect=request) as mock_request:
+        await client._request("GET", "/prices", params={"product_id": "pro_01"})
+        assert await client._request("GET", "/prices", params={"product_id": "pro_01"}) == {
+            "data": {}
+        }
+        await client._request("POST", "/prices", json={"description": "Price"})
+        await client._request("GET", "/prices", params={"product_id": "pro_01"})
+
+    assert mock_request.call_count == 3
@@ -4,8 +4,8 @@ import pytest
 import httpx
 
 from unittest.mock import patch
-from paddle.client import Client, Environment
-from paddle.aio.client import AsyncClient
+from paddle.client import Client, ClientFactory, Environment
+from paddle.aio.client import AsyncClient, AsyncClientFactory
 from paddle.exceptions import PaddleAPIError
 
 
@@ -148,3 +148,112 @@ async def test_async_network_error(test_async_client):
         with pytest.raises(PaddleAPIError) as exc_info:
             await test_async_client._request("GET", "/test")
         assert exc_info.value.status_code == 500
+
+
+def test_client_connection_options():
+    """Test pool limits and timeouts are passed to the HTTP client."""
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30)
+    timeout = httpx.Timeout(30, connect=5, pool=1)
+    client = Client(
+        api_key="test-key", environment=Environment.SANDBOX, timeout=timeout, limits=limits
+    )
+    assert client.limits is limits
+    assert client._client.timeout == timeout
+
+
+def test_client_http2():
+    """Test HTTP/2 can be enabled."""
+    pytest.importorskip("h2")
+    client = Client(api_key="test-key", environment=Environment.SANDBOX, http2=True)
+    assert client.http2
+
+
+def test_client_custom_transport():
+    """Test requests go through a custom transport."""
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer test-key"
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = Client(
+        api_key="test-key",
+        environment=Environment.SANDBOX,
+        transport=httpx.MockTransport(handler),
+    )
+    assert client._request("GET", "/products") == {"path": "/products"}
+
+
+def test_client_injected_http_client():
+    """Test a pre-built HTTP client is used and left open."""
+    http_client = httpx.Client()
+    with Client(
+        api_key="test-key", environment=Environment.SANDBOX, http_client=http_client
+    ) as client:
+        assert client._client is http_client
+        assert "Authorization" not in http_client.headers
+    assert not http_client.is_closed
+    http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_custom_transport():
+    """Test async requests go through a custom transport."""
+
+    async def handler(request):
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async with AsyncClient(
+        api_key="test-key",
+        environment=Environment.SANDBOX,
+        transport=httpx.MockTransport(handler),
+        limits=httpx.Limits(max_connections=500),
+    ) as client:
+        assert await client._request("GET", "/prices") == {"path": "/prices"}
+
+
+def test_client_factory_shares_connection_pool():
+    """Test clients created by a factory share one HTTP client and authenticate per request."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"success": True})
+
+    with ClientFactory(
+        environment=Environment.SANDBOX, transport=httpx.MockTransport(handler), max_retries=1
+    ) as factory:
+        first = factory.get("key-1")
+        second = factory.get("key-2")
+
+        assert first is factory.get("key-1")
+        assert first._client is second._client
+        assert first.max_retries == 1
+
+        first._request("GET", "/products")
+        second._request("GET", "/products")
+
+    assert seen == ["Bearer key-1", "Bearer key-2"]
+    assert first._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_factory_shares_connection_pool():
+    """Test async clients created by a factory share one HTTP client."""
+    seen = []
+
+    async def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"success": True})
+
+    async with AsyncClientFactory(transport=httpx.MockTransport(handler)) as factory:
+        first = factory.get("key-1")
+        second = factory.get("key-2")
+        assert first._client is second._client
+
+        await first._request("GET", "/products")
+        await second._request("GET", "/products")
+
+        factory.remove("key-1")
+        assert factory.get("key-1") is not first
+
+    assert seen == ["Bearer key-1", "Bearer key-2"]
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from unittest.mock import patch
+
+from paddle.exceptions import PaddleAPIError
+from paddle.models.responses.customers import CustomerCreateResponse
+from paddle.utils.concurrency import amap_concurrently, map_concurrently
+
+
+@pytest.fixture
+def customer_response(make_customer):
+    def customer_response(email):
+        customer = make_customer(f"ctm_{email.split('@')[0]}", email=email)
+        return json.dumps({"data": customer, "meta": {"request_id": "test"}}).encode()
+
+    return customer_response
+
+
+def test_map_concurrently_ordered():
+    def func(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    results = list(map_concurrently(func, range(5), concurrency=5))
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.result for result in results] == [0, 2, 4, 6, 8]
+
+
+def test_map_concurrently_as_completed():
+    def func(item):
+        time.sleep(0.02 * (3 - item))
+        return item
+
+    results = list(map_concurrently(func, range(3), concurrency=3, ordered=False))
+
+    assert [result.item for result in results] == [2, 1, 0]
+
+
+def test_map_concurrently_bounds_concurrency_and_errors():
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def func(item):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        if item == 3:
+            raise ValueError("invalid")
+        return item
+
+    results = list(map_concurrently(func, range(20), concurrency=4))
+
+    assert max_running <= 4
+    assert len(results) == 20
+    assert not results[3].ok
+    assert isinstance(results[3].error, ValueError)
+    assert all(result.ok for result in results if result.index != 3)
+
+
+def test_map_concurrently_streams_input():
+    consumed = []
+
+    def items():
+        for item in range(1000):
+            consumed.append(item)
+            yield item
+
+    results = map_concurrently(lambda item: item, items(), concurrency=2)
+    next(results)
+    results.close()
+
+    assert len(consumed) < 10
+
+
+def test_map_concurrently_invalid_concurrency():
+    with pytest.raises(ValueError):
+        list(map_concurrently(lambda item: item, [1], concurrency=0))
+
+
+@pytest.mark.asyncio
+async def test_amap_concurrently():
+    running = 0
+    max_running = 0
+
+    async def func(item):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001 * (10 - item % 10))
+        running -= 1
+        if item == 5:
+            raise ValueError("invalid")
+        return item
+
+    async def items():
+        for item in range(30):
+            yield item
+
+    results = [result async for result in amap_concurrently(func, items(), concurrency=3)]
+
+    assert max_running <= 3
+    assert [result.index for result in results] == list(range(30))
+    assert not results[5].ok
+
+    unordered = [result async for result in amap_concurrently(func, range(30), 3, ordered=False)]
+    assert sorted(result.index for result in unordered) == list(range(30))
+
+
+def test_customer_bulk_create(test_client, customer_response):
+    def create(**kwargs):
+        if kwargs["email"] == "bad@example.com":
+            raise PaddleAPIError(400, "Invalid email")
+        return customer_response(kwargs["email"])
+
+    customers = [
+        {"email": "a@example.com"},
+        {"email": "bad@example.com"},
+        {"email": "c@example.com"},
+    ]
+    with patch.object(test_client.customers, "_create", side_effect=create):
+        results = list(test_client.customers.bulk_create(customers, concurrency=2))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[0].result, CustomerCreateResponse)
+    assert results[2].result.data.email == "c@example.com"
+    assert results[1].error.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_async_customer_bulk_create(test_async_client, customer_response):
+    async def create(**kwargs):
+        return customer_response(kwargs["email"])
+
+    customers = ({"email": f"{index}@example.com"} for index in range(10))
+    with patch.object(test_async_client.customers, "_create", side_effect=create):
+        results = [
+            result
+            async for result in test_async_client.customers.bulk_create(customers, concurrency=3)
+        ]
+
+    assert all(result.ok for result in results)
+    assert [result.result.data.id for result in results] == [f"ctm_{i}" for i in range(10)]
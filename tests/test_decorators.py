@@ -1,7 +1,9 @@
 import pytest
-from typing import Optional
-from pydantic import ValidationError
+from typing import Annotated, List, Literal, Optional
+from unittest.mock import patch
+from pydantic import BaseModel, Field, ValidationError
 
+from paddle.models.responses.subscriptions import BillingDetailsType
 from paddle.utils.decorators import validate_params
 
 
@@ -119,3 +121,79 @@ def test_sync_wrapper_error_handling():
         sync_function(name="John", age="thirty")
     assert exc_info.value.error_count() == 1
     assert "age" in str(exc_info.value)
+
+
+class Address(BaseModel):
+    city: str
+
+
+def test_validate_params_fast_path_types():
+    @validate_params
+    def function(
+        status: Literal["active", "archived"],
+        ids: Optional[List[str]] = None,
+        address: Optional[Address] = None,
+        per_page: Annotated[int, Field(ge=1, le=200)] = 50,
+    ):
+        return status
+
+    assert function("active", ids=["ctm_1"], address=Address(city="Paris"), per_page=200)
+    with pytest.raises(ValidationError):
+        function("deleted")
+    with pytest.raises(ValidationError):
+        function("active", ids=["ctm_1", 2])
+    with pytest.raises(ValidationError):
+        function("active", per_page=500)
+
+
+def test_validate_params_positional_and_missing_args():
+    @validate_params
+    def function(name: str, age: int):
+        return {"name": name, "age": age}
+
+    assert function("John", 30) == {"name": "John", "age": 30}
+    with pytest.raises(ValidationError):
+        function("John")
+    with pytest.raises(ValidationError):
+        function("John", "thirty")
+
+
+def test_validate_params_disabled_on_object():
+    class Resource:
+        _validate_params = False
+
+        @validate_params
+        def get(self, age: int):
+            return age
+
+    assert Resource().get("thirty") == "thirty"
+
+
+def test_client_validate_params_setting(test_client):
+    test_client.validate_params = False
+
+    with patch.object(test_client.customers, "_get", return_value={"data": {}}) as mock_get:
+        with patch.object(test_client.customers, "_parse_response"):
+            test_client.customers.get(123)
+
+    mock_get.assert_called_once()
+
+
+def test_validate_params_passes_original_arguments():
+    @validate_params
+    def function(details: BillingDetailsType, count: int, ids: Optional[List[str]] = None):
+        return details, count, ids
+
+    details = {
+        "enable_checkout": True,
+        "purchase_order_number": "PO-1",
+        "additional_information": None,
+        "payment_terms": {"interval": "month", "frequency": 1},
+        "extra": "kept",
+    }
+    ids = ("ctm_1",)
+
+    assert function(details, 1, ids=ids) == (details, 1, ids)
+    assert isinstance(function(details, 1.0)[1], float)
+    with pytest.raises(ValidationError):
+        function({"extra": "kept"}, 1)
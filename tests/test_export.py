@@ -0,0 +1,190 @@
+import csv
+import gzip
+import io
+import json
+
+import httpx
+import pytest
+
+from paddle.client import Client
+from paddle.exceptions import PaddleAPIError
+from paddle.models.responses.subscriptions import SubscriptionData
+from paddle.testing import FakePaddleAPI
+from paddle.utils.export import flatten, model_columns, write_export
+
+PRICES = [
+    {
+        "id": "pri_01",
+        "unit_price": {"amount": "1000", "currency_code": "USD"},
+        "billing_cycle": None,
+        "unit_price_overrides": [{"country_codes": ["FR"]}],
+        "custom_data": {},
+    },
+    {
+        "id": "pri_02",
+        "unit_price": {"amount": "500", "currency_code": "EUR"},
+        "billing_cycle": {"interval": "month", "frequency": 1},
+        "unit_price_overrides": [],
+        "custom_data": {},
+        "import_meta": None,
+    },
+]
+
+
+def test_flatten():
+    assert flatten(PRICES[1]) == {
+        "id": "pri_02",
+        "unit_price.amount": "500",
+        "unit_price.currency_code": "EUR",
+        "billing_cycle.interval": "month",
+        "billing_cycle.frequency": 1,
+        "unit_price_overrides": [],
+        "custom_data": {},
+        "import_meta": None,
+    }
+
+
+def test_model_columns():
+    columns = model_columns(SubscriptionData, explode="items")
+
+    assert next(iter(columns)) == "id"
+    assert columns["items.quantity"] is int
+    assert columns["items.price.unit_price.amount"] is str
+    assert columns["billing_details.enable_checkout"] is bool
+    assert columns["custom_data"] is str
+    assert "items" not in columns
+
+
+def test_write_csv(tmp_path):
+    path = tmp_path / "prices.csv"
+
+    assert write_export([PRICES[:1], PRICES[1:]], path, format="csv") == 2
+
+    rows = list(csv.DictReader(io.StringIO(path.read_text())))
+    assert rows[0]["unit_price.amount"] == "1000"
+    assert rows[0]["unit_price_overrides"] == '[{"country_codes":["FR"]}]'
+    assert rows[0]["billing_cycle"] == ""
+    # Columns come from the first page
+    assert "billing_cycle.interval" not in rows[1]
+    assert rows[1]["unit_price.currency_code"] == "EUR"
+
+
+def test_write_ndjson_gzip(tmp_path):
+    path = tmp_path / "prices.ndjson.gz"
+
+    write_export([PRICES], path)
+
+    with gzip.open(path, "rt") as file:
+        assert [json.loads(line) for line in file] == PRICES
+
+
+def test_resource_export(tmp_path):
+    api = FakePaddleAPI(seed=1)
+    api.populate(customers=450)
+    client = Client(api_key="fake-key", transport=api.transport())
+    customer_ids = sorted(api.entities["customers"])
+    api.entities["customers"][customer_ids[0]]["marketing_consent"] = True
+    path = tmp_path / "customers.csv"
+
+    assert client.customers.export(str(path), format="csv", status=["active"]) == 450
+
+    rows = list(csv.DictReader(io.StringIO(path.read_text())))
+    assert [row["id"] for row in rows] == customer_ids
+    assert rows[0]["marketing_consent"] == "true"
+    # Columns come from the response model
+    assert rows[0]["import_meta.external_id"] == ""
+
+
+def test_subscription_items_parquet_export(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    def subscription(id, items):
+        return {
+            "id": id,
+            "status": "active",
+            "customer_id": "ctm_01",
+            "currency_code": "USD",
+            "custom_data": {"plan": {"tier": "pro"}},
+            "items": [
+                {
+                    "status": "active",
+                    "quantity": quantity,
+                    "recurring": True,
+                    "price": {"id": price_id, "unit_price": {"amount": "1000"}},
+                }
+                for price_id, quantity in items
+            ],
+        }
+
+    subscriptions = [
+        subscription("sub_01", [("pri_01", 1), ("pri_02", 3)]),
+        subscription("sub_02", []),
+    ]
+
+    def handle(request):
+        pagination = {"per_page": 200, "next": None, "has_more": False, "estimated_total": 2}
+        return httpx.Response(
+            200,
+            json={"data": subscriptions, "meta": {"request_id": "test", "pagination": pagination}},
+        )
+
+    client = Client(api_key="fake-key", transport=httpx.MockTransport(handle))
+    path = tmp_path / "items.parquet"
+
+    count = client.subscriptions.export(str(path), format="parquet", explode="items")
+
+    table = pq.read_table(path)
+    assert count == table.num_rows == 3
+    assert table.schema.field("items.quantity").type == "int64"
+    rows = table.select(["id", "items.price.id", "items.quantity", "custom_data"]).to_pylist()
+    assert rows == [
+        {
+            "id": "sub_01",
+            "items.price.id": "pri_01",
+            "items.quantity": 1,
+            "custom_data": '{"plan":{"tier":"pro"}}',
+        },
+        {
+            "id": "sub_01",
+            "items.price.id": "pri_02",
+            "items.quantity": 3,
+            "custom_data": '{"plan":{"tier":"pro"}}',
+        },
+        {
+            "id": "sub_02",
+            "items.price.id": None,
+            "items.quantity": None,
+            "custom_data": '{"plan":{"tier":"pro"}}',
+        },
+    ]
+
+
+def test_write_parquet_infers_schema(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "prices.parquet"
+
+    assert write_export([PRICES[:1], PRICES[1:]], path, format="parquet") == 2
+
+    table = pq.read_table(path)
+    assert table.column("unit_price.amount").to_pylist() == ["1000", "500"]
+    assert table.column("unit_price_overrides").to_pylist() == ['[{"country_codes":["FR"]}]', "[]"]
+
+
+def test_failed_export_leaves_no_file(tmp_path):
+    api = FakePaddleAPI()
+    api.populate(customers=300)
+    transport = api.transport()
+
+    def handle(request):
+        # Fail after the first page
+        if "after" in request.url.params:
+            api.inject(400)
+        return transport.handle_request(request)
+
+    client = Client(api_key="fake-key", max_retries=0, transport=httpx.MockTransport(handle))
+    path = tmp_path / "customers.ndjson"
+
+    with pytest.raises(PaddleAPIError):
+        client.customers.export(str(path))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+# Time budget for importing paddle's own modules, dependencies like httpx not included
+IMPORT_BUDGET_MS = 100
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout, result.stderr
+
+
+def test_import_does_not_load_resources():
+    stdout, _ = _run(
+        "import sys, paddle; paddle.Client(api_key='fake-key'); print(','.join(sys.modules))"
+    )
+    modules = stdout.strip().split(",")
+
+    assert "paddle.client" in modules
+    assert not [module for module in modules if module.startswith("paddle.models")]
+    assert "paddle.utils.constants" not in modules
+    assert "pydantic" not in modules
+
+
+def test_resources_are_loaded_on_first_access():
+    stdout, _ = _run(
+        "import sys, paddle\n"
+        "client = paddle.Client(api_key='fake-key')\n"
+        "client.customers\n"
+        "print(','.join(sys.modules))"
+    )
+    modules = stdout.strip().split(",")
+
+    assert "paddle.models.resources.customers" in modules
+    assert "paddle.models.resources.subscriptions" not in modules
+
+
+def test_import_time_budget():
+    _, stderr = _run("import paddle")
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    self_time_us = 0
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip().startswith("paddle"):
+            self_time_us += int(parts[0].split(":")[1])
+
+    assert self_time_us / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+from unittest.mock import patch
+
+from paddle.exceptions import PaddleNotFoundError
+from paddle.utils.loader import AsyncBatchLoader
+
+
+@pytest.mark.asyncio
+async def test_loader_batches_keys():
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    loader = AsyncBatchLoader(load_many, max_batch_size=3)
+    results = await asyncio.gather(
+        loader.load("a"),
+        loader.load("b"),
+        loader.load("a"),
+        loader.load("c"),
+        loader.load("d"),
+        loader.load("missing"),
+        return_exceptions=True,
+    )
+
+    assert batches == [["a", "b", "c"], ["d", "missing"]]
+    assert results[:5] == ["A", "B", "A", "C", "D"]
+    assert isinstance(results[5], KeyError)
+
+
+@pytest.mark.asyncio
+async def test_loader_propagates_errors():
+    async def load_many(keys):
+        raise ValueError("failed")
+
+    loader = AsyncBatchLoader(load_many)
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_customer_load(test_async_client, make_customer, make_page):
+    async def list_customers(**kwargs):
+        ids = kwargs["id"].split(",")
+        customers = [make_customer(id) for id in ids if id != "ctm_x"]
+        return json.dumps(make_page(customers)).encode()
+
+    with patch.object(
+        test_async_client.customers, "_list", side_effect=list_customers
+    ) as mock_list:
+        customers = await asyncio.gather(
+            *[test_async_client.customers.load(f"ctm_{index}") for index in range(5)]
+        )
+        with pytest.raises(PaddleNotFoundError):
+            await test_async_client.customers.load("ctm_x")
+
+    assert [customer.id for customer in customers] == [f"ctm_{index}" for index in range(5)]
+    assert mock_list.call_count == 2
+    assert mock_list.call_args_list[0].kwargs["status"] == "active,archived"
@@ -0,0 +1,69 @@
+import pytest
+
+from paddle.client import Client
+from paddle.mirror import CatalogMirror
+from paddle.models.responses.customers import CustomerData
+from paddle.testing import FakePaddleAPI
+
+
+@pytest.fixture
+def api():
+    api = FakePaddleAPI(seed=1)
+    api.populate(customers=5, products=3, prices_per_product=1)
+    # Archived entities are only listed with a status filter
+    archived_id = sorted(api.entities["products"])[1]
+    api.entities["products"][archived_id]["status"] = "archived"
+    return api
+
+
+@pytest.fixture
+def client(api):
+    return Client(api_key="fake-key", transport=api.transport())
+
+
+def test_sync_and_query(client, api, tmp_path):
+    product_ids = sorted(api.entities["products"])
+    customer_ids = sorted(api.entities["customers"])
+    customer = api.entities["customers"][customer_ids[2]]
+
+    with CatalogMirror(str(tmp_path / "catalog.db")) as mirror:
+        assert mirror.sync(client) == {"products": 3, "prices": 3, "customers": 5}
+
+        product = api.entities["products"][product_ids[0]]
+        assert mirror.get_product(product["id"]).name == product["name"]
+        assert mirror.get_price("pri_missing") is None
+        archived = mirror.list_products(status="archived")
+        assert [product.id for product in archived] == [product_ids[1]]
+        prices = mirror.list_prices(product_id=product_ids[0])
+        assert [price.product_id for price in prices] == [product_ids[0]]
+        assert mirror.list_customers(email=customer["email"])[0].id == customer["id"]
+        customers = mirror.list_customers(id=[customer_ids[0], customer_ids[4], "ctm_09"])
+        assert len(customers) == 2
+
+    # The mirror persists
+    with CatalogMirror(str(tmp_path / "catalog.db")) as mirror:
+        assert mirror.count("customers") == 5
+
+
+def test_sync_removes_deleted_entities(client, api):
+    mirror = CatalogMirror()
+    mirror.sync(client, ["customers"])
+    deleted_id = min(api.entities["customers"])
+    del api.entities["customers"][deleted_id]
+
+    assert mirror.sync(client, ["customers"]) == {"customers": 4}
+    assert mirror.get_customer(deleted_id) is None
+    assert mirror.count("products") == 0
+
+
+def test_upsert_and_delete(make_customer):
+    mirror = CatalogMirror()
+    customer = CustomerData.model_validate(make_customer("ctm_01", name="Jo"))
+
+    assert mirror.upsert("customers", [customer, make_customer("ctm_02")]) == 2
+    assert mirror.get_customer("ctm_01") == customer
+    assert mirror.delete("customers", ["ctm_01", "ctm_09"]) == 1
+    assert mirror.count("customers") == 1
+
+    with pytest.raises(ValueError):
+        mirror.upsert("subscriptions", [])
@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+from unittest.mock import patch
+
+from paddle.exceptions import PaddleAPIError
+from paddle.models.responses.shared import Pagination
+from paddle.utils.checkpoints import FileCheckpointStore, MemoryCheckpointStore
+from paddle.utils.pagination import get_checkpoint_key, get_next_cursor
+
+
+@pytest.fixture
+def pages(make_customer, make_page):
+    def page(ids, next_after=None):
+        customers = [make_customer(customer_id) for customer_id in ids]
+        return make_page(customers, next_after=next_after, per_page=2, estimated_total=5)
+
+    return [
+        page(["ctm_1", "ctm_2"], next_after="ctm_2"),
+        page(["ctm_3", "ctm_4"], next_after="ctm_4"),
+        page(["ctm_5"]),
+    ]
+
+
+def test_get_next_cursor():
+    pagination = Pagination(
+        per_page=50,
+        next="https://api.paddle.com/customers?after=ctm_01&per_page=50",
+        has_more=True,
+        estimated_total=100,
+    )
+    assert get_next_cursor(pagination) == "ctm_01"
+
+    pagination.has_more = False
+    assert get_next_cursor(pagination) is None
+
+
+def test_iter_all(test_client, pages):
+    with patch.object(test_client.customers, "_list", side_effect=pages) as mock_list:
+        ids = [customer.id for customer in test_client.customers.iter_all(per_page=2)]
+
+    assert ids == ["ctm_1", "ctm_2", "ctm_3", "ctm_4", "ctm_5"]
+    assert mock_list.call_count == 3
+    assert "after" not in mock_list.call_args_list[0].kwargs
+    assert mock_list.call_args_list[1].kwargs["after"] == "ctm_2"
+    assert mock_list.call_args_list[2].kwargs["after"] == "ctm_4"
+    assert all(call.kwargs["per_page"] == 2 for call in mock_list.call_args_list)
+
+
+def test_iter_all_is_lazy(test_client, pages):
+    with patch.object(test_client.customers, "_list", side_effect=pages) as mock_list:
+        iterator = test_client.customers.iter_all()
+        assert mock_list.call_count == 0
+
+        next(iterator)
+        next(iterator)
+        assert mock_list.call_count == 1
+
+        next(iterator)
+        assert mock_list.call_count == 2
+
+
+def test_iter_all_resumes_from_checkpoint(test_client, tmp_path, pages):
+    store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    exported = []
+
+    with patch.object(
+        test_client.customers,
+        "_list",
+        side_effect=[pages[0], pages[1], PaddleAPIError(500, "Internal error")],
+    ):
+        with pytest.raises(PaddleAPIError):
+            for customer in test_client.customers.iter_all(per_page=2, checkpoints=store):
+                exported.append(customer.id)
+
+    key = get_checkpoint_key("customers", {"per_page": 2})
+    assert store.load(key) == {"after": "ctm_4"}
+
+    with patch.object(test_client.customers, "_list", side_effect=pages[2:]) as mock_list:
+        for customer in test_client.customers.iter_all(per_page=2, checkpoints=store):
+            exported.append(customer.id)
+
+    assert mock_list.call_args.kwargs["after"] == "ctm_4"
+    assert exported == ["ctm_1", "ctm_2", "ctm_3", "ctm_4", "ctm_5"]
+    assert store.load(key) is None
+
+
+def test_iter_all_redelivers_partially_consumed_page(test_client, pages):
+    store = MemoryCheckpointStore()
+
+    with patch.object(test_client.customers, "_list", side_effect=pages):
+        iterator = test_client.customers.iter_all(checkpoints=store, checkpoint_key="export")
+        assert [next(iterator).id for _ in range(4)] == ["ctm_1", "ctm_2", "ctm_3", "ctm_4"]
+
+    with patch.object(test_client.customers, "_list", side_effect=pages[1:]):
+        ids = [
+            customer.id
+            for customer in test_client.customers.iter_all(
+                checkpoints=store, checkpoint_key="export"
+            )
+        ]
+
+    assert ids == ["ctm_3", "ctm_4", "ctm_5"]
+
+
+@pytest.mark.asyncio
+async def test_aiter_all(test_async_client, pages):
+    with patch.object(test_async_client.customers, "_list", side_effect=pages) as mock_list:
+        ids = [customer.id async for customer in test_async_client.customers.aiter_all()]
+
+    assert ids == ["ctm_1", "ctm_2", "ctm_3", "ctm_4", "ctm_5"]
+    assert mock_list.call_count == 3
+    assert mock_list.call_args_list[2].kwargs["after"] == "ctm_4"
+
+
+@pytest.mark.asyncio
+async def test_aiter_all_prefetch(test_async_client, pages):
+    with patch.object(test_async_client.customers, "_list", side_effect=pages) as mock_list:
+        iterator = test_async_client.customers.aiter_all(prefetch=1)
+        assert (await iterator.__anext__()).id == "ctm_1"
+
+        # The second page is requested while the first one is still being consumed
+        await asyncio.sleep(0.01)
+        assert mock_list.call_count == 2
+
+        ids = ["ctm_1"] + [customer.id async for customer in iterator]
+
+    assert ids == ["ctm_1", "ctm_2", "ctm_3", "ctm_4", "ctm_5"]
+    assert mock_list.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_aiter_all_prefetch_error(test_async_client, pages):
+    with patch.object(
+        test_async_client.customers,
+        "_list",
+        side_effect=[pages[0], PaddleAPIError(500, "Internal server error")],
+    ):
+        ids = []
+        with pytest.raises(PaddleAPIError):
+            async for customer in test_async_client.customers.aiter_all(prefetch=2):
+                ids.append(customer.id)
+
+    assert ids == ["ctm_1", "ctm_2"]
+
+
+@pytest.mark.asyncio
+async def test_aiter_all_checkpoints_consumed_pages(test_async_client, pages):
+    store = MemoryCheckpointStore()
+    key = get_checkpoint_key("customers", {"per_page": 2})
+
+    with patch.object(test_async_client.customers, "_list", side_effect=pages) as mock_list:
+        iterator = test_async_client.customers.aiter_all(per_page=2, prefetch=2, checkpoints=store)
+        ids = [(await iterator.__anext__()).id for _ in range(3)]
+        await asyncio.sleep(0.01)
+        await iterator.aclose()
+
+    # Every page was prefetched, but only the first one was consumed
+    assert mock_list.call_count == 3
+    assert store.load(key) == {"after": "ctm_2"}
+
+    with patch.object(test_async_client.customers, "_list", side_effect=pages[1:]) as mock_list:
+        async for customer in test_async_client.customers.aiter_all(per_page=2, checkpoints=store):
+            ids.append(customer.id)
+
+    assert mock_list.call_args_list[0].kwargs["after"] == "ctm_2"
+    assert ids == ["ctm_1", "ctm_2", "ctm_3", "ctm_3", "ctm_4", "ctm_5"]
+    assert store.load(key) is None
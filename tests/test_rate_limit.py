@@ -0,0 +1,87 @@
+import pytest
+import httpx
+
+from unittest.mock import patch
+
+from paddle.client import Client, Environment
+from paddle.aio.client import AsyncClient
+from paddle.utils import RateLimiter
+
+
+def test_rate_limiter_burst_then_spacing():
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_invalid_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+def test_rate_limiter_on_rate_limited():
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.on_rate_limited(retry_after=2)
+
+    assert limiter.current_rate == 5
+    # Waiters are spread out after the pause instead of waking up together
+    first = limiter.reserve()
+    second = limiter.reserve()
+    assert first == pytest.approx(2.2, abs=0.01)
+    assert second == pytest.approx(2.4, abs=0.01)
+
+
+def test_rate_limiter_recovers_on_success():
+    limiter = RateLimiter(rate=10)
+    limiter.on_rate_limited()
+    assert limiter.current_rate == 5
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.current_rate == 10
+
+
+def test_client_shares_rate_limiter():
+    client = Client(api_key="test-key", environment=Environment.SANDBOX, rate_limit=5)
+    assert isinstance(client.rate_limiter, RateLimiter)
+    assert client.rate_limiter.rate == 5
+    assert client.products._client.rate_limiter is client.customers._client.rate_limiter
+
+    client = Client(api_key="test-key", environment=Environment.SANDBOX)
+    assert client.rate_limiter is None
+
+
+def test_client_rate_limited_response():
+    client = Client(api_key="test-key", environment=Environment.SANDBOX, rate_limit=100)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.05"}, json={"error": "Too many requests"}),
+        httpx.Response(200, json={"success": True}),
+    ]
+
+    with patch.object(client._client, "request", side_effect=responses):
+        with patch("paddle.client.time.sleep") as mock_sleep:
+            resp = client._request("GET", "/test")
+
+    assert resp == {"success": True}
+    # The limiter handles the Retry-After delay instead of the flat retry sleep
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args.args[0] == pytest.approx(0.05 + 1 / 50, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_async_client_acquires_rate_limiter():
+    client = AsyncClient(api_key="test-key", environment=Environment.SANDBOX, rate_limit=100)
+    mock_response = httpx.Response(200, json={"success": True})
+
+    with patch.object(client._client, "request", return_value=mock_response):
+        with patch.object(client.rate_limiter, "acquire_async") as mock_acquire:
+            resp = await client._request("GET", "/test")
+
+    assert resp == {"success": True}
+    mock_acquire.assert_awaited_once()
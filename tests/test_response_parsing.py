@@ -0,0 +1,191 @@
+import json
+
+import httpx
+import pytest
+
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from paddle.models.responses.base import LazyList, eager_validation, parse_response
+from paddle.models.responses.customers import CustomerListResponse, CustomerGetResponse
+from paddle.models.responses.customers import CustomerData
+from paddle.models.responses.shared import MetaWithPagination, Pagination
+
+CUSTOMER = {
+    "id": "ctm_123",
+    "name": "Jane",
+    "email": "jane@example.com",
+    "marketing_consent": False,
+    "status": "active",
+    "locale": "en",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+LIST_RESPONSE = {
+    "data": [CUSTOMER],
+    "meta": {
+        "request_id": "req_123",
+        "pagination": {"per_page": 50, "next": "", "has_more": False, "estimated_total": 1},
+    },
+}
+
+
+def test_parse_response_from_bytes_matches_dict():
+    from_bytes = parse_response(CustomerListResponse, json.dumps(LIST_RESPONSE).encode())
+    from_dict = parse_response(CustomerListResponse, LIST_RESPONSE)
+
+    assert isinstance(from_bytes, CustomerListResponse)
+    assert isinstance(from_bytes.meta, MetaWithPagination)
+    assert from_bytes == from_dict
+
+
+def test_parse_response_invalid_bytes():
+    with pytest.raises(ValueError):
+        parse_response(CustomerGetResponse, b'{"data": {"id": "ctm_123"}, "meta": {}}')
+
+
+def test_resource_validates_raw_response(test_client):
+    content = json.dumps({"data": CUSTOMER, "meta": {"request_id": "req_123"}}).encode()
+    mock_response = httpx.Response(200, content=content)
+
+    with patch.object(test_client._client, "request", return_value=mock_response):
+        response = test_client.customers.get("ctm_123")
+
+    assert isinstance(response, CustomerGetResponse)
+    assert response.data.email == "jane@example.com"
+    assert response.meta.request_id == "req_123"
+
+
+def test_client_json_decoder(test_client):
+    mock_response = httpx.Response(200, content=b'{"success": true}')
+    test_client.json_decoder = lambda content: {"decoded": content}
+
+    with patch.object(test_client._client, "request", return_value=mock_response):
+        assert test_client._request("GET", "/test") == {"decoded": b'{"success": true}'}
+        assert test_client._request("GET", "/test", raw=True) == b'{"success": true}'
+
+
+def test_parse_response_construct_mode():
+    payload = json.dumps(LIST_RESPONSE).encode()
+    response = parse_response(CustomerListResponse, payload, "construct")
+
+    assert isinstance(response, CustomerListResponse)
+    assert isinstance(response.data[0], CustomerData)
+    assert isinstance(response.meta.pagination, Pagination)
+    assert response == parse_response(CustomerListResponse, payload)
+
+
+def test_parse_response_construct_mode_skips_validation():
+    response = parse_response(CustomerGetResponse, {"data": {"id": 1}, "meta": {}}, "construct")
+
+    assert response.data.id == 1
+
+
+def test_parse_response_raw_mode():
+    payload = json.dumps(LIST_RESPONSE).encode()
+
+    assert parse_response(CustomerListResponse, payload, "raw") == LIST_RESPONSE
+    assert parse_response(CustomerListResponse, LIST_RESPONSE, "raw") is LIST_RESPONSE
+
+
+def test_parse_response_unknown_mode():
+    with pytest.raises(ValueError):
+        parse_response(CustomerListResponse, LIST_RESPONSE, "fast")
+
+
+def test_client_response_mode(test_client):
+    assert test_client.webhooks._client is test_client
+    raw_client = test_client.with_response_mode("raw")
+
+    assert test_client.response_mode == "model"
+    assert raw_client.response_mode == "raw"
+    assert raw_client._client is test_client._client
+    assert raw_client.customers._client is raw_client
+    assert raw_client.webhooks._client is raw_client
+
+    content = json.dumps(LIST_RESPONSE).encode()
+    with patch.object(
+        test_client._client, "request", return_value=httpx.Response(200, content=content)
+    ):
+        assert raw_client.customers.list() == LIST_RESPONSE
+        assert isinstance(test_client.customers.list(), CustomerListResponse)
+
+    with pytest.raises(ValueError):
+        test_client.with_response_mode("fast")
+
+
+def test_iter_all_raw_mode(test_client):
+    raw_client = test_client.with_response_mode("raw")
+
+    with patch.object(raw_client.customers, "_list", return_value=LIST_RESPONSE):
+        assert list(raw_client.customers.iter_all()) == [CUSTOMER]
+
+
+@pytest.mark.asyncio
+async def test_async_client_response_mode(test_async_client):
+    assert test_async_client.webhooks._client is test_async_client
+    construct_client = test_async_client.with_response_mode("construct")
+    assert construct_client.webhooks._client is construct_client
+    content = json.dumps(LIST_RESPONSE).encode()
+
+    with patch.object(
+        test_async_client._client, "request", return_value=httpx.Response(200, content=content)
+    ):
+        response = await construct_client.customers.list()
+
+    assert isinstance(response, CustomerListResponse)
+    assert response.data[0].email == "jane@example.com"
+
+
+def test_list_response_validates_items_on_access():
+    page = {**LIST_RESPONSE, "data": [CUSTOMER, {"id": "ctm_invalid"}]}
+    response = parse_response(CustomerListResponse, json.dumps(page).encode())
+
+    assert isinstance(response.data, LazyList)
+    assert len(response.data) == 2
+    assert response.data.raw[1] == {"id": "ctm_invalid"}
+    assert response.data[0] is response.data[-2]
+    assert response.data[:1] == [CustomerData(**CUSTOMER)]
+
+    with pytest.raises(ValidationError):
+        response.data[1]
+    with pytest.raises(IndexError):
+        response.data[2]
+
+
+def test_eager_validation():
+    content = json.dumps(LIST_RESPONSE).encode()
+
+    with eager_validation():
+        response = parse_response(CustomerListResponse, content)
+    assert response.data == [CustomerData(**CUSTOMER)]
+    assert not isinstance(response.data, LazyList)
+    assert isinstance(response.meta, MetaWithPagination)
+
+    invalid = json.dumps({**LIST_RESPONSE, "data": [{"id": "ctm_invalid"}]}).encode()
+    with pytest.raises(ValidationError), eager_validation():
+        parse_response(CustomerListResponse, invalid)
+    assert isinstance(parse_response(CustomerListResponse, content).data, LazyList)
+
+
+def test_iter_all_validates_pages_eagerly(test_client):
+    page = {**LIST_RESPONSE, "data": [CUSTOMER, {"id": "ctm_invalid"}]}
+    content = json.dumps(page).encode()
+
+    with patch.object(test_client.customers, "_list", return_value=content):
+        # The invalid item fails the page before the valid one is yielded
+        with pytest.raises(ValidationError):
+            next(test_client.customers.iter_all())
+
+        assert isinstance(test_client.customers.list().data, LazyList)
+
+
+def test_lazy_list_equality():
+    items = LazyList(CustomerData, [CUSTOMER])
+
+    assert items == [CustomerData(**CUSTOMER)]
+    assert list(items) == [CustomerData(**CUSTOMER)]
+    assert LazyList(CustomerData, []) == []
+    assert items != [CUSTOMER, CUSTOMER]
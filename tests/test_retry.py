@@ -0,0 +1,99 @@
+import pytest
+import httpx
+
+from unittest.mock import patch
+
+from paddle.client import Client, Environment
+from paddle.exceptions import PaddleAPIError
+from paddle.utils import RetryPolicy, RetryBudget, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not-a-number") is None
+
+
+def test_exponential_backoff_without_jitter():
+    policy = RetryPolicy(max_retries=5, base_delay=1, max_delay=5, jitter="none")
+    assert [policy.compute_delay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_full_jitter_is_bounded():
+    policy = RetryPolicy(base_delay=1, max_delay=10, jitter="full")
+    for attempt in range(6):
+        assert 0 <= policy.compute_delay(attempt) <= min(10, 2**attempt)
+
+
+def test_decorrelated_jitter_is_bounded():
+    policy = RetryPolicy(base_delay=1, max_delay=10, jitter="decorrelated")
+    previous = None
+    for attempt in range(10):
+        delay = policy.compute_delay(attempt, previous)
+        assert 1 <= delay <= min(10, (previous or 1) * 3)
+        previous = delay
+
+
+def test_invalid_jitter():
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter="random")
+
+
+def test_retry_delay_limits():
+    policy = RetryPolicy(max_retries=2, base_delay=1, jitter="none", max_elapsed=3)
+
+    assert policy.get_retry_delay(0, elapsed=0) == 1
+    assert policy.get_retry_delay(2, elapsed=0) is None
+    # Retrying would go past max_elapsed
+    assert policy.get_retry_delay(1, elapsed=2) is None
+    # Retry-After is used as a lower bound
+    assert policy.get_retry_delay(0, elapsed=0, retry_after=2.5) == 2.5
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, reserve=2)
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 2
+
+
+def test_client_uses_retry_policy():
+    policy = RetryPolicy(max_retries=4, base_delay=0.25, jitter="none")
+    client = Client(api_key="test-key", environment=Environment.SANDBOX, retry_policy=policy)
+    assert client.retry_policy is policy
+    assert client.max_retries == 4
+
+    mock_response = httpx.Response(500, json={"error": "Server Error"})
+    with patch.object(client._client, "request", return_value=mock_response) as mock_request:
+        with patch("paddle.client.time.sleep") as mock_sleep:
+            with pytest.raises(PaddleAPIError):
+                client._request("GET", "/test")
+
+    assert mock_request.call_count == 5
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 1.0, 2.0]
+
+
+def test_client_retry_budget_exhausted():
+    policy = RetryPolicy(max_retries=3, jitter="none", budget=RetryBudget(ratio=0, reserve=1))
+    client = Client(api_key="test-key", environment=Environment.SANDBOX, retry_policy=policy)
+
+    with patch.object(
+        client._client, "request", side_effect=httpx.RequestError("Network error")
+    ) as mock_request:
+        with patch("paddle.client.time.sleep"):
+            with pytest.raises(PaddleAPIError):
+                client._request("GET", "/test")
+            with pytest.raises(PaddleAPIError):
+                client._request("GET", "/test")
+
+    # One retry for the first request, none left for the second
+    assert mock_request.call_count == 3
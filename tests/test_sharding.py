@@ -0,0 +1,127 @@
+import asyncio
+
+import httpx
+import pytest
+
+from paddle.aio.client import AsyncClient
+from paddle.exceptions import PaddleAPIError
+from paddle.utils.sharding import decode_id, encode_id, split_id_range
+
+
+class FakeCustomers:
+    """Serves customers ordered by ID, counting the requests in flight."""
+
+    def __init__(self, ids, make_customer, make_page, latency=0.01):
+        self.ids = sorted(ids)
+        self.make_customer = make_customer
+        self.make_page = make_page
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.fail_after = None
+
+    async def __call__(self, request):
+        params = request.url.params
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        if self.fail_after is not None and params.get("after") == self.fail_after:
+            return httpx.Response(400, text="Bad request")
+
+        ids = self.ids if params["order_by"] == "id[ASC]" else self.ids[::-1]
+        if "after" in params:
+            ids = [id for id in ids if id > params["after"]]
+        per_page = int(params["per_page"])
+        page = ids[:per_page]
+        has_more = len(ids) > per_page
+
+        customers = [self.make_customer(id) for id in page]
+        next_after = page[-1] if has_more else None
+        return httpx.Response(200, json=self.make_page(customers, next_after, per_page=per_page))
+
+
+@pytest.fixture
+def fake_customers(make_customer, make_page):
+    return lambda ids, latency=0.01: FakeCustomers(ids, make_customer, make_page, latency)
+
+
+def _ids(count, start=10**30, step=10**25):
+    return [encode_id("ctm_", start + index * step) for index in range(count)]
+
+
+def test_id_round_trip():
+    prefix, value = decode_id("ctm_01h8441jn5pcwrfhwh78jqt8hk")
+
+    assert prefix == "ctm_"
+    assert encode_id(prefix, value) == "ctm_01h8441jn5pcwrfhwh78jqt8hk"
+    assert encode_id(prefix, value + 1) > "ctm_01h8441jn5pcwrfhwh78jqt8hk"
+    with pytest.raises(ValueError):
+        decode_id("ctm_01h8441jn5pcwrfhwh78jqt8hl")
+
+
+def test_split_id_range():
+    ids = _ids(101)
+
+    shards = split_id_range(ids[0], ids[-1], 4, after="ctm_0")
+
+    assert [shard[1] for shard in shards] == [ids[25], ids[50], ids[75], None]
+    assert [shard[0] for shard in shards] == ["ctm_0", ids[25], ids[50], ids[75]]
+    # No empty ranges between IDs too close to split
+    assert split_id_range(ids[0], ids[0], 4) == [(None, None)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [False, True])
+async def test_sharded_scan_lists_every_customer_once(ordered, fake_customers):
+    api = fake_customers(_ids(1000))
+    client = AsyncClient(api_key="fake-key", transport=httpx.MockTransport(api))
+
+    customers = [
+        customer
+        async for customer in client.with_response_mode("raw").customers.aiter_sharded(
+            shards=5, ordered=ordered, per_page=50, status=["active"]
+        )
+    ]
+
+    ids = [customer["id"] for customer in customers]
+    assert sorted(ids) == api.ids
+    if ordered:
+        assert ids == api.ids
+    # 2 requests for the bounds, 4 pages per shard and one past the end of 4 shards
+    assert api.requests == 2 + 5 * 4 + 4
+    assert api.max_in_flight == 5
+
+
+@pytest.mark.asyncio
+async def test_sharded_scan_of_models_after_cursor(fake_customers):
+    api = fake_customers(_ids(30), latency=0)
+    client = AsyncClient(api_key="fake-key", transport=httpx.MockTransport(api))
+
+    customers = [
+        customer
+        async for customer in client.customers.aiter_sharded(
+            shards=3, ordered=True, after=api.ids[9], per_page=4
+        )
+    ]
+
+    assert [customer.id for customer in customers] == api.ids[10:]
+
+
+@pytest.mark.asyncio
+async def test_sharded_scan_raises_errors(fake_customers):
+    api = fake_customers(_ids(100), latency=0)
+    api.fail_after = api.ids[69]
+    client = AsyncClient(api_key="fake-key", max_retries=0, transport=httpx.MockTransport(api))
+
+    with pytest.raises(PaddleAPIError):
+        async for _ in client.customers.aiter_sharded(shards=2, per_page=20):
+            pass
+
+    with pytest.raises(ValueError):
+        async for _ in client.customers.aiter_sharded(order_by="id[DESC]"):
+            pass
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from unittest.mock import patch
+
+from paddle.aio.client import AsyncClient
+from paddle.client import Client
+from paddle.utils.single_flight import AsyncSingleFlight, SingleFlight, request_key
+
+
+def test_request_key():
+    assert request_key("GET", "/products", {"a": 1, "b": "x"}) == request_key(
+        "GET", "/products", {"b": "x", "a": "1"}
+    )
+    assert request_key("GET", "/products", {"a": 1}) != request_key("GET", "/products", None)
+    assert request_key("GET", "/products", None, True) != request_key("GET", "/products", None)
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait()
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", func))) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["result"] * 5
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_single_flight_shares_error():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def func():
+        release.wait()
+        raise ValueError("failed")
+
+    def call():
+        try:
+            flight.do("key", func)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_cancelled_caller():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.ensure_future(flight.do("key", func))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(flight.do("key", func))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+    assert len(calls) == 1
+
+
+def test_client_coalesces_gets():
+    client = Client(api_key="fake-key", coalesce_requests=True)
+    release = threading.Event()
+    requests = []
+
+    def request(**kwargs):
+        requests.append(kwargs)
+        release.wait()
+        return httpx.Response(200, content=b'{"data": []}')
+
+    with patch.object(client._client, "request", side_effect=request):
+        threads = [
+            threading.Thread(target=client._request, args=("GET", "/products")) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_gets():
+    client = AsyncClient(api_key="fake-key", coalesce_requests=True)
+    requests = []
+
+    async def request(**kwargs):
+        requests.append(kwargs)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b'{"data": []}')
+
+    with patch.object(client._client, "request", side_effect=request):
+        responses = await asyncio.gather(
+            *[
+                client._request("GET", "/products/pro_1", params={"include": "prices"})
+                for _ in range(10)
+            ],
+            client._request("GET", "/products/pro_1"),
+            client._request("POST", "/products", json={"name": "Product"}),
+            client._request("POST", "/products", json={"name": "Product"}),
+        )
+
+    assert len(requests) == 4
+    assert responses[0] == {"data": []}
+
+
+@pytest.mark.asyncio
+async def test_async_client_does_not_coalesce_by_default(test_async_client):
+    async def request(**kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b'{"data": []}')
+
+    with patch.object(test_async_client._client, "request", side_effect=request) as mock_request:
+        await asyncio.gather(*[test_async_client._request("GET", "/products") for _ in range(3)])
+
+    assert mock_request.call_count == 3
@@ -0,0 +1,113 @@
+import httpx
+import pytest
+
+from paddle.client import Client
+from paddle.exceptions import PaddleAPIError
+from paddle.sync import DeltaSync, parse_timestamp
+from paddle.testing import FakePaddleAPI
+from paddle.utils.checkpoints import FileCheckpointStore, MemoryCheckpointStore
+
+
+@pytest.fixture
+def api():
+    api = FakePaddleAPI(seed=1)
+    api.populate(customers=5, products=5)
+    return api
+
+
+@pytest.fixture
+def client(api):
+    client = Client(api_key="fake-key", max_retries=0, transport=api.transport())
+    return client.with_response_mode("raw")
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2024-01-01T00:00:00.5Z") < parse_timestamp("2024-01-01T00:00:00.51Z")
+    assert parse_timestamp("2024-01-01T00:00:00Z").tzinfo is not None
+
+
+def test_ordered_delta_sync_stops_at_checkpoint(client, api):
+    product_ids = sorted(api.entities["products"])
+    sync = DeltaSync(client, per_page=2)
+    emitted = []
+
+    result = sync.run("products", emitted.extend)
+    assert result.upserted == 5
+    assert result.updated_at == api.entities["products"][product_ids[-1]]["updated_at"]
+
+    client.products.update(product_ids[1], name="Renamed")
+    api.reset_stats()
+    emitted.clear()
+
+    result = sync.run("products", emitted.extend)
+
+    # The product at the checkpoint time is emitted again, the last page isn't requested
+    assert [product["id"] for product in emitted] == [product_ids[1], product_ids[-1]]
+    assert api.requests == 2
+    assert result.updated_at == api.entities["products"][product_ids[1]]["updated_at"]
+
+
+def test_unordered_delta_sync_scans_everything(client, api):
+    customer_ids = sorted(api.entities["customers"])
+    sync = DeltaSync(client, MemoryCheckpointStore(), per_page=2)
+    sync.run("customers", lambda customers: None)
+
+    client.customers.update(customer_ids[0], name="Renamed")
+    api.reset_stats()
+    emitted = []
+    sync.run("customers", emitted.extend)
+
+    assert [customer["id"] for customer in emitted] == [customer_ids[0], customer_ids[-1]]
+    assert api.requests == 3
+
+
+def test_price_delta_sync():
+    api = FakePaddleAPI(seed=1)
+    api.populate(products=3, prices_per_product=2)
+    client = Client(api_key="fake-key", max_retries=0, transport=api.transport())
+    price_ids = sorted(api.entities["prices"])
+    sync = DeltaSync(client.with_response_mode("raw"), per_page=2)
+
+    assert sync.run("prices", lambda prices: None).upserted == 6
+
+    client.prices.update(price_ids[0], status="archived")
+    api.reset_stats()
+    emitted = []
+    result = sync.run("prices", emitted.extend)
+
+    # The archived price is listed, and the price at the checkpoint time emitted again
+    assert sorted(price["id"] for price in emitted) == [price_ids[0], price_ids[-1]]
+    assert result.updated_at == api.entities["prices"][price_ids[0]]["updated_at"]
+    assert api.requests == 3
+
+
+def test_delta_sync_resumes_after_error(api, tmp_path):
+    customer_ids = sorted(api.entities["customers"])
+    transport = api.transport()
+    fail_after = {customer_ids[3]}
+
+    def handle(request):
+        if request.url.params.get("after") in fail_after:
+            api.inject(400)
+        return transport.handle_request(request)
+
+    client = Client(api_key="fake-key", max_retries=0, transport=httpx.MockTransport(handle))
+    client = client.with_response_mode("raw")
+    store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    sync = DeltaSync(client, store, per_page=2)
+    emitted = []
+
+    with pytest.raises(PaddleAPIError):
+        sync.run("customers", emitted.extend)
+    assert store.load("customers")["after"] == customer_ids[3]
+
+    fail_after.clear()
+    result = DeltaSync(client, store, per_page=2).run("customers", emitted.extend)
+
+    assert [customer["id"] for customer in emitted] == customer_ids
+    assert result.upserted == 1
+    last_updated_at = api.entities["customers"][customer_ids[-1]]["updated_at"]
+    assert store.load("customers") == {"updated_at": last_updated_at}
+
+    sync.reset("customers")
+    assert store.load("customers") is None
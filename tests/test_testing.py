@@ -0,0 +1,165 @@
+import json
+
+import httpx
+import pytest
+
+from paddle.aio.client import AsyncClient
+from paddle.client import Client
+from paddle.exceptions import PaddleServerError
+from paddle.testing import FakePaddleAPI
+from paddle.utils.retry import RetryPolicy
+
+FAST_RETRIES = RetryPolicy(max_retries=3, base_delay=0.001, max_delay=0.001)
+
+
+@pytest.fixture
+def api():
+    api = FakePaddleAPI(seed=1)
+    api.populate(customers=450, products=5, prices_per_product=2, subscriptions=300)
+    return api
+
+
+def test_pagination(api):
+    client = Client(api_key="fake-key", transport=api.transport())
+
+    customers = list(client.customers.iter_all(per_page=200))
+
+    assert [customer.id for customer in customers] == sorted(api.entities["customers"])
+    assert api.requests == 3
+
+
+def test_filters_order_and_include(api):
+    client = Client(api_key="fake-key", transport=api.transport())
+    product_id = next(iter(api.entities["products"]))
+
+    prices = client.prices.list(
+        product_id=[product_id], include=["product"], order_by="unit_price.amount[DESC]"
+    ).data
+
+    assert len(prices) == 2
+    assert all(price.product.id == product_id for price in prices)
+    amounts = [int(price.unit_price.amount) for price in prices]
+    assert amounts == sorted(amounts, reverse=True)
+
+    subscriptions = client.subscriptions.list(per_page=200).data
+    assert all(
+        len({item.price.unit_price.currency_code for item in subscription.items}) == 1
+        for subscription in subscriptions
+    )
+
+
+def test_create_get_and_update(api):
+    client = Client(api_key="fake-key", transport=api.transport())
+
+    customer = client.customers.create(email="jo@example.com", name="Jo").data
+    client.customers.update(customer.id, name="Joe")
+
+    assert client.customers.get(customer.id).data.name == "Joe"
+    assert customer.id > max(set(api.entities["customers"]) - {customer.id})
+    assert api.responses == {201: 1, 200: 2}
+
+
+def test_lists_active_entities_by_default(api):
+    client = Client(api_key="fake-key", transport=api.transport())
+    product_id = next(iter(api.entities["products"]))
+
+    client.products.update(product_id, status="archived")
+
+    assert product_id not in [product.id for product in client.products.list().data]
+    archived = client.products.list(status=["archived"]).data
+    assert [product.id for product in archived] == [product_id]
+    assert len(client.products.list(status=["active", "archived"]).data) == 5
+
+
+def test_errors():
+    api = FakePaddleAPI()
+
+    status, headers, content = api.dispatch("GET", "/customers/ctm_01", {}, b"", "http://test")
+    assert status == 404
+    assert json.loads(content)["error"]["code"] == "entity_not_found"
+
+    status, _, _ = api.dispatch("GET", "/customers", {"per_page": "500"}, b"", "http://test")
+    assert status == 400
+
+    api.inject(429, retry_after=3)
+    status, headers, _ = api.dispatch("GET", "/customers", {}, b"", "http://test")
+    assert (status, headers["Retry-After"]) == (429, "3")
+
+
+def test_retries_injected_failures(api):
+    client = Client(api_key="fake-key", retry_policy=FAST_RETRIES, transport=api.transport())
+
+    api.inject(503, count=2)
+    assert len(client.products.list().data) == 5
+    assert api.responses == {503: 2, 200: 1}
+
+    api.inject(500, count=4)
+    with pytest.raises(PaddleServerError):
+        client.products.list()
+
+
+def test_paginates_by_other_orders(api):
+    client = Client(api_key="fake-key", transport=api.transport())
+
+    for order_by in ("unit_price.amount[ASC]", "unit_price.amount[DESC]"):
+        paged = [price.id for price in client.prices.iter_all(order_by=order_by, per_page=3)]
+        listed = [price.id for price in client.prices.list(order_by=order_by, per_page=200).data]
+
+        assert paged == listed
+        assert len(set(paged)) == len(api.entities["prices"])
+
+
+def test_random_failures_are_reproducible():
+    def statuses():
+        api = FakePaddleAPI(error_rate=0.2, rate_limit_rate=0.1, seed=7)
+        return [api.dispatch("GET", "/prices", {}, b"", "http://test")[0] for _ in range(200)]
+
+    first = statuses()
+    assert first == statuses()
+
+    def request_ids():
+        api = FakePaddleAPI(seed=7)
+        return [json.loads(api.dispatch("GET", "/prices", {}, b"", "http://test")[2])["meta"]]
+
+    assert request_ids() == request_ids()
+    assert {429, 200} <= set(first)
+    assert set(first) - {200, 429} <= {500, 502, 503}
+
+
+def test_requests_per_second():
+    api = FakePaddleAPI(requests_per_second=5)
+
+    statuses = [api.dispatch("GET", "/prices", {}, b"", "http://test")[0] for _ in range(8)]
+
+    assert statuses[:5] == [200] * 5
+    assert 429 in statuses[5:]
+
+
+@pytest.mark.asyncio
+async def test_async_transport_sharded_scan(api):
+    api.latency = 0.001
+    client = AsyncClient(api_key="fake-key", transport=api.async_transport())
+
+    ids = [
+        subscription["id"]
+        async for subscription in client.with_response_mode("raw").subscriptions.aiter_sharded(
+            shards=4, ordered=True, per_page=50
+        )
+    ]
+
+    assert ids == sorted(api.entities["subscriptions"])
+
+
+@pytest.mark.asyncio
+async def test_asgi_app(api):
+    transport = httpx.ASGITransport(app=api)
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake") as http:
+        response = await http.get("/customers", params={"per_page": 2, "order_by": "id[DESC]"})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [customer["id"] for customer in body["data"]] == sorted(api.entities["customers"])[
+        :-3:-1
+    ]
+    assert body["meta"]["pagination"]["next"].startswith("http://fake/customers?")
+    assert body["meta"]["pagination"]["has_more"]
@@ -2,6 +2,7 @@ import pytest
 
 from paddle.utils import handle_status_code, is_retryable_status_code, get_retry_delay
 from paddle.exceptions import PaddleAPIError
+from paddle.utils.decoders import get_json_decoder
 
 
 def test_handle_status_code():
@@ -42,3 +43,27 @@ def test_get_retry_delay():
     assert get_retry_delay(400) == 1.0
     assert get_retry_delay(400, "10") == 10.0
     assert get_retry_delay(400, "not-a-number") == 1.0
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "auto"])
+def test_get_json_decoder(name):
+    """Test every JSON decoder backend decodes bytes and raises ValueError on bad input."""
+    if name in ("orjson", "msgspec"):
+        pytest.importorskip(name)
+
+    decoder = get_json_decoder(name)
+    assert decoder(b'{"data": [1, 2], "meta": {"request_id": "abc"}}') == {
+        "data": [1, 2],
+        "meta": {"request_id": "abc"},
+    }
+    with pytest.raises(ValueError):
+        decoder(b"invalid json")
+
+
+def test_get_json_decoder_custom_and_unknown():
+    """Test custom decoders are used as is and unknown names are rejected."""
+    custom = lambda content: {"custom": True}  # noqa: E731
+    assert get_json_decoder(custom) is custom
+
+    with pytest.raises(ValueError):
+        get_json_decoder("simplejson")
@@ -0,0 +1,65 @@
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+
+from paddle.client import Client
+from paddle.extensions import Webhooks
+from paddle.utils.cache import ResponseCache
+from paddle.utils.enums import WebhookEvent
+
+SECRET = "pdl_ntfset_secret"
+
+
+def _sign(body):
+    timestamp = int(time.time())
+    digest = hmac.new(SECRET.encode(), f"{timestamp}:{body}".encode(), hashlib.sha256)
+    return f"ts={timestamp};h1={digest.hexdigest()}"
+
+
+def _event(event_type, data):
+    return json.dumps({"event_id": "evt_01", "event_type": event_type, "data": data})
+
+
+def test_verify_signature():
+    body = _event("product.updated", {"id": "pro_01"})
+
+    event = Webhooks().verify_signature(signature=_sign(body), secret=SECRET, request_body=body)
+
+    assert event.event_type == WebhookEvent.PRODUCT_UPDATED
+    assert event.event_id == "evt_01"
+    assert event.data == {"id": "pro_01"}
+
+    with pytest.raises(ValueError):
+        Webhooks().verify_signature(signature=_sign(body), secret="other", request_body=body)
+
+
+def test_invalidate_cache():
+    client = Client(api_key="fake-key", cache=ResponseCache())
+    cache = client.cache
+    cache.set("product", 1, "/products/pro_01")
+    cache.set("other_product", 2, "/products/pro_02")
+    cache.set("customer", 3, "/customers/ctm_01")
+    cache.set("address", 4, "/customers/ctm_01/addresses/add_01")
+
+    body = _event("product.updated", {"id": "pro_01"})
+    event = client.webhooks.verify_signature(
+        signature=_sign(body), secret=SECRET, request_body=body
+    )
+    assert client.webhooks.invalidate_cache(event) == 1
+    assert cache.stats.size == 3
+
+    body = _event("address.updated", {"id": "add_01", "customer_id": "ctm_01"})
+    event = client.webhooks.verify_signature(
+        signature=_sign(body), secret=SECRET, request_body=body
+    )
+    assert client.webhooks.invalidate_cache(event) == 2
+
+    body = _event("transaction.completed", {"id": "txn_01"})
+    event = client.webhooks.verify_signature(
+        signature=_sign(body), secret=SECRET, request_body=body
+    )
+    assert client.webhooks.invalidate_cache(event) == 0
+    assert Webhooks().invalidate_cache(event) == 0